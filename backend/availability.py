@@ -0,0 +1,413 @@
+"""
+자원봉사자 가능 시간과 활동 매칭
+
+가능 시간은 매주 반복되는 요일별 시간 구간(volunteer_slots 테이블)으로 저장합니다.
+    weekday         0=월 ... 6=일 (datetime.weekday()와 같음)
+    start_minute    그날 0시부터의 분 (0~1439)
+    end_minute      끝 분 (start_minute 초과, 1440 = 24:00)
+자정을 넘는 구간은 두 요일로 나누고, 같은 요일의 겹치거나 맞닿은 구간은 하나로 합칩니다.
+신청 시 구간(availability_slots)을 주지 않으면 기존 자유 형식 문자열(availability)에서
+"평일 오전", "월수금 14:00-17:00", "주말" 같은 표현을 해석합니다 (해석하지 못하면 구간 없음).
+
+매칭: 활동 일시(activity_date)부터 duration_minutes 동안을 요일별 구간으로 나눠, 모든 구간을
+가능 시간 안에 포함하고 같은 시/군/구(지역 경로의 2단계까지)에 있는 자원봉사자를 찾습니다.
+자원봉사자의 지역은 신청한 활동의 지역입니다. 같은 이메일로 여러 번 신청했으면 가장 최근
+신청의 가능 시간과 지역을 사용합니다.
+
+VolunteerIndex는 (지역, 요일)별로 서로 다른 구간마다 자원봉사자 id 집합을 보관하므로,
+조회는 구간 수에만 비례하고 자원봉사자 수와는 관계없습니다 (benchmarks/volunteer_matching.py).
+자원봉사자 신청은 추가만 되므로 인덱스는 조회 전에 마지막으로 읽은 id 이후의 행만
+읽어 따라잡습니다 (다른 워커의 신청도 다음 조회에 반영).
+"""
+import bisect
+import logging
+import re
+import threading
+import time
+from datetime import timedelta
+
+from sqlalchemy import or_, select
+from sqlalchemy.exc import SQLAlchemyError
+
+import regions
+from models import Region, Volunteer, VolunteerSlot
+
+logger = logging.getLogger("availability")
+
+MINUTES_PER_DAY = 24 * 60
+DEFAULT_DURATION_MINUTES = 60  # duration_minutes가 없는 활동
+WEEKDAY_NAMES = "월화수목금토일"
+
+# 먼저 읽은 id보다 작은 id가 나중에 커밋될 수 있으므로 (동시 신청) 빈 id를 이 시간 동안 다시 확인
+GAP_RECHECK_SECONDS = 60
+MAX_GAPS = 1000
+
+# ==================== 자유 형식 해석 ====================
+
+_ALL_DAYS = tuple(range(7))
+_DAY_WORDS = {
+    "평일": tuple(range(5)), "주중": tuple(range(5)), "주말": (5, 6),
+    "매일": _ALL_DAYS, "언제나": _ALL_DAYS, "아무때나": _ALL_DAYS, "상관없음": _ALL_DAYS,
+}
+_TIME_WORDS = {
+    "오전": (9 * 60, 12 * 60), "오후": (13 * 60, 18 * 60), "저녁": (18 * 60, 21 * 60),
+    "종일": (0, MINUTES_PER_DAY), "하루종일": (0, MINUTES_PER_DAY),
+}
+_DAY_RANGE = re.compile(r"([월화수목금토일])(?:요일)?\s*[~-]\s*([월화수목금토일])(?:요일)?")
+_DAY_LETTERS = re.compile(r"[월화수목금토일]+(?:요일)?")
+_MERIDIEM = {"오전": False, "오후": True, "저녁": True}  # 시각 앞의 말 → 오후 여부
+_TIME_RANGE = re.compile(
+    r"(?:(오전|오후|저녁)\s*)?(\d{1,2})(?:[:시]\s*(\d{2})?분?)?\s*[~-]\s*"
+    r"(?:(오전|오후|저녁)\s*)?(\d{1,2})(?:[:시]\s*(\d{2})?분?)?"
+)
+_CLAUSE_SEPARATOR = re.compile(r"[,/·;]|그리고")
+
+
+def _minutes(hour, minute, afternoon):
+    hour = int(hour)
+    if afternoon and hour < 12:
+        hour += 12
+    return hour * 60 + int(minute or 0)
+
+
+def _parse_clause(clause):
+    """부분 하나 → (요일 집합, [(시작 분, 끝 분)])"""
+    days, times = set(), []
+    # 시각에 붙지 않은 오전/오후는 부분 전체의 기본값 ("오후에 2시-5시")
+    outside = _TIME_RANGE.sub(" ", clause)
+    default = next((_MERIDIEM[word] for word in _MERIDIEM if word in outside), False)
+    for match in _TIME_RANGE.finditer(clause):
+        start_pm = _MERIDIEM[match.group(1)] if match.group(1) else default
+        end_pm = _MERIDIEM[match.group(4)] if match.group(4) else start_pm
+        start = _minutes(match.group(2), match.group(3), start_pm)
+        end = _minutes(match.group(5), match.group(6), end_pm)
+        if start < MINUTES_PER_DAY and end <= MINUTES_PER_DAY and start != end:
+            times.append((start, end))
+    clause = outside
+
+    for word, word_days in _DAY_WORDS.items():
+        if word in clause:
+            days.update(word_days)
+            clause = clause.replace(word, " ")
+    for word, span in sorted(_TIME_WORDS.items(), key=lambda item: -len(item[0])):
+        if word in clause:
+            if not times:  # 시각이 있으면 오전/오후는 위에서 시각의 오전·오후만 정함
+                times.append(span)
+            clause = clause.replace(word, " ")
+    for match in _DAY_RANGE.finditer(clause):
+        first, last = WEEKDAY_NAMES.index(match.group(1)), WEEKDAY_NAMES.index(match.group(2))
+        days.update(range(first, last + 1) if first <= last else (*range(first, 7), *range(last + 1)))
+    clause = _DAY_RANGE.sub(" ", clause)
+    for token in clause.split():
+        if _DAY_LETTERS.fullmatch(token):
+            days.update(WEEKDAY_NAMES.index(letter) for letter in token.replace("요일", ""))
+    return days, times
+
+
+def parse(text):
+    """
+    자유 형식 가능 시간을 (요일, 시작 분, 끝 분) 목록으로 해석 (normalize 전)
+
+    쉼표 등으로 나눈 각 부분에서 요일(평일/주말/매일, 월수금, 월~금)과
+    시간(오전/오후/저녁/종일, 10:00-16:00, 2시-5시, 오전 10시-오후 3시)을 찾아 조합합니다.
+    시각이 있으면 오전/오후는 시각의 오전·오후만 정합니다.
+    요일만 있으면 하루 종일이고, 시간만 있는 부분은 앞 부분의 요일에 붙습니다
+    ("평일, 오전 10-12"). 요일이 전혀 없으면 매일로 넘겨짚지 않고 해석하지 않습니다.
+    """
+    slots = []
+    days = None  # 마지막으로 나온 요일
+    untimed = None  # 시간 없이 나온 요일 (뒤 부분의 시간을 받거나 하루 종일)
+
+    def emit(slot_days, slot_times):
+        slots.extend((weekday, start, end) for weekday in sorted(slot_days) for start, end in slot_times)
+
+    for clause in _CLAUSE_SEPARATOR.split(text or ""):
+        clause_days, times = _parse_clause(clause)
+        if clause_days:
+            if untimed:
+                emit(untimed, [(0, MINUTES_PER_DAY)])
+            days = clause_days
+            untimed = None if times else clause_days
+            emit(clause_days, times)
+        elif times and days:
+            emit(days, times)
+            untimed = None
+    if untimed:
+        emit(untimed, [(0, MINUTES_PER_DAY)])
+    return slots
+
+
+# ==================== 구간 정규화 ====================
+
+def normalize(slots):
+    """
+    (요일, 시작 분, 끝 분) 목록을 자정 기준으로 나누고 요일별로 합친 정렬된 목록
+
+    끝이 시작 이하면 다음 날로 넘어가는 구간입니다 (22:00-02:00).
+    시작과 끝이 같은 구간은 ValueError입니다.
+    """
+    by_day = {}
+    for weekday, start, end in slots:
+        if not 0 <= weekday <= 6 or not 0 <= start < MINUTES_PER_DAY or not 0 <= end <= MINUTES_PER_DAY:
+            raise ValueError("가능 시간의 요일이나 시각이 범위를 벗어났습니다")
+        if start == end:
+            raise ValueError("가능 시간의 시작과 끝이 같습니다")
+        if end > start:
+            by_day.setdefault(weekday, []).append((start, end))
+        else:
+            by_day.setdefault(weekday, []).append((start, MINUTES_PER_DAY))
+            if end > 0:
+                by_day.setdefault((weekday + 1) % 7, []).append((0, end))
+
+    merged = []
+    for weekday in sorted(by_day):
+        current = None
+        for start, end in sorted(by_day[weekday]):
+            if current is not None and start <= current[1]:
+                current = (current[0], max(current[1], end))
+                continue
+            if current is not None:
+                merged.append((weekday, *current))
+            current = (start, end)
+        merged.append((weekday, *current))
+    return merged
+
+
+def from_times(slots):
+    """스키마의 AvailabilitySlot(weekday, start, end 시각) 목록 → (요일, 시작 분, 끝 분)"""
+    return [
+        (slot.weekday, slot.start.hour * 60 + slot.start.minute,
+         (slot.end.hour * 60 + slot.end.minute) or MINUTES_PER_DAY)
+        for slot in slots
+    ]
+
+
+def describe(slots):
+    """정규화한 구간을 사람이 읽는 문자열로 ("월 09:00-12:00, 수 09:00-12:00")"""
+    def clock(minute):
+        return f"{minute // 60:02d}:{minute % 60:02d}"
+    return ", ".join(
+        f"{WEEKDAY_NAMES[weekday]} {clock(start)}-{clock(end)}" for weekday, start, end in slots
+    )
+
+
+def activity_parts(activity_date, duration_minutes):
+    """활동 시간을 요일별 (요일, 시작 분, 끝 분) 구간으로 (일시가 없으면 빈 목록)"""
+    if activity_date is None:
+        return []
+    start = activity_date.replace(second=0, microsecond=0)
+    end = start + timedelta(minutes=duration_minutes or DEFAULT_DURATION_MINUTES)
+    parts = []
+    while start < end:
+        day_end = (start + timedelta(days=1)).replace(hour=0, minute=0)
+        part_end = min(end, day_end)
+        minute = start.hour * 60 + start.minute
+        parts.append((start.weekday(), minute, minute + int((part_end - start).total_seconds() // 60)))
+        start = part_end
+    return parts
+
+
+def slot_rows(volunteer_id, slots):
+    return [
+        {"volunteer_id": volunteer_id, "weekday": weekday, "start_minute": start, "end_minute": end}
+        for weekday, start, end in slots
+    ]
+
+
+# ==================== 매칭 인덱스 ====================
+
+class _Bucket:
+    """한 (지역, 요일)의 구간 → 자원봉사자 id 집합 (구간은 시작 분 순으로 정렬)"""
+
+    __slots__ = ("spans", "members")
+
+    def __init__(self):
+        self.spans = []  # 정렬된 (start, end)
+        self.members = {}  # (start, end) -> {volunteer_id}
+
+    def add(self, span, volunteer_id):
+        members = self.members.get(span)
+        if members is None:
+            members = self.members[span] = set()
+            bisect.insort(self.spans, span)
+        members.add(volunteer_id)
+
+    def remove(self, span, volunteer_id):
+        members = self.members[span]
+        members.discard(volunteer_id)
+        if not members:
+            del self.members[span]
+            self.spans.remove(span)
+
+    def covering(self, start, end):
+        """start~end를 포함하는 구간의 id 집합들 (시작 분이 start 이하인 구간만 확인)"""
+        last = bisect.bisect_right(self.spans, (start, MINUTES_PER_DAY))
+        return [self.members[span] for span in self.spans[:last] if span[1] >= end]
+
+
+class VolunteerIndex:
+    """
+    이메일별 최근 신청의 가능 시간을 (지역, 요일) 버킷에 보관하는 스레드 안전 인덱스
+
+    DB 조회는 잠금 밖에서 합니다. 비동기 세션의 run_sync 안에서는 쿼리마다 이벤트 루프로
+    제어가 넘어가므로, 잠금을 쥔 채 쿼리하면 같은 스레드의 다른 요청이 잠금을 기다리며 멈춥니다.
+    같은 행을 두 번 반영해도 결과는 같으므로 동시에 따라잡아도 됩니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._clear()
+
+    def _clear(self):
+        self.last_id = 0
+        self.loads = 0  # 따라잡기에서 읽은 자원봉사자 행 수
+        self._gaps = {}  # 건너뛴 id -> 다시 확인할 기한 (time.monotonic())
+        self._entries = {}  # 이메일 -> (volunteer_id, 지역 키, 구간 목록)
+        self._buckets = {}  # (지역 키, 요일) -> _Bucket
+        self._region_keys = {}  # region_id -> 시/군/구 경로
+
+    def region_key(self, conn, region_id):
+        """지역 id의 시/군/구 경로 (처음 보는 id면 regions를 다시 읽음)"""
+        if region_id is None:
+            return None
+        if region_id not in self._region_keys:
+            self._region_keys = {
+                row_id: regions.to_path(path.split(regions.PATH_SEPARATOR)[:regions.LEVEL_SIGUNGU])
+                for row_id, path in conn.execute(select(Region.id, Region.path))
+            }
+        return self._region_keys.get(region_id)
+
+    # ---------- 따라잡기 ----------
+
+    def sync(self, conn):
+        """마지막으로 읽은 id 이후(와 아직 비어 있는 id)의 신청을 반영"""
+        with self._lock:
+            now = time.monotonic()
+            self._gaps = {gap: until for gap, until in self._gaps.items() if until > now}
+            last_id, gaps = self.last_id, sorted(self._gaps)
+
+        condition = Volunteer.id > last_id
+        if gaps:
+            condition = or_(condition, Volunteer.id.in_(gaps))
+        rows = conn.execute(
+            select(
+                Volunteer.id, Volunteer.email, Volunteer.region_id,
+                VolunteerSlot.weekday, VolunteerSlot.start_minute, VolunteerSlot.end_minute,
+            )
+            .outerjoin(VolunteerSlot, VolunteerSlot.volunteer_id == Volunteer.id)
+            .where(condition)
+            .order_by(Volunteer.id)
+        )
+        volunteers = {}
+        for volunteer_id, email, region_id, weekday, start, end in rows:
+            _, _, slots = volunteers.setdefault(volunteer_id, (email, region_id, []))
+            if weekday is not None:
+                slots.append((weekday, start, end))
+        if not volunteers:
+            return
+        region_keys = {
+            region_id: self.region_key(conn, region_id)
+            for _, region_id, _ in volunteers.values()
+        }
+
+        with self._lock:
+            for volunteer_id, (email, region_id, slots) in volunteers.items():
+                self._gaps.pop(volunteer_id, None)
+                self._put(email, volunteer_id, region_keys[region_id], slots)
+            newest = max(volunteers)
+            if newest > self.last_id:
+                # 처음 읽을 때는 삭제 등으로 빈 id가 많을 수 있으므로 이후 따라잡기에서만 기록
+                if self.last_id and newest - self.last_id <= MAX_GAPS:
+                    for missing in range(self.last_id + 1, newest):
+                        if missing not in volunteers:
+                            self._gaps[missing] = now + GAP_RECHECK_SECONDS
+                self.last_id = newest
+            self.loads += len(volunteers)
+
+    def _put(self, email, volunteer_id, region_key, slots):
+        key = email.strip().lower()
+        previous = self._entries.get(key)
+        if previous is not None:
+            if previous[0] > volunteer_id:
+                return  # 늦게 보인 예전 신청
+            old_id, old_region, old_slots = previous
+            for weekday, start, end in old_slots:
+                self._buckets[(old_region, weekday)].remove((start, end), old_id)
+        self._entries[key] = (volunteer_id, region_key, slots)
+        for weekday, start, end in slots:
+            bucket = self._buckets.get((region_key, weekday))
+            if bucket is None:
+                bucket = self._buckets[(region_key, weekday)] = _Bucket()
+            bucket.add((start, end), volunteer_id)
+
+    def reset(self):
+        """다음 조회에서 처음부터 다시 읽음 (DB에서 기존 신청을 직접 고친 경우)"""
+        with self._lock:
+            self._clear()
+
+    # ---------- 조회 ----------
+
+    def _sets(self, region_key, parts):
+        """요일별 구간마다 포함하는 id 집합 목록 (구간 하나라도 후보가 없으면 None)"""
+        found = []
+        for weekday, start, end in parts:
+            bucket = self._buckets.get((region_key, weekday))
+            sets = bucket.covering(start, end) if bucket is not None else []
+            if not sets:
+                return None
+            found.append(sets)
+        return found
+
+    def candidates(self, conn, region_id, activity_date, duration_minutes):
+        """활동 시간 전체가 가능하고 같은 시/군/구인 자원봉사자 id 집합"""
+        parts = activity_parts(activity_date, duration_minutes)
+        if not parts:
+            return set()
+        region_key = self.region_key(conn, region_id)
+        with self._lock:
+            found = self._sets(region_key, parts)
+            if found is None:
+                return set()
+            # 요일별로 합친 구간은 서로 겹치지 않으므로 한 요일 안에서는 집합이 겹치지 않음
+            result = set().union(*found[0])
+            for sets in found[1:]:
+                result &= set().union(*sets)
+            return result
+
+    def count(self, conn, region_id, activity_date, duration_minutes):
+        """candidates의 개수 (하루 안의 활동은 집합을 만들지 않고 크기만 더함)"""
+        parts = activity_parts(activity_date, duration_minutes)
+        if len(parts) != 1:
+            return len(self.candidates(conn, region_id, activity_date, duration_minutes))
+        region_key = self.region_key(conn, region_id)
+        with self._lock:
+            found = self._sets(region_key, parts)
+            return sum(len(members) for members in found[0]) if found else 0
+
+    def volunteer_ids(self, emails):
+        """이메일들의 현재 항목 id 집합 (이미 신청한 사람을 후보에서 뺄 때)"""
+        keys = [email.strip().lower() for email in emails]
+        with self._lock:
+            entries = [self._entries.get(key) for key in keys]
+        return {entry[0] for entry in entries if entry is not None}
+
+    def stats(self):
+        with self._lock:
+            return {
+                "volunteers": len(self._entries),
+                "buckets": len(self._buckets),
+                "spans": sum(len(bucket.spans) for bucket in self._buckets.values()),
+                "last_id": self.last_id,
+                "loaded_rows": self.loads,
+            }
+
+
+index = VolunteerIndex()
+
+
+def warm_up(conn):
+    """앱 시작 시 인덱스를 미리 구성 (마이그레이션 전이라 실패하면 첫 조회에서 다시 시도)"""
+    try:
+        index.sync(conn)
+    except SQLAlchemyError as exc:
+        logger.warning("자원봉사자 매칭 인덱스를 구성하지 못했습니다: %s", exc)
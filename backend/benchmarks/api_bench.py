@@ -0,0 +1,603 @@
+"""
+API 엔드포인트 벤치마크
+
+generate_data.py로 만든 데이터에 대해 main.py의 엔드포인트를 호출하고 엔드포인트별
+처리량(req/s)과 p50/p95/p99 지연을 측정합니다. 결과를 JSON으로 저장해 두면 다음 실행과
+비교해 회귀를 찾을 수 있습니다.
+
+    inproc  같은 프로세스에서 ASGI로 직접 호출 (네트워크/서버 없이 핸들러와 DB 비용만,
+            엔드포인트마다 --requests회). 앱의 모든 라우트를 시나리오와 대조해
+            측정하지 않은 엔드포인트를 알려 줍니다.
+    load    uvicorn 서버(--workers)를 띄우고 클라이언트 프로세스 --processes개가
+            --duration초 동안 조회 위주의 혼합 요청을 보냄
+
+4xx 응답(정원 마감, 이미 취소된 예약 등)은 거절(rejected)로, 5xx와 연결 오류는 오류로 셉니다.
+응답의 X-Query-Count 헤더로 요청당 SQL 문 수도 기록하며, 비교 시 늘어난 시나리오(N+1 회귀)를 함께 알려 줍니다.
+
+사용법:
+    cd backend
+    python benchmarks/api_bench.py --scale 100k --output before.json
+    python benchmarks/api_bench.py --scale 100k --compare before.json
+    python benchmarks/api_bench.py load --scale 100k --processes 4 --workers 2 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+# ==================== 작업 대상 ====================
+
+class Workload:
+    """요청에 넣을 id 후보와 고유 값(이메일 등) 생성기"""
+
+    def __init__(self, conn, seed=0, index=0, processes=1, run_id=None, pool_size=20000):
+        from sqlalchemy import func, select
+
+        from models import Activity, ActivityBooking, Subscription, User
+
+        self.rng = random.Random(seed * 1000 + index)
+        self.run_id = run_id or uuid.uuid4().hex[:8]
+        self.index = index
+        self.serial = 0
+
+        def sample(query):
+            return list(conn.execute(query.order_by(func.random()).limit(pool_size)).scalars())
+
+        now = datetime.utcnow()
+        self.user_ids = sample(select(User.id))
+        self.activity_ids = sample(select(Activity.id).where(Activity.is_past == False))
+        self.open_activity_ids = sample(
+            select(Activity.id).where(
+                Activity.is_past == False, Activity.booking_count < Activity.max_participants
+            )
+        ) or self.activity_ids
+        self.subscriber_ids = sample(
+            select(Subscription.user_id).where(Subscription.is_active == True, Subscription.end_date > now)
+        ) or self.user_ids
+        self.categories = list(conn.execute(select(Activity.category).distinct()).scalars())
+        # 예약 취소는 프로세스마다 겹치지 않는 예약을 한 번씩 사용
+        self.booking_ids = iter(sample(
+            select(ActivityBooking.id).where(ActivityBooking.id % processes == index)
+        ))
+
+    def activity_id(self):
+        return self.rng.choice(self.activity_ids)
+
+    def user_id(self):
+        return self.rng.choice(self.user_ids)
+
+    def unique(self, prefix):
+        self.serial += 1
+        return f"{prefix}-{self.run_id}-{self.index}-{self.serial}"
+
+    def activity_body(self):
+        return {
+            "title": f"벤치마크 활동 {self.serial}",
+            "category": self.rng.choice(self.categories or ["수영"]),
+            "location": self.rng.choice(["서울시 강남구 문화센터", "부산시 해운대구 복지관", "경기도 수원시 주민센터"]),
+            "max_participants": 20,
+            "price": 20000,
+            "activity_date": (datetime.utcnow() + timedelta(days=self.rng.randint(1, 60))).isoformat(),
+        }
+
+
+def _ndjson(rows):
+    return "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode()
+
+
+def _bulk_activities(w):
+    rows = [{**w.activity_body(), "external_id": w.unique("bench-activity")} for _ in range(100)]
+    return {"content": _ndjson(rows), "headers": {"Content-Type": "application/x-ndjson"}}
+
+
+def _bulk_users(w):
+    rows = []
+    for _ in range(100):
+        key = w.unique("bench-user")
+        rows.append({"name": "벤치사용자", "email": f"{key}@example.com", "external_id": key})
+    return {"content": _ndjson(rows), "headers": {"Content-Type": "application/x-ndjson"}}
+
+
+def _bulk_subscriptions(w):
+    rows = [{"user_id": w.user_id(), "plan_type": "monthly"} for _ in range(100)]
+    return {"content": _ndjson(rows), "headers": {"Content-Type": "application/x-ndjson"}}
+
+
+def _cancel_booking(w):
+    booking_id = next(w.booking_ids, 0)  # 후보를 다 쓰면 없는 id로 404(거절)
+    return {"url": f"/api/bookings/{booking_id}"}
+
+
+def _date_range(w):
+    start = datetime.utcnow().date() + timedelta(days=w.rng.randint(0, 30))
+    return f"from={start.isoformat()}&to={(start + timedelta(days=1)).isoformat()}"
+
+
+def _week_range(w):
+    start = datetime.utcnow().date() + timedelta(days=w.rng.randint(0, 60))
+    return f"from={start.isoformat()}&to={(start + timedelta(days=7)).isoformat()}"
+
+
+def _month(w):
+    first = datetime.utcnow().date().replace(day=1) + timedelta(days=32 * w.rng.randint(0, 2))
+    category = f"&category={w.rng.choice(w.categories)}" if w.rng.random() < 0.3 else ""
+    return f"month={first.strftime('%Y-%m')}{category}"
+
+
+class Scenario:
+    """
+    route: 앱 라우트 ("GET /api/activities/{activity_id}") - 측정하지 않은 라우트 확인용
+    build(workload): httpx 요청 인자 (url, json, content, headers)
+    weight: load 모드 혼합 비율 (0이면 제외), share: inproc 모드에서 --requests에 곱할 비율
+    """
+
+    def __init__(self, name, route, build, weight=0, share=1.0):
+        self.name = name
+        self.method, self.path = route.split(" ", 1)
+        self.route = route
+        self.build = build
+        self.weight = weight
+        self.share = share
+
+
+SCENARIOS = [
+    Scenario("list_activities", "GET /api/activities",
+             lambda w: {"url": "/api/activities"}, weight=20),
+    Scenario("list_activities_home", "GET /api/activities",
+             lambda w: {"url": "/api/activities?limit=6&sort=recent&fields=summary"}, weight=10),
+    Scenario("list_activities_category", "GET /api/activities",
+             lambda w: {"url": f"/api/activities?category={w.rng.choice(w.categories)}&sort=activity_date"},
+             weight=10),
+    Scenario("list_activities_region", "GET /api/activities",
+             lambda w: {"url": f"/api/activities?region={w.rng.choice(['서울', '부산 해운대구', '수원시'])}"},
+             weight=5),
+    Scenario("list_activities_near_user", "GET /api/activities",
+             lambda w: {"url": f"/api/activities?near_user_id={w.user_id()}"}, weight=5),
+    Scenario("search_activities", "GET /api/activities",
+             lambda w: {"url": f"/api/activities?q={w.rng.choice(['요가', '수영 교실', '도자기', '합창단'])}"},
+             weight=5),
+    Scenario("list_activities_by_price", "GET /api/activities",
+             lambda w: {"url": "/api/activities?sort=price&include_past=true"}, weight=2),
+    Scenario("list_activities_week", "GET /api/activities",
+             lambda w: {"url": f"/api/activities?{_week_range(w)}&sort=activity_date&fields=summary"},
+             weight=3),
+    Scenario("get_activity", "GET /api/activities/{activity_id}",
+             lambda w: {"url": f"/api/activities/{w.activity_id()}"}, weight=15),
+    Scenario("get_activity_detail", "GET /api/activities/{activity_id}/detail",
+             lambda w: {"url": f"/api/activities/{w.activity_id()}/detail"}, weight=15),
+    Scenario("create_activity", "POST /api/activities",
+             lambda w: {"url": "/api/activities", "json": w.activity_body()}, weight=1),
+    Scenario("update_activity", "PUT /api/activities/{activity_id}",
+             lambda w: {"url": f"/api/activities/{w.activity_id()}",
+                        "json": {"price": float(w.rng.randrange(10000, 50000, 5000))}}, weight=1),
+    Scenario("import_activities", "POST /api/activities/bulk",
+             lambda w: {"url": "/api/activities/bulk", **_bulk_activities(w)}, share=0.1),
+    Scenario("list_categories", "GET /api/categories",
+             lambda w: {"url": "/api/categories"}, weight=5),
+    Scenario("activity_calendar", "GET /api/calendar",
+             lambda w: {"url": f"/api/calendar?{_month(w)}"}, weight=3),
+    Scenario("list_regions", "GET /api/regions",
+             lambda w: {"url": "/api/regions"}, weight=2),
+    Scenario("create_user", "POST /api/users",
+             lambda w: {"url": "/api/users",
+                        "json": {"name": "벤치사용자", "email": f"{w.unique('bench')}@example.com"}},
+             weight=1),
+    Scenario("get_user", "GET /api/users/{user_id}",
+             lambda w: {"url": f"/api/users/{w.user_id()}"}, weight=3),
+    Scenario("import_users", "POST /api/users/bulk",
+             lambda w: {"url": "/api/users/bulk", **_bulk_users(w)}, share=0.1),
+    Scenario("create_subscription", "POST /api/subscriptions",
+             lambda w: {"url": "/api/subscriptions",
+                        "json": {"user_id": w.user_id(), "plan_type": "monthly"}}, weight=1),
+    Scenario("get_user_subscription", "GET /api/users/{user_id}/subscription",
+             lambda w: {"url": f"/api/users/{w.rng.choice(w.subscriber_ids)}/subscription"}, weight=5),
+    Scenario("import_subscriptions", "POST /api/subscriptions/bulk",
+             lambda w: {"url": "/api/subscriptions/bulk", **_bulk_subscriptions(w)}, share=0.1),
+    Scenario("create_booking", "POST /api/bookings",
+             lambda w: {"url": "/api/bookings",
+                        "json": {"user_id": w.rng.choice(w.subscriber_ids),
+                                 "activity_id": w.rng.choice(w.open_activity_ids)}}, weight=5),
+    Scenario("list_activity_bookings", "GET /api/activities/{activity_id}/bookings",
+             lambda w: {"url": f"/api/activities/{w.activity_id()}/bookings?expand=user"}, weight=3),
+    Scenario("list_user_bookings", "GET /api/users/{user_id}/bookings",
+             lambda w: {"url": f"/api/users/{w.rng.choice(w.subscriber_ids)}/bookings?expand=activity"},
+             weight=5),
+    Scenario("cancel_booking", "DELETE /api/bookings/{booking_id}", _cancel_booking, weight=1),
+    Scenario("create_volunteer", "POST /api/volunteers",
+             lambda w: {"url": "/api/volunteers",
+                        "json": {"activity_id": w.activity_id(), "name": "벤치봉사자",
+                                 "email": f"{w.unique('volunteer')}@example.com",
+                                 "availability": "평일 오전"}}, weight=1),
+    Scenario("list_activity_volunteers", "GET /api/activities/{activity_id}/volunteers",
+             lambda w: {"url": f"/api/activities/{w.activity_id()}/volunteers"}, weight=2),
+    Scenario("volunteer_candidates", "GET /api/activities/{activity_id}/volunteer-candidates",
+             lambda w: {"url": f"/api/activities/{w.activity_id()}/volunteer-candidates"}, weight=2),
+    Scenario("unstaffed_activities", "GET /api/reports/unstaffed-activities",
+             lambda w: {"url": "/api/reports/unstaffed-activities"}, weight=1),
+    Scenario("live_stats", "GET /api/live/stats",
+             lambda w: {"url": "/api/live/stats"}, share=0.2),
+    Scenario("export_bookings", "GET /api/exports/bookings",
+             lambda w: {"url": f"/api/exports/bookings?{_date_range(w)}"}, share=0.2),
+    Scenario("export_volunteers", "GET /api/exports/volunteers",
+             lambda w: {"url": f"/api/exports/volunteers?activity_id={w.activity_id()}&format=ndjson"},
+             share=0.2),
+    Scenario("category_stats", "GET /api/stats/categories",
+             lambda w: {"url": "/api/stats/categories"}, weight=1),
+    Scenario("region_stats", "GET /api/stats/regions",
+             lambda w: {"url": "/api/stats/regions"}, weight=1),
+    Scenario("subscription_stats", "GET /api/stats/subscriptions",
+             lambda w: {"url": "/api/stats/subscriptions"}, weight=1),
+    Scenario("scheduler_stats", "GET /api/scheduler/stats",
+             lambda w: {"url": "/api/scheduler/stats"}, share=0.2),
+    Scenario("run_scheduler_job", "POST /api/scheduler/jobs/{job_name}/run",
+             lambda w: {"url": "/api/scheduler/jobs/mark_past_activities/run"}, share=0.1),
+    Scenario("cache_stats", "GET /api/cache/stats",
+             lambda w: {"url": "/api/cache/stats"}, share=0.2),
+    Scenario("metrics", "GET /metrics",
+             lambda w: {"url": "/metrics"}, share=0.2),
+]
+
+# 측정하지 않는 라우트와 이유
+EXCLUDED_ROUTES = {
+    "GET /api/live/booking-counts": "끝나지 않는 SSE 스트림 (benchmarks/live_fanout.py에서 측정)",
+}
+
+
+def uncovered_routes(app):
+    from fastapi.routing import APIRoute
+
+    covered = {scenario.route for scenario in SCENARIOS} | set(EXCLUDED_ROUTES)
+    routes = [
+        f"{method} {route.path}"
+        for route in app.routes if isinstance(route, APIRoute)
+        for method in sorted(route.methods)
+    ]
+    return [route for route in routes if route not in covered]
+
+
+# ==================== 측정 ====================
+
+def summarize(latencies, elapsed, rejected, errors, queries=()):
+    """지연(ms) 목록으로 처리량과 백분위 계산 (nearest-rank), queries는 요청별 SQL 문 수"""
+    latencies = sorted(latencies)
+
+    def percentile(p):
+        if not latencies:
+            return None
+        return round(latencies[min(len(latencies) - 1, max(0, int(len(latencies) * p + 0.5) - 1))], 3)
+
+    return {
+        "requests": len(latencies) + errors,
+        "rejected": rejected,
+        "errors": errors,
+        "rps": round(len(latencies) / elapsed, 1) if elapsed else 0.0,
+        "mean_ms": round(statistics.fmean(latencies), 3) if latencies else None,
+        "p50_ms": percentile(0.50),
+        "p95_ms": percentile(0.95),
+        "p99_ms": percentile(0.99),
+        "queries_per_request": round(statistics.fmean(queries), 2) if queries else None,
+    }
+
+
+async def send(client, scenario, workload):
+    """요청 하나를 보내고 (지연 ms, 결과: ok/rejected/error, SQL 문 수) 반환"""
+    import httpx
+
+    request = scenario.build(workload)
+    started = time.perf_counter()
+    try:
+        response = await client.request(scenario.method, **request)
+    except httpx.HTTPError:
+        return None, "error", None
+    elapsed = (time.perf_counter() - started) * 1000
+    if response.status_code >= 500:
+        return None, "error", None
+    queries = response.headers.get("x-query-count")
+    queries = int(queries) if queries is not None else None
+    return elapsed, "rejected" if response.status_code >= 400 else "ok", queries
+
+
+async def measure(client, scenario, workload, requests, concurrency, warmup):
+    for _ in range(warmup):
+        await send(client, scenario, workload)
+    latencies = []
+    queries = []
+    counts = {"rejected": 0, "error": 0}
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            latency, outcome, query_count = await send(client, scenario, workload)
+            if latency is not None:
+                latencies.append(latency)
+            if query_count is not None:
+                queries.append(query_count)
+            if outcome != "ok":
+                counts[outcome] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return summarize(
+        latencies, time.perf_counter() - started, counts["rejected"], counts["error"], queries
+    )
+
+
+def print_header():
+    print(f"\n{'시나리오':<28} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'거절':>6} {'오류':>6} {'SQL':>6}  (ms)")
+
+
+def print_row(name, r):
+    queries = r.get("queries_per_request")
+    print(f"{name:<28} {r['rps']:>8.1f} {r['p50_ms'] or 0:>8.2f} {r['p95_ms'] or 0:>8.2f} "
+          f"{r['p99_ms'] or 0:>8.2f} {r['rejected']:>6} {r['errors']:>6} "
+          f"{'-' if queries is None else format(queries, '.1f'):>6}")
+
+
+async def run_inproc(args, workload):
+    import httpx
+
+    from main import app
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for scenario in SCENARIOS:
+            if args.only and scenario.name not in args.only:
+                continue
+            requests = max(1, int(args.requests * scenario.share))
+            results[scenario.name] = await measure(
+                client, scenario, workload, requests, args.concurrency, args.warmup
+            )
+            print_row(scenario.name, results[scenario.name])
+    return results, uncovered_routes(app)
+
+
+async def run_client(url, workload, duration, concurrency):
+    """load 모드 클라이언트 프로세스: 가중치대로 시나리오를 골라 duration초 동안 요청"""
+    import httpx
+
+    mix = [scenario for scenario in SCENARIOS if scenario.weight]
+    weights = [scenario.weight for scenario in mix]
+    samples = {scenario.name: [] for scenario in mix}
+    counts = {scenario.name: {"rejected": 0, "error": 0} for scenario in mix}
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker():
+            while time.perf_counter() < deadline:
+                scenario = workload.rng.choices(mix, weights)[0]
+                latency, outcome, _ = await send(client, scenario, workload)
+                if latency is not None:
+                    samples[scenario.name].append(latency)
+                if outcome != "ok":
+                    counts[scenario.name][outcome] += 1
+
+        await asyncio.gather(*[worker() for _ in range(concurrency)])
+    return {"samples": samples, "counts": counts}
+
+
+# ==================== load 모드 ====================
+
+def start_server(workdir, port, workers):
+    import httpx
+
+    env = dict(os.environ, PYTHONPATH=BACKEND_DIR)
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=workdir, env=env, stderr=subprocess.DEVNULL,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/cache/stats", timeout=1)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError("서버가 시작되지 않았습니다")
+
+
+def run_load(args, workdir, run_id):
+    server = start_server(workdir, args.port, args.workers)
+    try:
+        clients = [
+            subprocess.Popen(
+                [sys.executable, os.path.abspath(__file__), "client",
+                 "--url", f"http://127.0.0.1:{args.port}", "--duration", str(args.duration),
+                 "--concurrency", str(args.concurrency), "--index", str(index),
+                 "--processes", str(args.processes), "--seed", str(args.seed), "--run-id", run_id],
+                cwd=workdir, stdout=subprocess.PIPE, text=True,
+            )
+            for index in range(args.processes)
+        ]
+        outputs = [json.loads(client.communicate()[0].strip().splitlines()[-1]) for client in clients]
+    finally:
+        server.terminate()
+        server.wait()
+
+    results = {}
+    for scenario in SCENARIOS:
+        if not scenario.weight:
+            continue
+        latencies = [x for output in outputs for x in output["samples"][scenario.name]]
+        rejected = sum(output["counts"][scenario.name]["rejected"] for output in outputs)
+        errors = sum(output["counts"][scenario.name]["error"] for output in outputs)
+        results[scenario.name] = summarize(latencies, args.duration, rejected, errors)
+    all_latencies = [x for output in outputs for values in output["samples"].values() for x in values]
+    results["total"] = summarize(
+        all_latencies, args.duration,
+        sum(r["rejected"] for r in results.values()), sum(r["errors"] for r in results.values()),
+    )
+    return results
+
+
+# ==================== 결과 비교 ====================
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=BACKEND_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(baseline, current, threshold, min_delta_ms):
+    """
+    p95가 threshold 비율과 min_delta_ms를 모두 넘게 늘어났거나 요청당 SQL 문 수가
+    평균 1개 이상 늘어난(N+1 등) 시나리오 목록
+    """
+    regressions = []
+    print(f"\n{'시나리오':<28} {'기준 p95':>9} {'현재 p95':>9} {'변화':>8} {'기준 SQL':>9} {'현재 SQL':>9}")
+    for name, r in current["results"].items():
+        base = baseline["results"].get(name)
+        if not base or base.get("p95_ms") is None or r.get("p95_ms") is None:
+            continue
+        delta = r["p95_ms"] - base["p95_ms"]
+        ratio = delta / base["p95_ms"] if base["p95_ms"] else 0.0
+        reasons = []
+        if ratio > threshold and delta > min_delta_ms:
+            reasons.append("p95")
+        base_queries = base.get("queries_per_request")
+        queries = r.get("queries_per_request")
+        if base_queries is not None and queries is not None and queries - base_queries >= 1:
+            reasons.append("SQL 수")
+        if reasons:
+            regressions.append(name)
+        print(f"{name:<28} {base['p95_ms']:>9.2f} {r['p95_ms']:>9.2f} {ratio:>+7.0%} "
+              f"{'-' if base_queries is None else format(base_queries, '.1f'):>9} "
+              f"{'-' if queries is None else format(queries, '.1f'):>9}"
+              f"{'  ← 회귀 (' + ', '.join(reasons) + ')' if reasons else ''}")
+    return regressions
+
+
+# ==================== 실행 ====================
+
+def prepare_data(args):
+    """작업 디렉터리에 스키마를 적용하고 (--no-generate가 아니면) 데이터 생성"""
+    import generate_data
+    import migrations
+    from database import engine
+
+    migrations.upgrade()
+    if args.no_generate:
+        return None
+    users = args.users if args.users is not None else generate_data.SCALES[args.scale]
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        counts = generate_data.generate(conn, users, seed=args.seed)
+    print(f"데이터 생성 {time.perf_counter() - started:.1f}초: "
+          + ", ".join(f"{name} {count:,}" for name, count in counts.items()))
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="API 엔드포인트 벤치마크")
+    parser.add_argument("mode", nargs="?", choices=["inproc", "load", "client"], default="inproc")
+    parser.add_argument("--scale", choices=["1k", "100k", "1m"], default="1k")
+    parser.add_argument("--users", type=int, help="사용자 수 (--scale 대신 직접 지정)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workdir", help="SQLite 파일을 둘 디렉터리 (기본: 새 임시 디렉터리)")
+    parser.add_argument("--no-generate", action="store_true", help="--workdir의 기존 데이터 사용")
+    parser.add_argument("--requests", type=int, default=200, help="inproc: 엔드포인트별 요청 수")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--concurrency", type=int, default=1, help="inproc: 동시 요청, load: 프로세스별 연결 수")
+    parser.add_argument("--only", nargs="+", help="inproc: 측정할 시나리오 이름")
+    parser.add_argument("--processes", type=int, default=2, help="load: 클라이언트 프로세스 수")
+    parser.add_argument("--workers", type=int, default=1, help="load: uvicorn 워커 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="load: 측정 시간(초)")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 이전 결과 JSON (p95/SQL 수 회귀가 있으면 종료 코드 1)")
+    parser.add_argument("--threshold", type=float, default=0.2, help="회귀로 볼 p95 증가 비율")
+    parser.add_argument("--min-delta-ms", type=float, default=0.5, help="회귀로 볼 최소 p95 증가(ms)")
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    parser.add_argument("--index", type=int, default=0, help=argparse.SUPPRESS)
+    parser.add_argument("--run-id", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    # 상대 경로 인자는 작업 디렉터리로 옮기기 전에 절대 경로로
+    output = os.path.abspath(args.output) if args.output else None
+    baseline_path = os.path.abspath(args.compare) if args.compare else None
+
+    if args.mode == "client":
+        from database import engine
+        with engine.connect() as conn:
+            workload = Workload(conn, args.seed, args.index, args.processes, args.run_id)
+        print(json.dumps(asyncio.run(run_client(args.url, workload, args.duration, args.concurrency))))
+        return
+
+    workdir = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix="api_bench_")
+    os.makedirs(workdir, exist_ok=True)
+    os.chdir(workdir)
+    # 백그라운드 작업이 측정 중에 끼어들지 않도록 (load 모드 서버에도 전달됨)
+    os.environ.setdefault("SCHEDULER_ENABLED", "false")
+    dataset = prepare_data(args)
+    run_id = uuid.uuid4().hex[:8]
+
+    from database import engine
+
+    uncovered = []
+    if args.mode == "inproc":
+        with engine.connect() as conn:
+            workload = Workload(conn, args.seed, run_id=run_id)
+        print_header()
+        results, uncovered = asyncio.run(run_inproc(args, workload))
+        for route in uncovered:
+            print(f"⚠️  측정하지 않은 엔드포인트: {route}")
+    else:
+        results = run_load(args, workdir, run_id)
+        print_header()
+        for name, r in results.items():
+            print_row(name, r)
+
+    report = {
+        "mode": args.mode,
+        "created_at": datetime.utcnow().isoformat(timespec="seconds"),
+        "git_commit": git_commit(),
+        "python": platform.python_version(),
+        "database": engine.dialect.name,
+        "dataset": dataset,
+        "options": {
+            name: getattr(args, name)
+            for name in ("scale", "users", "seed", "requests", "warmup", "concurrency",
+                         "processes", "workers", "duration")
+        },
+        "results": results,
+        "uncovered": uncovered,
+    }
+    if output:
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {output}")
+
+    if baseline_path:
+        with open(baseline_path, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(baseline, report, args.threshold, args.min_delta_ms)
+        if regressions:
+            print(f"\n❌ 회귀 {len(regressions)}건: {', '.join(regressions)}")
+            sys.exit(1)
+        print("\n✅ 회귀 없음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""
+동기/비동기 요청 처리 부하 비교
+
+같은 데이터베이스에 대해 두 가지 서버를 각각 별도 프로세스로 띄우고
+동시 접속 수를 늘려 가며 처리량과 지연 시간을 비교합니다.
+
+    sync   기존 방식: def 핸들러 + 동기 SessionLocal (스레드풀 40개에서 실행)
+    async  현재 방식: async def 핸들러 + aiosqlite AsyncSession (main.app)
+
+두 서버 모두 같은 조회 함수(query_activities, activity_bookings_page 등)와
+ETag 계산을 사용하고 응답 캐시는 끈 상태로 측정합니다.
+
+사용법:
+    cd backend
+    python benchmarks/async_load.py --concurrency 10 100 400 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# ==================== 서버 ====================
+
+def build_sync_app():
+    """변경 전과 같은 동기 핸들러로 구성한 비교용 앱 (부하 대상 엔드포인트만)"""
+    from typing import Optional
+
+    from fastapi import Depends, FastAPI, HTTPException, Request
+
+    import etags
+    import fastjson
+    import main
+    from cache import response_cache, LIST_TTL
+    from database import SessionLocal
+    from models import Activity
+    from schemas import ActivityDetailBundle, ActivityPage
+
+    app = FastAPI()
+
+    def get_db():
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    @app.get("/api/activities", response_model=ActivityPage)
+    def get_activities(request: Request, q: Optional[str] = None, limit: int = 20,
+                       db=Depends(get_db)):
+        cached = response_cache.lookup(request)
+        page = main.query_activities(
+            db, None, None, None, None, q, None, include_past=False, limit=limit, cursor=None
+        )
+        response = cached.store_body(fastjson.dumps(page), [], LIST_TTL)
+        validator = etags.for_body(request, response.body)
+        return validator.apply(response)
+
+    @app.get("/api/activities/{activity_id}/detail", response_model=ActivityDetailBundle)
+    def get_activity_detail(activity_id: int, request: Request, db=Depends(get_db)):
+        validator = etags.check(
+            db.connection(), request,
+            etags.activity_key(activity_id),
+            etags.activity_bookings_key(activity_id),
+            etags.activity_volunteers_key(activity_id),
+        )
+        activity = db.get(Activity, activity_id)
+        if not activity:
+            raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
+        return validator.apply(fastjson.response({
+            "activity": main.ACTIVITY_ROWS.from_object(activity),
+            "bookings": main.activity_bookings_page(db, activity_id, 20),
+            "volunteers": main.activity_volunteers_page(db, activity_id, 20),
+        }))
+
+    return app
+
+
+def serve(mode, port):
+    import uvicorn
+
+    if mode == "sync":
+        app = build_sync_app()
+    else:
+        from main import app
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning")
+
+
+def start_server(mode, port, workdir, extra_env=None):
+    env = dict(os.environ, RESPONSE_CACHE_URL="off", **(extra_env or {}))
+    process = subprocess.Popen(
+        [sys.executable, os.path.abspath(__file__), "serve", "--mode", mode, "--port", str(port)],
+        cwd=workdir, env=env, stderr=subprocess.DEVNULL,
+    )
+    import httpx
+
+    deadline = time.time() + 30
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{port}/api/activities?limit=1", timeout=1)
+            return process
+        except httpx.HTTPError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"{mode} 서버가 시작되지 않았습니다")
+
+
+# ==================== 데이터 ====================
+
+def seed(activity_count, user_count):
+    """활동, 사용자, 예약, 자원봉사자 생성"""
+    import migrations
+    import search
+    from database import SessionLocal
+    from models import Activity, ActivityBooking, User, Volunteer
+
+    migrations.upgrade()
+    rng = random.Random(7)
+    now = datetime.utcnow()
+    db = SessionLocal()
+    db.execute(Activity.__table__.insert(), [
+        {
+            "title": f"{rng.choice(['도예', '수영', '요가', '합창', '서예'])} 클래스 {i}",
+            "description": "초보자도 환영하는 시니어 체험 프로그램입니다.",
+            "category": rng.choice(["도예/공예", "수영", "요가/필라테스", "음악/악기"]),
+            "location": f"서울시 {rng.choice(['강남구', '마포구', '송파구'])} 문화센터",
+            "max_participants": 30,
+            "price": float(rng.randrange(10000, 50000, 5000)),
+            "created_at": now - timedelta(minutes=i),
+            "activity_date": now + timedelta(days=rng.randint(1, 60)),
+            "booking_count": 0,
+            "volunteer_count": 0,
+        }
+        for i in range(activity_count)
+    ])
+    db.execute(User.__table__.insert(), [
+        {"name": f"사용자{i}", "email": f"load{i}@example.com", "created_at": now}
+        for i in range(user_count)
+    ])
+    bookings = {}
+    for activity_id in range(1, activity_count + 1):
+        for user_id in rng.sample(range(1, user_count + 1), rng.randint(0, 10)):
+            bookings[(user_id, activity_id)] = {
+                "user_id": user_id, "activity_id": activity_id,
+                "booking_date": now,
+            }
+    db.execute(ActivityBooking.__table__.insert(), list(bookings.values()))
+    db.execute(Volunteer.__table__.insert(), [
+        {"activity_id": rng.randint(1, activity_count), "name": f"봉사자{i}",
+         "email": f"v{i}@example.com", "created_at": now}
+        for i in range(activity_count // 2)
+    ])
+    search.rebuild(db.connection())
+    db.commit()
+    db.close()
+
+
+# ==================== 부하 ====================
+
+def request_paths(activity_count, rng):
+    while True:
+        kind = rng.random()
+        if kind < 0.4:
+            yield f"/api/activities/{rng.randint(1, activity_count)}/detail"
+        elif kind < 0.8:
+            yield "/api/activities?limit=20"
+        else:
+            yield f"/api/activities?q={rng.choice(['도예', '수영 클래스', '합창'])}&limit=20"
+
+
+async def run_load(base_url, concurrency, duration, activity_count):
+    import httpx
+
+    latencies = []
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+
+        async def worker(seed_value):
+            nonlocal errors
+            paths = request_paths(activity_count, random.Random(seed_value))
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                try:
+                    response = await client.get(next(paths))
+                    if response.status_code != 200:
+                        errors += 1
+                        continue
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*[worker(i) for i in range(concurrency)])
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+
+    def percentile(p):
+        return latencies[min(len(latencies) - 1, int(len(latencies) * p))] if latencies else 0.0
+
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "p95": percentile(0.95),
+        "p99": percentile(0.99),
+        "errors": errors,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동기/비동기 요청 처리 부하 비교")
+    sub = parser.add_subparsers(dest="command")
+    serve_parser = sub.add_parser("serve")
+    serve_parser.add_argument("--mode", choices=["sync", "async"], required=True)
+    serve_parser.add_argument("--port", type=int, required=True)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[10, 100, 400])
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--activities", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    if args.command == "serve":
+        serve(args.mode, args.port)
+        return
+
+    workdir = tempfile.mkdtemp(prefix="async_load_")
+    os.chdir(workdir)
+    seed(args.activities, args.users)
+    print(f"활동 {args.activities:,}개, 사용자 {args.users:,}명 생성 ({workdir})\n")
+
+    results = {}
+    for mode in ("sync", "async"):
+        process = start_server(mode, args.port, workdir)
+        try:
+            for concurrency in args.concurrency:
+                results[(mode, concurrency)] = asyncio.run(run_load(
+                    f"http://127.0.0.1:{args.port}", concurrency, args.duration, args.activities
+                ))
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f"{'동시 접속':>8} {'방식':>6} {'req/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'오류':>6}  (ms)")
+    for concurrency in args.concurrency:
+        for mode in ("sync", "async"):
+            r = results[(mode, concurrency)]
+            print(f"{concurrency:>8} {mode:>6} {r['rps']:>8.0f} {r['p50']:>8.1f} "
+                  f"{r['p95']:>8.1f} {r['p99']:>8.1f} {r['errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+자유 형식 가능 시간 해석 확인 (availability.parse)
+
+자원봉사 신청의 availability 문자열을 요일별 구간으로 해석한 결과가 기대와 같은지 확인하고
+(다르면 종료 코드 1), 생성 데이터의 표현을 반복 해석하는 시간을 출력합니다.
+시각이 있는 부분에 오전/오후 구간이 덧붙거나, 요일 없이 시간만 있는 표현이 매일로 넘겨짚어지면
+후보 매칭(/volunteer-candidates, 미배정 활동 보고서)이 실제로는 안 되는 자원봉사자를 고릅니다.
+
+사용법:
+    cd backend
+    python benchmarks/availability_parse.py --repeat 10000
+"""
+import argparse
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+WEEKDAYS = range(5)
+WEEKEND = (5, 6)
+ALL_DAYS = range(7)
+
+
+def slots(days, *spans):
+    """요일 목록과 "HH:MM-HH:MM" 구간들 → 정규화한 구간"""
+    def minute(clock):
+        hour, minute = clock.split(":")
+        return int(hour) * 60 + int(minute)
+    return sorted(
+        (day, minute(span.split("-")[0]), minute(span.split("-")[1]))
+        for day in days for span in spans
+    )
+
+
+CASES = [
+    ("평일 오전", slots(WEEKDAYS, "09:00-12:00")),
+    ("평일 오후", slots(WEEKDAYS, "13:00-18:00")),
+    ("평일 저녁", slots(WEEKDAYS, "18:00-21:00")),
+    ("주말", slots(WEEKEND, "00:00-24:00")),
+    ("언제나", slots(ALL_DAYS, "00:00-24:00")),
+    ("주말 종일", slots(WEEKEND, "00:00-24:00")),
+    ("월수금 오전", slots((0, 2, 4), "09:00-12:00")),
+    ("화목 13:00-17:00", slots((1, 3), "13:00-17:00")),
+    ("토 10:00-16:00", slots((5,), "10:00-16:00")),
+    ("월~금 9시-17시", slots(WEEKDAYS, "09:00-17:00")),
+    ("금-월 10:00-12:00", slots((4, 5, 6, 0), "10:00-12:00")),
+    # 시각이 있으면 오전/오후 구간을 덧붙이지 않고 시각의 오전·오후만 정함
+    ("평일 오전 10시-12시", slots(WEEKDAYS, "10:00-12:00")),
+    ("평일 오후 2시-5시", slots(WEEKDAYS, "14:00-17:00")),
+    ("월수 오후에 2-4시", slots((0, 2), "14:00-16:00")),
+    ("토 오전 10시-오후 3시", slots((5,), "10:00-15:00")),
+    ("일요일 종일 10:00-11:00", slots((6,), "10:00-11:00")),
+    ("평일 오전 10시-12시, 오후 2시-5시", slots(WEEKDAYS, "10:00-12:00", "14:00-17:00")),
+    # 시간만 있는 부분은 앞 부분의 요일에 붙음
+    ("평일, 오전 10-12", slots(WEEKDAYS, "10:00-12:00")),
+    ("주말 / 오후", slots(WEEKEND, "13:00-18:00")),
+    ("평일 오전, 주말", slots(WEEKDAYS, "09:00-12:00") + slots(WEEKEND, "00:00-24:00")),
+    ("토, 일 10:00-12:00", slots((5,), "00:00-24:00") + slots((6,), "10:00-12:00")),
+    # 요일이 없으면 매일로 넘겨짚지 않음
+    ("오전 10:00-11:00", []),
+    ("오전", []),
+    ("오후 2시-5시", []),
+    ("아무말", []),
+    ("", []),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자유 형식 가능 시간 해석 확인")
+    parser.add_argument("--repeat", type=int, default=10000, help="시간 측정용 반복 해석 횟수")
+    args = parser.parse_args()
+
+    import availability
+    from generate_data import AVAILABILITIES
+
+    failed = 0
+    for text, expected in CASES:
+        got = availability.normalize(availability.parse(text))
+        if got != sorted(expected):
+            failed += 1
+            print(f"불일치: {text!r}")
+            print(f"  기대: {availability.describe(sorted(expected)) or '(없음)'}")
+            print(f"  결과: {availability.describe(got) or '(없음)'}")
+    print(f"해석 확인 {len(CASES) - failed}/{len(CASES)}개 일치")
+
+    texts = [text for text, _ in AVAILABILITIES]
+    started = time.perf_counter()
+    for i in range(args.repeat):
+        availability.normalize(availability.parse(texts[i % len(texts)]))
+    elapsed = time.perf_counter() - started
+    print(f"해석 {args.repeat:,}회: {elapsed * 1000:.1f}ms ({elapsed / args.repeat * 1e6:.1f}µs/건)")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+예약 생성 지연 측정
+
+사용자 N명이 각자 활동 하나씩 예약하는 요청을 순서대로 보내고, 예약 한 건의
+지연 분포와 실행된 SQL 문 수를 비교합니다.
+
+    cold    구독 자격 캐시 사용 안 함 (ENTITLEMENT_CACHE_TTL=0, 검증 쿼리에 구독 조인 포함)
+    cached  구독 자격 캐시 사용 (사용자마다 미리 구독을 한 번 조회해 둔 상태)
+
+사용법:
+    cd backend
+    python benchmarks/booking_latency.py --users 500
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+os.environ["RESPONSE_CACHE_URL"] = "off"
+
+
+def run_one(mode, users):
+    os.chdir(tempfile.mkdtemp(prefix=f"booking_{mode}_"))
+    os.environ["ENTITLEMENT_CACHE_TTL"] = "0" if mode == "cold" else "600"
+
+    import migrations
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    from database import async_engine
+    from main import app
+
+    migrations.upgrade()
+    statements = []
+    event.listen(async_engine.sync_engine, "before_cursor_execute",
+                 lambda *args: statements.append(1))
+
+    latencies = []
+    with TestClient(app) as client:
+        for i in range(20):
+            client.post("/api/activities", json={
+                "title": f"수영 교실 {i}", "category": "수영", "location": "서울시 강남구",
+                "max_participants": users,  # 기본 정원(20)이면 사용자가 많을 때 마감 거절이 섞임
+            })
+        for i in range(users):
+            client.post("/api/users", json={"name": f"사용자{i}", "email": f"b{i}@example.com"})
+            client.post("/api/subscriptions", json={"user_id": i + 1, "plan_type": "monthly"})
+            client.get(f"/api/users/{i + 1}/subscription")
+        statements.clear()
+        for i in range(users):
+            started = time.perf_counter()
+            response = client.post("/api/bookings", json={"user_id": i + 1, "activity_id": i % 20 + 1})
+            latencies.append(time.perf_counter() - started)
+            assert response.status_code == 200, response.text
+    latencies.sort()
+    print(json.dumps({
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "statements": len(statements) / users,
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 생성 지연 측정")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_one(args.run, args.users)
+        return
+
+    print(f"{'모드':>8} {'p50(ms)':>9} {'p95(ms)':>9} {'예약당 SQL 문':>13}")
+    for mode in ("cold", "cached"):
+        # 설정은 import 시점에 읽으므로 모드마다 새 프로세스에서 실행
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run", mode, "--users", str(args.users)],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(f"{mode:>8} {r['p50'] * 1000:>9.2f} {r['p95'] * 1000:>9.2f} {r['statements']:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+동시 예약 폭주 검증 스크립트
+
+정원이 K명인 활동에 N명의 사용자가 동시에 예약을 요청했을 때
+정확히 K건만 성공하고 초과 예약이나 중복 예약이 생기지 않는지 확인합니다.
+임시 디렉토리에 새 데이터베이스를 만들어 실제 HTTP 서버로 요청을 보냅니다.
+
+사용법:
+    cd backend
+    python benchmarks/booking_rush.py --clients 200 --seats 15
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def post_booking(base_url, payload, barrier):
+    """예약 요청 1건 전송 후 상태 코드 반환"""
+    request = urllib.request.Request(
+        f"{base_url}/api/bookings",
+        data=json.dumps(payload).encode(),
+        headers={"Content-Type": "application/json"},
+        method="POST",
+    )
+    barrier.wait()
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return response.status
+    except urllib.error.HTTPError as e:
+        return e.code
+
+
+def seed(clients, seats):
+    """N명의 구독 사용자와 정원 K명인 활동 1개 생성"""
+    from database import SessionLocal
+    from models import Activity, User, Subscription
+
+    db = SessionLocal()
+    try:
+        activity = Activity(
+            title="도예 클래스",
+            category="도예/공예",
+            location="서울시 강남구",
+            max_participants=seats,
+            activity_date=datetime.utcnow() + timedelta(days=7),
+        )
+        db.add(activity)
+        users = [
+            User(name=f"사용자{i}", email=f"rush{i}@example.com")
+            for i in range(clients)
+        ]
+        db.add_all(users)
+        db.flush()
+        db.add_all([
+            Subscription(user_id=user.id, plan_type="monthly")
+            for user in users
+        ])
+        db.commit()
+        return activity.id, [user.id for user in users]
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="동시 예약 폭주 검증")
+    parser.add_argument("--clients", type=int, default=200, help="동시 예약 사용자 수 (N)")
+    parser.add_argument("--seats", type=int, default=15, help="활동 정원 (K)")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="booking_rush_")
+    os.chdir(workdir)
+    sys.path.insert(0, BACKEND_DIR)
+
+    import uvicorn
+    import migrations
+    from main import app
+    from database import SessionLocal
+    from models import Activity, ActivityBooking
+
+    migrations.upgrade()
+    activity_id, user_ids = seed(args.clients, args.seats)
+
+    server = uvicorn.Server(uvicorn.Config(app, port=args.port, log_level="warning"))
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+
+    # 절반의 사용자는 같은 예약을 두 번 보내 중복 방지도 함께 확인
+    payloads = [{"user_id": uid, "activity_id": activity_id} for uid in user_ids]
+    payloads += payloads[: len(payloads) // 2]
+    barrier = threading.Barrier(len(payloads))
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(payloads)) as pool:
+        statuses = list(pool.map(lambda p: post_booking(base_url, p, barrier), payloads))
+    elapsed = time.perf_counter() - started
+
+    server.should_exit = True
+    thread.join()
+
+    db = SessionLocal()
+    try:
+        rows = db.query(ActivityBooking).filter(
+            ActivityBooking.activity_id == activity_id
+        ).count()
+        distinct_users = db.query(ActivityBooking.user_id).filter(
+            ActivityBooking.activity_id == activity_id
+        ).distinct().count()
+        counter = db.query(Activity.booking_count).filter(
+            Activity.id == activity_id
+        ).scalar()
+    finally:
+        db.close()
+
+    succeeded = statuses.count(200)
+    summary = {
+        "requests": len(payloads),
+        "seats": args.seats,
+        "succeeded": succeeded,
+        "rejected": statuses.count(400),
+        "errors": len(payloads) - succeeded - statuses.count(400),
+        "booking_rows": rows,
+        "booking_count": counter,
+        "elapsed_sec": round(elapsed, 3),
+    }
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+    expected = min(args.seats, args.clients)
+    ok = succeeded == rows == distinct_users == counter == expected
+    print("✅ 통과" if ok else "❌ 실패")
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""
+읽기/쓰기 경합 비교 (저장소 프로필)
+
+같은 데이터로 두 가지 설정의 서버를 띄우고, 조회 요청과 쓰기 요청을 동시에
+보내면서 조회 지연 시간과 쓰기 처리량을 비교합니다.
+
+    legacy  변경 전 SQLite 기본값: rollback journal(DELETE), synchronous=FULL,
+            작은 페이지 캐시, mmap 없음, 지연(DEFERRED) 트랜잭션,
+            조회와 쓰기가 한 풀을 공유
+    tuned   현재 기본값 (config.py): WAL, synchronous=NORMAL, busy_timeout,
+            64MB 캐시, mmap, 쓰기는 BEGIN IMMEDIATE, GET 요청용 조회 전용 풀
+
+조회 작업은 활동 목록/상세를, 쓰기 작업은 자원봉사자 등록(카운터 갱신 +
+버전 증가)을 반복합니다. 응답 캐시는 끈 상태로 측정합니다.
+
+사용법:
+    cd backend
+    python benchmarks/contention.py --readers 50 --writers 10 --duration 10
+"""
+import argparse
+import asyncio
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from async_load import seed, start_server  # noqa: E402
+
+PROFILES = {
+    "legacy": {
+        "SQLITE_JOURNAL_MODE": "delete",
+        "SQLITE_SYNCHRONOUS": "full",
+        "SQLITE_CACHE_SIZE": "-2000",
+        "SQLITE_MMAP_SIZE": "0",
+        "SQLITE_BEGIN_IMMEDIATE": "false",
+        "READ_POOL_ENABLED": "false",
+    },
+    "tuned": {},
+}
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+
+
+async def run_mixed(base_url, readers, writers, duration, activity_count):
+    import httpx
+
+    read_latencies = []
+    write_latencies = []
+    errors = {"read": 0, "write": 0}
+    limits = httpx.Limits(max_connections=readers + writers)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+
+        async def reader(seed_value):
+            rng = random.Random(seed_value)
+            while time.perf_counter() < deadline:
+                if rng.random() < 0.5:
+                    path = f"/api/activities/{rng.randint(1, activity_count)}/detail"
+                else:
+                    path = "/api/activities?limit=20"
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    read_latencies.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors["read"] += 1
+
+        async def writer(seed_value):
+            rng = random.Random(seed_value)
+            count = 0
+            while time.perf_counter() < deadline:
+                count += 1
+                body = {
+                    "activity_id": rng.randint(1, activity_count),
+                    "name": "부하 봉사자",
+                    "email": f"w{seed_value}-{count}@example.com",
+                }
+                started = time.perf_counter()
+                try:
+                    response = await client.post("/api/volunteers", json=body)
+                    ok = response.status_code == 200
+                except httpx.HTTPError:
+                    ok = False
+                if ok:
+                    write_latencies.append((time.perf_counter() - started) * 1000)
+                else:
+                    errors["write"] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *[reader(i) for i in range(readers)],
+            *[writer(10_000 + i) for i in range(writers)],
+        )
+        elapsed = time.perf_counter() - started
+
+    read_latencies.sort()
+    write_latencies.sort()
+    return {
+        "read_rps": len(read_latencies) / elapsed,
+        "read_p50": percentile(read_latencies, 0.50),
+        "read_p95": percentile(read_latencies, 0.95),
+        "read_p99": percentile(read_latencies, 0.99),
+        "write_rps": len(write_latencies) / elapsed,
+        "write_p95": percentile(write_latencies, 0.95),
+        "read_errors": errors["read"],
+        "write_errors": errors["write"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="읽기/쓰기 경합 비교 (저장소 프로필)")
+    parser.add_argument("--readers", type=int, default=50)
+    parser.add_argument("--writers", type=int, default=10)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--activities", type=int, default=5000)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    seed_dir = tempfile.mkdtemp(prefix="contention_")
+    os.chdir(seed_dir)
+    seed(args.activities, args.users)
+    from database import engine
+
+    engine.dispose()  # 마지막 연결이 닫히면서 WAL이 체크포인트됨
+    print(f"활동 {args.activities:,}개, 사용자 {args.users:,}명 생성 ({seed_dir})")
+    print(f"조회 {args.readers}개, 쓰기 {args.writers}개 작업 동시 실행, {args.duration:.0f}초\n")
+
+    results = {}
+    for name, profile in PROFILES.items():
+        # 프로필마다 같은 시드 DB를 복사해 사용 (journal_mode는 파일에 남으므로)
+        workdir = os.path.join(seed_dir, name)
+        os.makedirs(workdir)
+        shutil.copy(os.path.join(seed_dir, "senior_activities.db"), workdir)
+        process = start_server("async", args.port, workdir, profile)
+        try:
+            results[name] = asyncio.run(run_mixed(
+                f"http://127.0.0.1:{args.port}", args.readers, args.writers,
+                args.duration, args.activities,
+            ))
+        finally:
+            process.terminate()
+            process.wait()
+
+    print(f"{'프로필':>8} {'조회/s':>8} {'p50':>8} {'p95':>8} {'p99':>8} "
+          f"{'쓰기/s':>8} {'쓰기p95':>8} {'조회오류':>6} {'쓰기오류':>6}  (ms)")
+    for name, r in results.items():
+        print(f"{name:>8} {r['read_rps']:>8.0f} {r['read_p50']:>8.1f} {r['read_p95']:>8.1f} "
+              f"{r['read_p99']:>8.1f} {r['write_rps']:>8.0f} {r['write_p95']:>8.1f} "
+              f"{r['read_errors']:>6} {r['write_errors']:>6}")
+
+
+if __name__ == "__main__":
+    main()
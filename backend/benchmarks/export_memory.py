@@ -0,0 +1,114 @@
+"""
+명단 내보내기 메모리 사용량 비교
+
+예약 행 수를 늘려 가며 두 가지 방식의 최대 메모리(tracemalloc 기준)와 시간을 비교합니다.
+
+    all     결과를 .all()로 모두 불러온 뒤 CSV로 직렬화 (목록 엔드포인트 방식)
+    stream  exports.stream (서버 측 커서 + yield_per, 청크 단위 인코딩)
+
+사용법:
+    cd backend
+    python benchmarks/export_memory.py --rows 10000 50000 200000
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def seed(booking_count):
+    """활동 2,000개와 예약 booking_count개 생성 (사용자당 활동 하나씩만 예약)"""
+    import migrations
+    from database import SessionLocal
+    from models import Activity, ActivityBooking, User
+
+    migrations.upgrade()
+    rng = random.Random(5)
+    now = datetime.utcnow()
+    activity_count = 2000
+    user_count = booking_count // activity_count + 1
+    db = SessionLocal()
+    db.execute(Activity.__table__.insert(), [
+        {"title": f"체험 클래스 {i}", "category": "기타", "location": "서울시 강남구",
+         "activity_date": now + timedelta(days=rng.randint(1, 60)), "booking_count": 0,
+         "volunteer_count": 0, "created_at": now}
+        for i in range(activity_count)
+    ])
+    db.execute(User.__table__.insert(), [
+        {"name": f"사용자{i}", "email": f"export{i}@example.com", "phone": "010-0000-0000",
+         "created_at": now}
+        for i in range(user_count)
+    ])
+    for start in range(0, booking_count, 50_000):
+        db.execute(ActivityBooking.__table__.insert(), [
+            {"user_id": n // activity_count + 1, "activity_id": n % activity_count + 1,
+             "booking_date": now, "notes": "휠체어 이용"}
+            for n in range(start, min(start + 50_000, booking_count))
+        ])
+    db.commit()
+    db.close()
+
+
+async def export_all(query):
+    import csv
+    import io
+
+    from database import AsyncReadSessionLocal
+
+    async with AsyncReadSessionLocal() as db:
+        rows = (await db.execute(query)).all()
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(query.selected_columns.keys())
+    writer.writerows(rows)
+    return len(buffer.getvalue().encode())
+
+
+async def export_stream(query):
+    import exports
+
+    size = 0
+    async for chunk in exports.stream(query, "csv"):
+        size += len(chunk)
+    return size
+
+
+def measure(method, query):
+    tracemalloc.start()
+    started = time.perf_counter()
+    size = asyncio.run((export_all if method == "all" else export_stream)(query))
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return {"elapsed": elapsed, "peak": peak, "size": size}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="명단 내보내기 메모리 사용량 비교")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 50_000, 200_000])
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix="export_memory_"))
+    seed(max(args.rows))
+
+    import exports
+
+    print(f"{'행 수':>10} {'방식':>7} {'시간(초)':>9} {'최대 메모리(MB)':>16} {'출력(MB)':>9}")
+    for count in args.rows:
+        query = exports.bookings_query().limit(count)
+        for method in ("all", "stream"):
+            r = measure(method, query)
+            print(f"{count:>10,} {method:>7} {r['elapsed']:>9.2f} "
+                  f"{r['peak'] / 1024 / 1024:>16.1f} {r['size'] / 1024 / 1024:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
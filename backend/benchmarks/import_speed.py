@@ -0,0 +1,200 @@
+"""
+활동 일괄 가져오기 속도 비교
+
+같은 활동 N개를 새 DB에 넣는 방법별로 전체 시간과 가장 긴 쓰기 트랜잭션
+(그동안 다른 요청의 쓰기가 기다려야 하는 시간)을 비교합니다.
+
+    orm     기존 init_data.py 방식: 행마다 ORM 객체 생성 + db.add, 마지막에 한 번 커밋
+    bulk    bulk_import.ActivityImporter (청크별 executemany)
+    ndjson  POST /api/activities/bulk 에 NDJSON 본문을 스트리밍으로 전송
+    csv     POST /api/activities/bulk 에 CSV 본문을 스트리밍으로 전송
+
+사용법:
+    cd backend
+    python benchmarks/import_speed.py --rows 5000 --chunk-size 500
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# 행 검증과 저장 속도만 비교하도록 응답 캐시는 끔
+os.environ["RESPONSE_CACHE_URL"] = "off"
+
+COLUMNS = [
+    "external_id", "title", "description", "category", "location",
+    "instructor", "max_participants", "duration_minutes", "price", "activity_date",
+]
+
+
+def make_rows(count):
+    rng = random.Random(11)
+    now = datetime.utcnow()
+    return [
+        {
+            "external_id": f"partner-{i}",
+            "title": f"{rng.choice(['도예', '수영', '요가', '합창', '서예'])} 클래스 {i}",
+            "description": "초보자도 환영하는 시니어 체험 프로그램입니다.",
+            "category": rng.choice(["도예/공예", "수영", "요가/필라테스", "음악/악기"]),
+            "location": f"서울시 {rng.choice(['강남구', '마포구', '송파구'])} 문화센터",
+            "instructor": "김강사",
+            "max_participants": 20,
+            "duration_minutes": 90,
+            "price": float(rng.randrange(10000, 50000, 5000)),
+            "activity_date": (now + timedelta(days=rng.randint(1, 60))).isoformat(),
+        }
+        for i in range(count)
+    ]
+
+
+class TransactionTimer:
+    """엔진의 트랜잭션 시작~커밋 시간 중 최댓값 기록"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.longest = 0.0
+        self._started = None
+        event.listen(engine, "begin", self._begin)
+        event.listen(engine, "commit", self._end)
+
+    def _begin(self, conn):
+        self._started = time.perf_counter()
+
+    def _end(self, conn):
+        if self._started is not None:
+            self.longest = max(self.longest, time.perf_counter() - self._started)
+            self._started = None
+
+
+def fresh_database(name):
+    """방법마다 새 작업 디렉터리의 새 DB를 사용 (엔진은 프로세스당 하나이므로 서브프로세스로 실행)"""
+    workdir = tempfile.mkdtemp(prefix=f"import_{name}_")
+    os.chdir(workdir)
+
+
+def run_orm(rows):
+    import regions
+    from database import SessionLocal
+    from models import Activity
+
+    db = SessionLocal()
+    for row in rows:
+        values = dict(row, activity_date=datetime.fromisoformat(row["activity_date"]))
+        activity = Activity(**values)
+        activity.region_id = regions.resolve(db.connection(), activity.location)
+        db.add(activity)
+    db.commit()
+    db.close()
+
+
+def run_bulk(rows, chunk_size):
+    import bulk_import
+    from database import SessionLocal
+
+    db = SessionLocal()
+    result = bulk_import.import_rows(db, bulk_import.ActivityImporter(), rows, chunk_size)
+    db.close()
+    return result
+
+
+def run_http(rows, chunk_size, fmt):
+    from fastapi.testclient import TestClient
+
+    from main import app
+
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=COLUMNS)
+        writer.writeheader()
+        writer.writerows(rows)
+        lines = buffer.getvalue().splitlines(keepends=True)
+        content_type = "text/csv"
+    else:
+        lines = [json.dumps(row, ensure_ascii=False) + "\n" for row in rows]
+        content_type = "application/x-ndjson"
+
+    def body():
+        # 클라이언트도 한 번에 만들지 않고 1,000줄씩 나눠 전송
+        for start in range(0, len(lines), 1000):
+            yield "".join(lines[start:start + 1000]).encode()
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/api/activities/bulk", params={"chunk_size": chunk_size},
+            content=body(), headers={"content-type": content_type},
+        )
+    return response.json()
+
+
+def run_one(method, count, chunk_size):
+    """한 가지 방법을 현재 프로세스에서 실행하고 결과를 JSON으로 출력"""
+    fresh_database(method)
+    import migrations
+    from database import async_engine, engine
+
+    migrations.upgrade()
+    rows = make_rows(count)
+    timer = TransactionTimer(engine)
+    async_timer = TransactionTimer(async_engine.sync_engine)
+
+    started = time.perf_counter()
+    if method == "orm":
+        run_orm(rows)
+    elif method == "bulk":
+        run_bulk(rows, chunk_size)
+    else:
+        run_http(rows, chunk_size, method)
+    elapsed = time.perf_counter() - started
+
+    from sqlalchemy import func, select
+
+    from models import Activity
+
+    with engine.connect() as conn:
+        stored = conn.execute(select(func.count(Activity.id))).scalar()
+    print(json.dumps({
+        "elapsed": elapsed,
+        "longest_transaction": max(timer.longest, async_timer.longest),
+        "stored": stored,
+    }))
+
+
+def main():
+    import subprocess
+
+    parser = argparse.ArgumentParser(description="활동 일괄 가져오기 속도 비교")
+    parser.add_argument("--rows", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=500)
+    parser.add_argument("--methods", nargs="+", default=["orm", "bulk", "ndjson", "csv"])
+    parser.add_argument("--run", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run:
+        run_one(args.run, args.rows, args.chunk_size)
+        return
+
+    print(f"활동 {args.rows:,}개, 청크 {args.chunk_size}행\n")
+    print(f"{'방법':>8} {'전체(초)':>10} {'행/초':>10} {'최장 트랜잭션(ms)':>18} {'저장':>8}")
+    for method in args.methods:
+        output = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run", method,
+             "--rows", str(args.rows), "--chunk-size", str(args.chunk_size)],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(f"{method:>8} {r['elapsed']:>10.2f} {args.rows / r['elapsed']:>10,.0f} "
+              f"{r['longest_transaction'] * 1000:>18.1f} {r['stored']:>8,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+목록 응답 직렬화 비교 (ORM + pydantic 검증 vs 행 튜플 + fastjson)
+
+같은 행을 두 방식으로 JSON 바이트까지 만들어 시간을 비교하고, 두 결과가 바이트 단위로
+같은지 확인합니다 (다르면 종료 코드 1).
+
+    pydantic  ORM 객체를 불러와 응답 스키마로 검증(from_attributes)한 뒤 직렬화
+              (활동 목록은 기존 캐시 저장 방식, 예약 목록은 FastAPI response_model 방식)
+    fast      스키마 필드 컬럼만 SELECT한 행 튜플을 dict로 옮겨 fastjson.dumps (현재 방식)
+
+대상
+    activities  활동 목록 (GET /api/activities)
+    bookings    예약 목록 expand=activity,user (GET /api/users/{id}/bookings)
+
+시간은 SELECT부터 JSON 바이트까지이며 --repeat번 중 가장 짧은 값입니다.
+
+사용법:
+    cd backend
+    python benchmarks/list_serialization.py --rows 1000 10000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def seed(rows):
+    """활동 rows개와 예약 rows건 이상이 되도록 대량 데이터 생성"""
+    import generate_data
+    import migrations
+    from database import engine
+
+    migrations.upgrade()
+    with engine.begin() as conn:
+        return generate_data.generate(conn, users=max(1000, rows), activities=rows, seed=21)
+
+
+# ==================== 두 방식 ====================
+
+def activities_pydantic(db, rows):
+    from models import Activity
+    from schemas import ActivityPage
+
+    items = db.query(Activity).order_by(Activity.id).limit(rows).all()
+    page = {"items": items, "next_cursor": None}
+    return ActivityPage.model_validate(page, from_attributes=True).model_dump_json().encode()
+
+
+def activities_fast(db, rows):
+    import fastjson
+    from main import ACTIVITY_ROWS
+    from models import Activity
+
+    query = db.query(*ACTIVITY_ROWS.columns).order_by(Activity.id).limit(rows)
+    page = {"items": ACTIVITY_ROWS.items(db.connection(), query), "next_cursor": None}
+    return fastjson.dumps(page)
+
+
+def bookings_pydantic(db, rows):
+    from fastapi.responses import JSONResponse
+    from sqlalchemy.orm import selectinload
+
+    from models import ActivityBooking
+    from schemas import BookingPage
+
+    items = db.query(ActivityBooking).options(
+        selectinload(ActivityBooking.activity), selectinload(ActivityBooking.user)
+    ).order_by(ActivityBooking.id).limit(rows).all()
+    page = BookingPage.model_validate({"items": items, "next_cursor": None}, from_attributes=True)
+    return JSONResponse(page.model_dump(mode="json")).body
+
+
+def bookings_fast(db, rows):
+    import fastjson
+    from main import BOOKING_ROWS
+    from models import ActivityBooking
+
+    query = db.query(*BOOKING_ROWS.columns).order_by(ActivityBooking.id).limit(rows)
+    items = BOOKING_ROWS.items(db.connection(), query, ["activity", "user"])
+    return fastjson.dumps({"items": items, "next_cursor": None})
+
+
+TARGETS = {
+    "activities": (activities_pydantic, activities_fast),
+    "bookings": (bookings_pydantic, bookings_fast),
+}
+
+
+def measure(fn, rows, repeat):
+    from database import SessionLocal
+
+    best, body = None, None
+    for _ in range(repeat):
+        db = SessionLocal()  # 매번 새 세션 (식별 맵에 남은 객체를 재사용하지 않도록)
+        try:
+            started = time.perf_counter()
+            body = fn(db, rows)
+            elapsed = time.perf_counter() - started
+        finally:
+            db.close()
+        best = elapsed if best is None else min(best, elapsed)
+    return best, body
+
+
+def main():
+    parser = argparse.ArgumentParser(description="목록 응답 직렬화 비교")
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix="list_serialization_"))
+    counts = seed(max(args.rows))
+    print(f"데이터: {', '.join(f'{name} {count:,}' for name, count in counts.items())}")
+
+    import fastjson
+
+    print(f"인코더: {'orjson' if fastjson.orjson is not None else 'json (표준 라이브러리)'}")
+    print(f"{'대상':<11} {'행 수':>8} {'pydantic(ms)':>13} {'fast(ms)':>9} {'배율':>6} {'출력(KB)':>9} {'동일':>4}")
+    mismatched = False
+    for target, (slow, fast) in TARGETS.items():
+        for rows in args.rows:
+            slow_time, slow_body = measure(slow, rows, args.repeat)
+            fast_time, fast_body = measure(fast, rows, args.repeat)
+            same = slow_body == fast_body
+            mismatched |= not same
+            print(f"{target:<11} {rows:>8,} {slow_time * 1000:>13.1f} {fast_time * 1000:>9.1f} "
+                  f"{slow_time / fast_time:>5.1f}x {len(fast_body) / 1024:>9.0f} {'예' if same else '아니오':>4}")
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == "__main__":
+    main()
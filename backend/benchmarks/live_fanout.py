@@ -0,0 +1,108 @@
+"""
+신청자 수 실시간 전송 팬아웃 측정
+
+유휴 SSE 연결 N개(live.stream 코루틴)를 한 이벤트 루프에 띄워 두고 예약 커밋을
+흉내 내 발행한 뒤, 발행부터 관련 구독자 전원이 메시지를 받기까지의 시간과
+연결당 메모리(tracemalloc 기준)를 측정합니다. HTTP 계층을 빼고 구독 색인과
+전송 루프 비용만 봅니다.
+
+구독자의 절반은 활동별(활동 3개씩), 절반은 카테고리 필터로 구독합니다.
+
+사용법:
+    cd backend
+    python benchmarks/live_fanout.py --connections 1000 5000 --events 200
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+import tracemalloc
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+ACTIVITY_COUNT = 500
+CATEGORIES = ["도예/공예", "수영", "요가/필라테스", "음악/악기", "기타"]
+
+
+def category_of(activity_id):
+    return CATEGORIES[activity_id % len(CATEGORIES)]
+
+
+async def consume(generator, received):
+    async for chunk in generator:
+        if chunk.startswith(b"event: booking_counts"):
+            received.append(time.perf_counter())
+
+
+async def run(connections, events):
+    import live
+
+    rng = random.Random(3)
+    broadcaster = live.Broadcaster()
+    subscribers = []
+    for i in range(connections):
+        if i % 2:
+            subscribers.append(live.Subscriber(activity_ids=rng.sample(range(1, ACTIVITY_COUNT + 1), 3)))
+        else:
+            subscribers.append(live.Subscriber(category=rng.choice(CATEGORIES)))
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    received = []
+    tasks = [
+        asyncio.create_task(consume(live.stream(broadcaster, subscriber), received))
+        for subscriber in subscribers
+    ]
+    await asyncio.sleep(0.1)  # 모든 연결이 구독 등록 후 대기 상태가 되도록
+    per_connection = (tracemalloc.get_traced_memory()[0] - before) / connections
+    tracemalloc.stop()
+
+    latencies = []
+    deliveries = 0
+    for _ in range(events):
+        activity_id = rng.randint(1, ACTIVITY_COUNT)
+        received.clear()
+        started = time.perf_counter()
+        broadcaster.publish(activity_id, rng.randint(0, 20), 1, category_of(activity_id))
+        # 깨어난 구독자들이 모두 전송을 마칠 때까지 루프를 양보
+        while True:
+            count = len(received)
+            await asyncio.sleep(0)
+            if len(received) == count and not any(s.ready.is_set() for s in subscribers):
+                break
+        if received:
+            latencies.append(received[-1] - started)
+            deliveries += len(received)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return {
+        "per_connection": per_connection,
+        "deliveries": deliveries / events,
+        "p50": statistics.median(latencies) if latencies else 0.0,
+        "max": max(latencies) if latencies else 0.0,
+        "subscribers_after": broadcaster.subscriber_count,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="신청자 수 실시간 전송 팬아웃 측정")
+    parser.add_argument("--connections", type=int, nargs="+", default=[1000, 5000])
+    parser.add_argument("--events", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'연결 수':>8} {'연결당 메모리(KB)':>17} {'이벤트당 전달':>12} "
+          f"{'p50(ms)':>9} {'최대(ms)':>9} {'종료 후 구독':>11}")
+    for connections in args.connections:
+        r = asyncio.run(run(connections, args.events))
+        print(f"{connections:>8,} {r['per_connection'] / 1024:>17.1f} {r['deliveries']:>12.0f} "
+              f"{r['p50'] * 1000:>9.2f} {r['max'] * 1000:>9.2f} {r['subscribers_after']:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+엔드포인트 쿼리 실행 계획 검사
+
+main.py의 각 엔드포인트를 호출하면서 실행되는 SQL을 수집하고,
+WHERE 조건이 있는 쿼리마다 EXPLAIN QUERY PLAN을 실행해
+테이블 전체 스캔(SCAN <table>) 없이 인덱스를 사용하는지 확인합니다.
+
+사용법:
+    cd backend
+    python benchmarks/query_plans.py
+"""
+import asyncio
+import os
+import re
+import sys
+import tempfile
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from urllib.parse import quote
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 부분 문자열 검색(LIKE '%...%')처럼 B-tree 인덱스로 풀 수 없는 요청
+KNOWN_SCANS = {
+    "GET /api/activities?location=강남",
+}
+
+FULL_SCAN = re.compile(r"^SCAN (\w+)$")
+HAS_WHERE = re.compile(r"\bWHERE\b", re.IGNORECASE)
+
+
+def endpoint_requests(activity_id, user_id, booking_id, activity_date):
+    """(메서드, 경로, JSON 본문) 목록"""
+    day_from = activity_date.date().isoformat()
+    day_to = (activity_date + timedelta(days=7)).date().isoformat()
+    month = activity_date.strftime("%Y-%m")
+    return [
+        ("GET", "/api/activities", None),
+        ("GET", "/api/activities?category=수영", None),
+        ("GET", "/api/activities?location=강남", None),
+        ("GET", "/api/activities?q=수영 교실", None),
+        ("GET", "/api/activities?region=서울 서초구", None),
+        ("GET", "/api/activities?region=서초구", None),
+        ("GET", f"/api/activities?near_user_id={user_id}", None),
+        ("GET", "/api/regions", None),
+        ("GET", "/api/activities?sort=-activity_date&limit=1", None),
+        ("GET", "/api/activities?category=수영&sort=activity_date&limit=1", None),
+        ("GET", "/api/activities?sort=price&limit=1", None),
+        ("GET", "/api/activities?fields=summary&sort=recent", None),
+        ("GET", "/api/activities?fields=id,title,price&category=수영", None),
+        ("GET", f"/api/activities?from={day_from}&to={day_to}", None),
+        ("GET", f"/api/activities?from={day_from}&to={day_to}&category=수영", None),
+        ("GET", "/api/activities?upcoming=true&region=서울 서초구", None),
+        ("GET", "/api/categories", None),
+        ("GET", f"/api/calendar?month={month}", None),
+        ("GET", f"/api/calendar?month={month}&category=수영", None),
+        ("GET", "/api/stats/categories", None),
+        ("GET", "/api/stats/regions", None),
+        ("GET", "/api/stats/subscriptions", None),
+        ("GET", f"/api/activities/{activity_id}", None),
+        ("PUT", f"/api/activities/{activity_id}", {"instructor": "김강사"}),
+        ("GET", f"/api/users/{user_id}", None),
+        ("GET", f"/api/users/{user_id}/subscription", None),
+        ("POST", "/api/users", {"name": "새사용자", "email": "new@example.com"}),
+        ("POST", "/api/subscriptions", {"user_id": user_id, "plan_type": "monthly"}),
+        ("POST", "/api/bookings", {"user_id": user_id, "activity_id": activity_id}),
+        ("GET", f"/api/activities/{activity_id}/bookings", None),
+        ("GET", f"/api/users/{user_id}/bookings", None),
+        ("GET", f"/api/users/{user_id}/bookings?expand=activity,user", None),
+        ("GET", f"/api/activities/{activity_id}/bookings?expand=activity,user", None),
+        ("POST", "/api/volunteers", {
+            "activity_id": activity_id, "name": "봉사자", "email": "v@example.com"
+        }),
+        ("GET", f"/api/activities/{activity_id}/volunteers", None),
+        ("GET", f"/api/activities/{activity_id}/detail", None),
+        ("GET", f"/api/activities/{activity_id}/volunteer-candidates", None),
+        ("GET", "/api/reports/unstaffed-activities", None),
+        ("GET", f"/api/reports/unstaffed-activities?category=수영&region=서울 서초구"
+                f"&from={day_from}&to={day_to}", None),
+        ("GET", f"/api/exports/bookings?activity_id={activity_id}", None),
+        ("GET", f"/api/exports/bookings?from={day_from}&to={day_to}&format=ndjson", None),
+        ("GET", f"/api/exports/volunteers?activity_id={activity_id}", None),
+        ("GET", f"/api/exports/volunteers?from={day_from}&to={day_to}", None),
+        ("GET", f"/api/live/booking-counts?activity_ids={activity_id}", None),
+        ("GET", "/api/live/booking-counts?category=수영&region=서울 서초구", None),
+        ("DELETE", f"/api/bookings/{booking_id}", None),
+    ]
+
+
+async def first_event(app, path):
+    """
+    끝나지 않는 SSE 스트림을 첫 이벤트(또는 ping)까지만 받고 연결을 끊음
+
+    TestClient는 응답 본문을 끝까지 읽으므로 ASGI 앱을 직접 호출합니다.
+    """
+    raw_path, _, query = path.partition("?")
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": raw_path, "raw_path": raw_path.encode(),
+        "query_string": quote(query, safe="=&,").encode(), "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 0), "server": ("testserver", 80), "root_path": "",
+    }
+    received = asyncio.Event()
+    requested = False
+    status = []
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await received.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            status.append(message["status"])
+        elif message["type"] == "http.response.body" and (
+            b"data:" in message.get("body", b"") or message.get("body", b"").startswith(b":")
+        ):
+            received.set()
+
+    await app(scope, receive, send)
+    return SimpleNamespace(status_code=status[0])
+
+
+def main():
+    workdir = tempfile.mkdtemp(prefix="query_plans_")
+    os.chdir(workdir)
+    sys.path.insert(0, BACKEND_DIR)
+
+    from fastapi.testclient import TestClient
+    from sqlalchemy import event
+
+    import migrations
+    import regions
+    import stats
+    from database import SessionLocal, async_engine, engine, read_async_engine
+    from main import app
+    from models import Activity, ActivityBooking, Subscription, User
+
+    migrations.upgrade()
+
+    db = SessionLocal()
+    user = User(name="홍길동", email="hong@example.com", address="서울시 서초구 서초동")
+    other = User(name="김영희", email="kim@example.com")
+    activity_date = (datetime.utcnow() + timedelta(days=3)).replace(hour=10, minute=0, second=0, microsecond=0)
+    activity = Activity(title="실버 수영 교실", category="수영", location="서울시 서초구",
+                        activity_date=activity_date, duration_minutes=90)
+    db.add_all([user, other, activity])
+    db.flush()
+    user.region_id = regions.resolve(db.connection(), user.address)
+    activity.region_id = regions.resolve(db.connection(), activity.location)
+    db.flush()
+    db.add(Subscription(user_id=other.id, plan_type="monthly"))
+    booking = ActivityBooking(user_id=other.id, activity_id=activity.id)
+    db.add(booking)
+    stats.rebuild(db.connection())
+    db.commit()
+    ids = (activity.id, user.id, booking.id, activity_date)
+    db.close()
+
+    captured = []
+
+    # API는 비동기 엔진(쓰기/조회 전용)으로 실행되므로 각 동기 엔진 파사드에서 쿼리를 수집
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not executemany and HAS_WHERE.search(statement):
+            captured.append((statement, parameters))
+
+    for api_engine in {async_engine.sync_engine, read_async_engine.sync_engine}:
+        event.listen(api_engine, "before_cursor_execute", capture)
+
+    client = TestClient(app)
+    failures = []
+    for method, path, body in endpoint_requests(*ids):
+        captured.clear()
+        if path.startswith("/api/live/"):
+            response = asyncio.run(first_event(app, path))
+        else:
+            response = client.request(method, path, json=body)
+        label = f"{method} {path}"
+        statements = list(captured)
+
+        for statement, parameters in statements:
+            with engine.connect() as conn:
+                plan = conn.exec_driver_sql(
+                    f"EXPLAIN QUERY PLAN {statement}", parameters
+                ).fetchall()
+            details = [row[-1] for row in plan]
+            scans = [d for d in details if FULL_SCAN.match(d)]
+            if scans and label not in KNOWN_SCANS:
+                failures.append((label, statement, details))
+            mark = "⚠️ " if scans else "✅"
+            print(f"{mark} [{response.status_code}] {label}")
+            for detail in details:
+                print(f"      {detail}")
+
+    if failures:
+        print(f"\n❌ 인덱스를 사용하지 않는 쿼리 {len(failures)}개")
+        for label, statement, details in failures:
+            print(f"  {label}\n    {' '.join(statement.split())}\n    {details}")
+        sys.exit(1)
+    print("\n✅ 모든 엔드포인트 쿼리가 인덱스를 사용합니다")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+활동 검색 벤치마크
+
+임시 데이터베이스에 활동 N개(기본 10만 개)를 만들고
+FTS5 bigram 색인 검색(`GET /api/activities?q=`)과
+기존 방식인 LIKE '%...%' 부분 문자열 검색의 지연 시간을 비교합니다.
+LIKE는 정렬 인덱스를 따라가다 20건을 채우면 멈추므로 흔한 검색어에서는 빠르지만,
+결과가 적거나 없는 검색어에서는 테이블 전체를 읽게 됩니다.
+
+사용법:
+    cd backend
+    python benchmarks/search.py --activities 100000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CATEGORIES = ["도예/공예", "수영", "커피 시음", "요가/필라테스", "요리 클래스", "원예", "음악/악기", "독서 모임"]
+SUBJECTS = ["도예", "한지 공예", "실버 수영", "원두 커피", "요가", "필라테스", "한식 요리", "베이킹",
+            "원예", "우쿨렐레", "합창", "독서", "서예", "수채화", "탁구", "걷기"]
+KINDS = ["클래스", "교실", "체험", "모임", "워크숍"]
+DISTRICTS = ["강남구", "서초구", "송파구", "마포구", "종로구", "노원구", "분당구", "수성구", "해운대구"]
+PLACES = ["공방", "문화센터", "복지관", "스튜디오", "카페", "체육관", "도서관"]
+# 흔한 검색어와 결과가 적은(선택도가 높은) 검색어를 함께 측정
+QUERIES = ["도예", "강남", "수영 교실", "복지관 요가", "우쿨렐레 클래스",
+           "서예 교실 4321", "워크숍 99999", "없는검색어"]
+
+
+def generate(db, count, chunk_size=5000):
+    """활동 count개를 bulk insert로 생성"""
+    from models import Activity
+
+    rng = random.Random(42)
+    now = datetime.utcnow()
+    rows = []
+    for i in range(count):
+        subject = rng.choice(SUBJECTS)
+        district = rng.choice(DISTRICTS)
+        place = rng.choice(PLACES)
+        rows.append({
+            "title": f"{subject} {rng.choice(KINDS)} {i}",
+            "description": f"{district} {place}에서 진행하는 {subject} 프로그램입니다. 초보자도 환영합니다.",
+            "category": rng.choice(CATEGORIES),
+            "location": f"서울시 {district} {place} {rng.randint(1, 999)}",
+            "instructor": f"{rng.choice('김이박최정강조윤')}강사",
+            "max_participants": rng.randint(8, 30),
+            "price": float(rng.randrange(10000, 60000, 5000)),
+            "created_at": now,
+            "activity_date": now + timedelta(days=rng.randint(0, 90)),
+        })
+        if len(rows) == chunk_size:
+            db.execute(Activity.__table__.insert(), rows)
+            rows = []
+    if rows:
+        db.execute(Activity.__table__.insert(), rows)
+    db.commit()
+
+
+def measure(func, repeat):
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "p50": statistics.median(timings),
+        "p95": timings[int(len(timings) * 0.95) - 1],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="활동 검색 벤치마크")
+    parser.add_argument("--activities", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="search_bench_")
+    os.chdir(workdir)
+    sys.path.insert(0, BACKEND_DIR)
+    # 같은 검색어를 반복 요청하므로 응답 캐시를 끄고 실제 조회 비용을 측정
+    os.environ["RESPONSE_CACHE_URL"] = "off"
+
+    from fastapi.testclient import TestClient
+
+    import migrations
+    import search
+    from database import SessionLocal
+    from main import app
+    from models import Activity
+
+    migrations.upgrade()
+    db = SessionLocal()
+
+    started = time.perf_counter()
+    generate(db, args.activities)
+    print(f"활동 {args.activities:,}개 생성: {time.perf_counter() - started:.1f}s")
+
+    started = time.perf_counter()
+    search.rebuild(db.connection())
+    db.commit()
+    print(f"FTS 색인 생성: {time.perf_counter() - started:.1f}s\n")
+
+    client = TestClient(app)
+    print(f"{'검색어':<16}{'결과 수':>8}{'API p50':>10}{'FTS p50':>10}{'FTS p95':>10}"
+          f"{'LIKE p50':>10}{'LIKE p95':>10}  (ms)")
+    for q in QUERIES:
+        def api():
+            response = client.get("/api/activities", params={"q": q, "limit": 20})
+            assert response.status_code == 200
+
+        def fts():
+            matches = search.ranked_matches(search.match_expression(q))
+            db.query(Activity).join(matches, matches.c.activity_id == Activity.id) \
+                .order_by(matches.c.score, Activity.id).limit(20).all()
+
+        def like():
+            db.query(Activity).filter(*search.like_filter(q)) \
+                .order_by(Activity.created_at, Activity.id).limit(20).all()
+
+        total = db.connection().exec_driver_sql(
+            f"SELECT COUNT(*) FROM {search.FTS_TABLE} WHERE {search.FTS_TABLE} MATCH ?",
+            (search.match_expression(q),),
+        ).scalar()
+        api_ms = measure(api, args.repeat)
+        fts_ms = measure(fts, args.repeat)
+        like_ms = measure(like, args.repeat)
+        print(f"{q:<16}{total:>8,}{api_ms['p50']:>10.1f}{fts_ms['p50']:>10.1f}{fts_ms['p95']:>10.1f}"
+              f"{like_ms['p50']:>10.1f}{like_ms['p95']:>10.1f}")
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
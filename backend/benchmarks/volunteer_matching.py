@@ -0,0 +1,167 @@
+"""
+자원봉사자 후보 매칭 비교 (SQL 조인 vs 메모리 구간 인덱스)
+
+활동마다 "활동 시간 전체가 가능하고 같은 시/군/구인 자원봉사자"를 두 방식으로 구해
+시간을 비교하고, 두 결과가 같은지 확인합니다 (다르면 종료 코드 1).
+
+    sql     volunteer_slots(요일, 시작 ≤ 활동 시작, 끝 ≥ 활동 끝)와 volunteers를 조인해 매번 조회
+    index   availability.index (지역·요일 버킷의 구간별 id 집합, 현재 방식)
+
+대상
+    candidates  활동 하나의 후보 (GET /api/activities/{id}/volunteer-candidates)
+    report      자원봉사자가 없는 예정 활동 전체의 후보 수 (GET /api/reports/unstaffed-activities)
+
+생성 데이터는 이메일이 모두 달라 "이메일별 최근 신청"이 행 하나와 같으므로 SQL 쪽은
+중복 제거 없이 비교합니다. 인덱스 첫 구성(전체 읽기) 시간도 함께 출력합니다.
+
+사용법:
+    cd backend
+    python benchmarks/volunteer_matching.py --volunteers 100000
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+
+def seed(activities, volunteers):
+    import generate_data
+    import migrations
+    from database import engine
+
+    migrations.upgrade()
+    with engine.begin() as conn:
+        return generate_data.generate(
+            conn, users=activities * 2, activities=activities, seed=24, volunteers=volunteers
+        )
+
+
+# ==================== 두 방식 ====================
+
+def sql_candidates(conn, activity):
+    import availability
+    import regions
+    from sqlalchemy import select
+
+    from models import Region, Volunteer, VolunteerSlot
+
+    parts = availability.activity_parts(activity.activity_date, activity.duration_minutes)
+    if not parts or activity.region_id is None:
+        return set()
+    path = conn.execute(select(Region.path).where(Region.id == activity.region_id)).scalar()
+    sigungu = regions.to_path(path.split(regions.PATH_SEPARATOR)[:regions.LEVEL_SIGUNGU])
+    region_ids = regions.subtree_ids([sigungu])
+    candidates = None
+    for weekday, start, end in parts:  # 자정을 넘는 활동은 요일별 구간을 모두 포함해야 함
+        query = (
+            select(Volunteer.id)
+            .join(VolunteerSlot, VolunteerSlot.volunteer_id == Volunteer.id)
+            .where(
+                VolunteerSlot.weekday == weekday,
+                VolunteerSlot.start_minute <= start,
+                VolunteerSlot.end_minute >= end,
+                Volunteer.region_id.in_(region_ids),
+                Volunteer.activity_id != activity.id,
+            )
+        )
+        found = set(conn.execute(query).scalars())
+        candidates = found if candidates is None else candidates & found
+    return candidates
+
+
+def index_candidates(conn, activity):
+    import availability
+    from sqlalchemy import select
+
+    from models import Volunteer
+
+    availability.index.sync(conn)
+    candidates = availability.index.candidates(
+        conn, activity.region_id, activity.activity_date, activity.duration_minutes
+    )
+    signed_up = conn.execute(select(Volunteer.email).where(Volunteer.activity_id == activity.id))
+    return candidates - availability.index.volunteer_ids(signed_up.scalars())
+
+
+def sql_report(conn, activities):
+    return {activity.id: len(sql_candidates(conn, activity)) for activity in activities}
+
+
+def index_report(conn, activities):
+    import availability
+
+    availability.index.sync(conn)
+    return {
+        activity.id: availability.index.count(
+            conn, activity.region_id, activity.activity_date, activity.duration_minutes
+        )
+        for activity in activities
+    }
+
+
+def timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - started) * 1000, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="자원봉사자 후보 매칭 비교")
+    parser.add_argument("--activities", type=int, default=10_000)
+    parser.add_argument("--volunteers", type=int, default=100_000)
+    parser.add_argument("--samples", type=int, default=200, help="candidates를 측정할 활동 수")
+    args = parser.parse_args()
+
+    os.chdir(tempfile.mkdtemp(prefix="volunteer_matching_"))
+    counts = seed(args.activities, args.volunteers)
+    print(f"데이터: {', '.join(f'{name} {count:,}' for name, count in counts.items())}")
+
+    import availability
+    from database import engine
+    from sqlalchemy import select
+
+    from models import Activity
+
+    with engine.connect() as conn:
+        build_ms, _ = timed(availability.index.sync, conn)
+        print(f"인덱스 구성: {build_ms:.0f}ms {availability.index.stats()}")
+
+        columns = (Activity.id, Activity.region_id, Activity.activity_date, Activity.duration_minutes)
+        activities = conn.execute(select(*columns).order_by(Activity.id)).all()
+        step = max(1, len(activities) // args.samples)
+        sample = activities[::step][:args.samples]
+        unstaffed = conn.execute(
+            select(*columns).where(Activity.is_past == False, Activity.volunteer_count == 0)
+        ).all()
+
+        mismatched = False
+        print(f"{'대상':<11} {'건수':>7} {'sql p50(ms)':>12} {'index p50(ms)':>14} {'sql 합계':>9} {'index 합계':>10} {'동일':>4}")
+        timings = {"sql": [], "index": []}
+        same = True
+        for activity in sample:
+            sql_ms, expected = timed(sql_candidates, conn, activity)
+            index_ms, found = timed(index_candidates, conn, activity)
+            timings["sql"].append(sql_ms)
+            timings["index"].append(index_ms)
+            same &= expected == found
+        mismatched |= not same
+        print(f"{'candidates':<11} {len(sample):>7,} {statistics.median(timings['sql']):>12.2f} "
+              f"{statistics.median(timings['index']):>14.3f} {sum(timings['sql']):>9.0f} "
+              f"{sum(timings['index']):>10.1f} {'예' if same else '아니오':>4}")
+
+        sql_ms, expected = timed(sql_report, conn, unstaffed)
+        index_ms, found = timed(index_report, conn, unstaffed)
+        same = expected == found
+        mismatched |= not same
+        print(f"{'report':<11} {len(unstaffed):>7,} {'':>12} {'':>14} {sql_ms:>9.0f} {index_ms:>10.1f} "
+              f"{'예' if same else '아니오':>4}")
+    sys.exit(1 if mismatched else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+예약 폭주 처리량 비교 (요청별 커밋 vs 쓰기 큐 묶음 커밋)
+
+같은 시드 DB를 복사해 두 가지 설정의 서버를 띄우고, 동시 접속 여러 개가 서로 다른
+(사용자, 활동) 조합으로 예약을 쉬지 않고 보내면서 초당 성공 예약 수와 지연 시간을 비교합니다.
+
+    direct  요청마다 BEGIN IMMEDIATE → 커밋 (WRITE_QUEUE_ENABLED=false, 기본값)
+    queue   쓰기 큐에 넣고 쓰기 작업 하나가 묶음으로 커밋 (WRITE_QUEUE_ENABLED=true)
+
+500은 쓰기 잠금을 busy_timeout 안에 얻지 못한 요청("database is locked"),
+503은 쓰기 큐의 과부하 거절입니다. 측정이 끝나면 예약 행 수, 활동의 booking_count 합계,
+성공 응답 수가 모두 같고 정원을 넘은 활동이 없는지 확인합니다 (다르면 종료 코드 1).
+
+사용법:
+    cd backend
+    python benchmarks/write_intake.py --clients 200 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from async_load import start_server  # noqa: E402
+
+PROFILES = {
+    "direct": {"WRITE_QUEUE_ENABLED": "false"},
+    "queue": {"WRITE_QUEUE_ENABLED": "true"},
+}
+
+
+def seed(activity_count, user_count, seats):
+    """구독 중인 사용자와 정원 seats명인 활동 생성"""
+    import migrations
+    import stats
+    from database import engine
+    from models import Activity, Subscription, User
+
+    migrations.upgrade()
+    now = datetime.utcnow()
+    with engine.begin() as conn:
+        conn.execute(Activity.__table__.insert(), [
+            {"title": f"인기 클래스 {i}", "category": "도예/공예", "location": "서울시 강남구 문화센터",
+             "max_participants": seats, "activity_date": now + timedelta(days=7),
+             "created_at": now, "booking_count": 0, "volunteer_count": 0}
+            for i in range(activity_count)
+        ])
+        conn.execute(User.__table__.insert(), [
+            {"name": f"사용자{i}", "email": f"intake{i}@example.com", "created_at": now}
+            for i in range(user_count)
+        ])
+        conn.execute(Subscription.__table__.insert(), [
+            {"user_id": i + 1, "plan_type": "monthly", "start_date": now,
+             "end_date": now + timedelta(days=30), "is_active": True, "created_at": now}
+            for i in range(user_count)
+        ])
+        stats.rebuild(conn)
+    engine.dispose()
+
+
+def percentile(values, p):
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+
+
+async def post_json(reader, writer, host, path, body):
+    """keep-alive 연결로 POST 한 번 → 상태 코드 (본문은 읽고 버림)"""
+    payload = json.dumps(body).encode()
+    writer.write(
+        f"POST {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(payload)}\r\n\r\n".encode() + payload
+    )
+    head = await reader.readuntil(b"\r\n\r\n")
+    length = re.search(rb"content-length: *(\d+)", head, re.I)
+    await reader.readexactly(int(length.group(1)) if length else 0)
+    return int(head.split(b" ", 2)[1])
+
+
+async def run_rush(host, port, clients, duration, pairs):
+    import httpx
+
+    latencies = []
+    statuses = {}
+    pairs = iter(pairs)
+    deadline = time.perf_counter() + duration
+
+    async def worker():
+        # httpx는 접속 수백 개에 응답이 몰려 오면 클라이언트 CPU를 많이 써서 (같은 CPU를 쓰는)
+        # 서버 측정을 흐리므로, 예약 요청은 asyncio 스트림으로 직접 보냄
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for user_id, activity_id in pairs:
+                if time.perf_counter() >= deadline:
+                    return
+                started = time.perf_counter()
+                try:
+                    status = await post_json(
+                        reader, writer, host, "/api/bookings",
+                        {"user_id": user_id, "activity_id": activity_id},
+                    )
+                except (OSError, asyncio.IncompleteReadError):
+                    statuses["연결 오류"] = statuses.get("연결 오류", 0) + 1
+                    return
+                statuses[status] = statuses.get(status, 0) + 1
+                if status == 200:
+                    latencies.append((time.perf_counter() - started) * 1000)
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*[worker() for _ in range(clients)])
+    elapsed = time.perf_counter() - started
+    metrics = httpx.get(f"http://{host}:{port}/metrics").text
+
+    latencies.sort()
+    batches = re.search(r"^write_queue_batches_total (\d+)", metrics, re.M)
+    applied = re.search(r'^write_queue_requests_total\{result="applied"\} (\d+)', metrics, re.M)
+    return {
+        "rps": len(latencies) / elapsed,
+        "p50": percentile(latencies, 0.50),
+        "p95": percentile(latencies, 0.95),
+        "p99": percentile(latencies, 0.99),
+        "statuses": statuses,
+        "batch": int(applied.group(1)) / int(batches.group(1)) if batches and int(batches.group(1)) else None,
+    }
+
+
+def verify(db_path, succeeded):
+    """예약 행 수 == booking_count 합계 == 성공 응답 수, 정원 초과 없음"""
+    import sqlite3
+
+    conn = sqlite3.connect(db_path)
+    rows = conn.execute("SELECT COUNT(*) FROM activity_bookings").fetchone()[0]
+    counters = conn.execute("SELECT COALESCE(SUM(booking_count), 0) FROM activities").fetchone()[0]
+    overbooked = conn.execute(
+        "SELECT COUNT(*) FROM activities a WHERE booking_count > max_participants"
+        " OR booking_count != (SELECT COUNT(*) FROM activity_bookings b WHERE b.activity_id = a.id)"
+    ).fetchone()[0]
+    conn.close()
+    return rows == counters == succeeded and overbooked == 0, rows, counters
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예약 폭주 처리량 비교 (요청별 커밋 vs 쓰기 큐)")
+    parser.add_argument("--clients", type=int, default=200, help="동시 접속 수")
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--activities", type=int, default=200)
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--seats", type=int, default=2000, help="활동별 정원 (작으면 마감 거절이 섞임)")
+    parser.add_argument("--port", type=int, default=8767)
+    args = parser.parse_args()
+
+    sys.path.insert(0, BACKEND_DIR)
+    seed_dir = tempfile.mkdtemp(prefix="write_intake_")
+    os.chdir(seed_dir)
+    seed(args.activities, args.users, args.seats)
+    print(f"활동 {args.activities:,}개(정원 {args.seats:,}), 구독 사용자 {args.users:,}명 ({seed_dir})")
+    print(f"동시 접속 {args.clients}개, {args.duration:.0f}초\n")
+
+    pairs = [(u, a) for u in range(1, args.users + 1) for a in range(1, args.activities + 1)]
+    random.Random(25).shuffle(pairs)
+
+    results = {}
+    failed = False
+    for name, profile in PROFILES.items():
+        workdir = os.path.join(seed_dir, name)
+        os.makedirs(workdir)
+        shutil.copy(os.path.join(seed_dir, "senior_activities.db"), workdir)
+        env = {"SCHEDULER_ENABLED": "false", **profile}
+        process = start_server("async", args.port, workdir, env)
+        try:
+            result = asyncio.run(run_rush("127.0.0.1", args.port, args.clients, args.duration, pairs))
+        finally:
+            process.terminate()
+            process.wait()
+        ok, rows, counters = verify(
+            os.path.join(workdir, "senior_activities.db"), result["statuses"].get(200, 0)
+        )
+        result.update(ok=ok, rows=rows)
+        failed |= not ok
+        results[name] = result
+
+    print(f"{'설정':>7} {'예약/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'묶음':>6} {'예약 행':>8} {'일치':>4}  응답 코드")
+    for name, r in results.items():
+        statuses = ", ".join(f"{status}: {count:,}" for status, count in sorted(r["statuses"].items(), key=str))
+        batch = f"{r['batch']:.1f}" if r["batch"] else "-"
+        print(f"{name:>7} {r['rps']:>8.0f} {r['p50']:>8.1f} {r['p95']:>8.1f} {r['p99']:>8.1f} {batch:>6} "
+              f"{r['rows']:>8,} {'예' if r['ok'] else '아니오':>4}  {statuses}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,420 @@
+"""
+활동/사용자/구독 일괄 가져오기
+
+요청 본문(NDJSON 또는 CSV)을 스트리밍으로 읽으면서 한 행씩 생성 스키마
+(ActivityCreate 등)로 검증하고, chunk_size 행마다 한 트랜잭션에서 executemany로
+저장합니다. 쓰기 잠금은 청크 하나를 저장하는 동안만 잡으므로 가져오는 중에도
+다른 요청의 쓰기가 청크 사이에 처리됩니다.
+
+잘못된 행은 건너뛰고 행 번호(CSV 헤더 제외, 1부터)와 함께 오류로 보고합니다.
+
+모드
+    insert  모든 행을 새로 추가 (external_id가 이미 있으면 그 행은 오류)
+    upsert  external_id가 같은 행이 있으면 행 전체를 갱신, 없으면 추가
+            (같은 파일을 다시 가져와도 결과가 같음)
+"""
+import csv
+import json
+from datetime import datetime
+from types import SimpleNamespace
+
+from pydantic import ValidationError
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+import etags
+import lifecycle
+import regions
+import search
+import stats
+from cache import ACTIVITY_LIST_TAG, CATEGORIES_TAG, activity_tag
+from models import Activity, Subscription, User
+from schemas import ActivityImportRow, SubscriptionImportRow, UserImportRow
+
+CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 5000
+MODES = ("insert", "upsert")
+FORMATS = ("ndjson", "csv")
+
+
+# ==================== 본문 읽기 ====================
+
+async def _lines(chunks):
+    """바이트 청크 스트림을 줄 단위로 (UTF-8, 첫 줄의 BOM 제거). 디코딩 실패 시 None"""
+    buffer = b""
+    first = True
+    async for chunk in chunks:
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield _decode(line, first)
+            first = False
+    if buffer:
+        yield _decode(buffer, first)
+
+
+def _decode(line, first):
+    try:
+        text = line.decode("utf-8").rstrip("\r")
+    except UnicodeDecodeError:
+        return None
+    return text.lstrip("﻿") if first else text
+
+
+async def read_records(chunks, fmt):
+    """
+    요청 본문을 (행 번호, 필드 dict) 스트림으로 변환
+
+    읽을 수 없는 행은 필드 dict 대신 오류 메시지 문자열을 넘깁니다.
+    """
+    if fmt == "csv":
+        records = _csv_records(chunks)
+    else:
+        records = _ndjson_records(chunks)
+    row_number = 0
+    async for fields in records:
+        row_number += 1
+        yield row_number, fields
+
+
+async def _ndjson_records(chunks):
+    async for line in _lines(chunks):
+        if line is None:
+            yield "UTF-8로 읽을 수 없는 행입니다"
+            continue
+        if not line.strip():
+            continue
+        try:
+            fields = json.loads(line)
+        except ValueError:
+            yield "JSON 형식이 아닙니다"
+            continue
+        yield fields if isinstance(fields, dict) else "JSON 객체가 아닙니다"
+
+
+async def _csv_records(chunks):
+    header = None
+    pending = ""
+    async for line in _lines(chunks):
+        if line is None:
+            yield "UTF-8로 읽을 수 없는 행입니다"
+            continue
+        pending = pending + "\n" + line if pending else line
+        # 따옴표가 닫히지 않았으면 값 안의 줄바꿈이므로 다음 줄과 이어 붙임
+        if pending.count('"') % 2:
+            continue
+        record, pending = pending, ""
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield f"열 개수가 헤더와 다릅니다 ({len(values)}/{len(header)})"
+            continue
+        # 빈 칸은 값을 주지 않은 것으로 처리 (스키마 기본값 적용)
+        yield {name: value for name, value in zip(header, values) if value != ""}
+    if pending:
+        yield "따옴표가 닫히지 않았습니다"
+
+
+def _validation_message(exc):
+    return "; ".join(
+        f"{'.'.join(str(part) for part in error['loc']) or '행'}: {error['msg']}"
+        for error in exc.errors()
+    )
+
+
+# ==================== 가져오기 ====================
+
+class Importer:
+    """
+    한 번의 가져오기 진행 상태 (검증을 통과해 저장을 기다리는 행, 결과 집계)
+
+    add()로 행을 쌓고 write_chunk()로 저장하는 과정을 반복합니다.
+    """
+    model = None
+    schema = None
+    # 파일 안에서 중복되면 안 되는 필드 (external_id 외)
+    unique_fields = ()
+
+    def __init__(self, mode="insert"):
+        self.mode = mode
+        self.pending = []  # [(행 번호, 컬럼 값 dict)]
+        self.created = 0
+        self.updated = 0
+        self.errors = []
+        self._seen = {}  # 중복 검사 필드 -> 이번 가져오기에서 나온 값 집합
+
+    def _error(self, row_number, external_id, message):
+        self.errors.append({"row": row_number, "external_id": external_id, "message": message})
+
+    def add(self, row_number, fields):
+        """한 행을 검증해 저장 대기열에 추가하고 대기 중인 행 수를 반환"""
+        if isinstance(fields, str):
+            self._error(row_number, None, fields)
+            return len(self.pending)
+        try:
+            row = self.schema.model_validate(fields)
+        except ValidationError as exc:
+            external_id = fields.get("external_id")
+            self._error(row_number, external_id if isinstance(external_id, str) else None,
+                        _validation_message(exc))
+            return len(self.pending)
+
+        values = row.model_dump()
+        if self.mode == "upsert" and not row.external_id:
+            self._error(row_number, None, "upsert 모드에서는 external_id가 필요합니다")
+            return len(self.pending)
+        for name in ("external_id",) + self.unique_fields:
+            if values[name] is None:
+                continue
+            seen = self._seen.setdefault(name, set())
+            if values[name] in seen:
+                self._error(row_number, row.external_id, f"{name} 값이 앞 행과 중복됩니다")
+                return len(self.pending)
+            seen.add(values[name])
+        self.pending.append((row_number, values))
+        return len(self.pending)
+
+    def write_chunk(self, session):
+        """
+        대기 중인 행을 한 트랜잭션으로 저장하고 무효화할 캐시 태그 목록을 반환
+
+        같은 키를 다른 요청이 먼저 저장해 제약 조건에 걸리면 기존 행을 다시
+        조회해 한 번 더 시도합니다.
+        """
+        rows, self.pending = self.pending, []
+        if not rows:
+            return []
+        for _ in range(2):
+            errors = []
+            try:
+                created, updated, tags = self._write(session.connection(), rows, errors)
+                session.commit()
+            except IntegrityError as exc:
+                session.rollback()
+                failure = str(exc.orig)
+                continue
+            self.created += created
+            self.updated += updated
+            self.errors.extend(errors)
+            return tags
+        for row_number, values in rows:
+            self._error(row_number, values.get("external_id"), f"저장하지 못했습니다: {failure}")
+        return []
+
+    def result(self):
+        self.errors.sort(key=lambda error: error["row"])
+        return {
+            "created": self.created,
+            "updated": self.updated,
+            "failed": len(self.errors),
+            "errors": self.errors,
+        }
+
+    # ---------- 청크 저장 ----------
+
+    def _write(self, conn, rows, errors):
+        rows = self._prepare(conn, rows, errors)
+        matched = self._match(conn, rows, errors)
+
+        table = self.model.__table__
+        inserts = [(values, row_id) for values, row_id in matched if row_id is None]
+        updates = [(values, row_id) for values, row_id in matched if row_id is not None]
+
+        inserted_ids = []
+        if inserts:
+            inserted_ids = conn.execute(
+                insert(table).returning(table.c.id, sort_by_parameter_order=True),
+                [values for values, _ in inserts],
+            ).scalars().all()
+        if updates:
+            # SET 절은 첫 번째 파라미터의 컬럼 키로 만들어짐 (_id는 WHERE 전용)
+            conn.execute(
+                update(table).where(table.c.id == bindparam("_id")),
+                [dict(values, _id=row_id) for values, row_id in updates],
+            )
+
+        written = [
+            SimpleNamespace(id=row_id, **values)
+            for (values, _), row_id in zip(inserts, inserted_ids)
+        ]
+        updated = [SimpleNamespace(id=row_id, **values) for values, row_id in updates]
+        tags = self._after_write(conn, written, updated)
+        return len(inserts), len(updates), tags
+
+    def _prepare(self, conn, rows, errors):
+        """저장 전에 파생 컬럼을 채움. 저장할 수 없는 행은 errors에 넣고 제외"""
+        return rows
+
+    def _existing(self, conn, rows):
+        """external_id -> 기존 행 id"""
+        external_ids = [values["external_id"] for _, values in rows if values["external_id"]]
+        if not external_ids:
+            return {}
+        return dict(conn.execute(
+            select(self.model.external_id, self.model.id)
+            .where(self.model.external_id.in_(external_ids))
+        ).all())
+
+    def _match(self, conn, rows, errors):
+        """[(컬럼 값, 갱신할 행 id 또는 None)]"""
+        existing = self._existing(conn, rows)
+        matched = []
+        for row_number, values in rows:
+            row_id = existing.get(values["external_id"])
+            if row_id is not None and self.mode == "insert":
+                errors.append({"row": row_number, "external_id": values["external_id"],
+                               "message": "이미 존재하는 external_id입니다"})
+                continue
+            matched.append((values, row_id))
+        return matched
+
+    def _after_write(self, conn, written, updated):
+        return []
+
+
+class ActivityImporter(Importer):
+    model = Activity
+    schema = ActivityImportRow
+
+    def _prepare(self, conn, rows, errors):
+        # 같은 장소 문자열은 청크 안에서 한 번만 지역을 찾음
+        resolved = {}
+        now = datetime.utcnow()
+        for _, values in rows:
+            location = values["location"]
+            if location not in resolved:
+                resolved[location] = regions.resolve(conn, location)
+            values["region_id"] = resolved[location]
+            # 코어 INSERT/UPDATE는 매퍼 이벤트를 거치지 않으므로 직접 계산
+            values["is_past"] = lifecycle.is_past(values["activity_date"], now)
+        return rows
+
+    def _after_write(self, conn, written, updated):
+        # 코어 INSERT/UPDATE는 매퍼 이벤트를 거치지 않으므로 검색 색인을 직접 갱신
+        if search.is_available(conn):
+            search.index_rows(conn, written + updated)
+        # 새 활동은 요약에 바로 더하고, 갱신된 활동은 이전 값을 모르므로 요약을 다시 계산
+        if updated:
+            stats.rebuild_activity_stats(conn)
+            stats.rebuild_day_stats(conn)
+        else:
+            stats.add_activities(conn, [
+                stats.snapshot(SimpleNamespace(booking_count=0, volunteer_count=0, **vars(row)))
+                for row in written
+            ])
+        updated_ids = [row.id for row in updated]
+        etags.bump(conn, *[etags.activity_key(row_id) for row_id in updated_ids])
+        return [ACTIVITY_LIST_TAG, CATEGORIES_TAG] + [activity_tag(row_id) for row_id in updated_ids]
+
+
+class UserImporter(Importer):
+    model = User
+    schema = UserImportRow
+    unique_fields = ("email",)
+
+    def _prepare(self, conn, rows, errors):
+        resolved = {}
+        for _, values in rows:
+            address = values["address"]
+            if address not in resolved:
+                resolved[address] = regions.resolve(conn, address)
+            values["region_id"] = resolved[address]
+        return rows
+
+    def _match(self, conn, rows, errors):
+        existing = self._existing(conn, rows)
+        by_email = {
+            email: (row_id, external_id)
+            for email, row_id, external_id in conn.execute(
+                select(User.email, User.id, User.external_id)
+                .where(User.email.in_([values["email"] for _, values in rows]))
+            )
+        }
+        matched = []
+        for row_number, values in rows:
+            external_id = values["external_id"]
+            row_id = existing.get(external_id)
+            if row_id is not None and self.mode == "insert":
+                errors.append({"row": row_number, "external_id": external_id,
+                               "message": "이미 존재하는 external_id입니다"})
+                continue
+            email_owner = by_email.get(values["email"])
+            if email_owner is not None and email_owner[0] != row_id:
+                if row_id is None and self.mode == "upsert" and email_owner[1] is None:
+                    # external_id 없이 먼저 등록된 같은 이메일의 사용자에 키를 연결
+                    row_id = email_owner[0]
+                else:
+                    errors.append({"row": row_number, "external_id": external_id,
+                                   "message": "이미 등록된 이메일입니다"})
+                    continue
+            matched.append((values, row_id))
+        return matched
+
+
+class SubscriptionImporter(Importer):
+    model = Subscription
+    schema = SubscriptionImportRow
+
+    def _prepare(self, conn, rows, errors):
+        user_ids = {values["user_id"] for _, values in rows if values["user_id"] is not None}
+        user_external_ids = {
+            values["user_external_id"] for _, values in rows if values["user_external_id"]
+        }
+        known_ids = set()
+        if user_ids:
+            known_ids = set(conn.execute(select(User.id).where(User.id.in_(user_ids))).scalars())
+        by_external_id = {}
+        if user_external_ids:
+            by_external_id = dict(conn.execute(
+                select(User.external_id, User.id).where(User.external_id.in_(user_external_ids))
+            ).all())
+
+        now = datetime.utcnow()
+        prepared = []
+        for row_number, values in rows:
+            values = dict(values)  # 재시도할 때 원래 값이 필요함
+            user_external_id = values.pop("user_external_id")
+            if user_external_id:
+                values["user_id"] = by_external_id.get(user_external_id)
+            elif values["user_id"] not in known_ids:
+                values["user_id"] = None
+            if values["user_id"] is None:
+                errors.append({"row": row_number, "external_id": values["external_id"],
+                               "message": "사용자를 찾을 수 없습니다"})
+                continue
+            if values["start_date"] is None:
+                values["start_date"] = now
+            prepared.append((row_number, values))
+        return prepared
+
+    def _after_write(self, conn, written, updated):
+        # 가져온 구독은 활성 상태로 저장됨 (갱신된 구독은 이전 요금제를 모르므로 다시 계산)
+        if updated:
+            stats.rebuild_subscription_stats(conn)
+        else:
+            stats.add_subscriptions(conn, [row.plan_type for row in written])
+        return []
+
+
+IMPORTERS = {
+    "activities": ActivityImporter,
+    "users": UserImporter,
+    "subscriptions": SubscriptionImporter,
+}
+
+
+def import_rows(session, importer, rows, chunk_size=CHUNK_SIZE):
+    """
+    스크립트용: dict 목록을 가져와 결과를 반환 (init_data.py 등)
+
+    API와 같은 검증/청크 저장 경로를 사용합니다.
+    """
+    for row_number, fields in enumerate(rows, start=1):
+        if importer.add(row_number, fields) >= chunk_size:
+            importer.write_chunk(session)
+    importer.write_chunk(session)
+    return importer.result()
@@ -0,0 +1,294 @@
+"""
+카탈로그 조회 응답 캐시
+
+활동 목록/상세와 카테고리 조회는 쓰기보다 훨씬 자주 호출되므로, 직렬화가 끝난
+JSON 바이트를 (경로 + 정렬된 쿼리 파라미터) 키로 저장해 두고 그대로 응답합니다.
+
+각 항목에는 태그가 붙습니다.
+    activity:{id}      해당 활동을 담고 있는 상세/목록 응답
+    activities:list    모든 활동 목록 응답 (새 활동이나 필터 조건 변경 시)
+    categories         카테고리 목록 (카테고리별 활동 수 포함, 활동 생성/수정 시)
+쓰기 엔드포인트는 커밋 후 바뀐 태그만 무효화하므로, 예약 한 건은 그 활동의
+상세와 그 활동이 포함된 목록 페이지만 지웁니다.
+
+저장소는 교체할 수 있습니다 (config.py의 RESPONSE_CACHE_URL).
+    memory://          프로세스 내 LRU (기본값, 워커별로 따로 유지)
+    redis://host:6379  Redis 7+ 호환 서버 (여러 워커가 캐시와 무효화를 공유, redis 패키지 필요)
+    off                캐시 사용 안 함
+"""
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlencode
+
+from fastapi import Response
+
+from config import settings
+
+ACTIVITY_LIST_TAG = "activities:list"
+CATEGORIES_TAG = "categories"
+
+# 엔드포인트별 TTL(초) - 무효화가 닿지 않는 경로(다른 워커, 스크립트)의 최대 지연
+LIST_TTL = 30
+DETAIL_TTL = 60
+CATEGORIES_TTL = 60
+
+
+def activity_tag(activity_id):
+    return f"activity:{activity_id}"
+
+
+# ==================== 저장소 ====================
+
+class MemoryBackend:
+    """항목 수와 전체 바이트 수로 크기를 제한하는 스레드 안전 LRU"""
+
+    def __init__(self, max_entries=2048, max_bytes=32 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._entries = OrderedDict()  # key -> (expires_at, body, tags)
+        self._tags = {}  # tag -> {key, ...}
+        self._invalidated_at = {}  # tag -> 마지막 무효화 시각
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, body, tags, ttl, since):
+        with self._lock:
+            # 조회를 시작한 뒤 무효화된 태그가 있으면 이미 오래된 응답이므로 저장하지 않음
+            if any(self._invalidated_at.get(tag, 0) >= since for tag in tags):
+                return False
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + ttl, body, tags)
+            self._bytes += len(body)
+            for tag in tags:
+                self._tags.setdefault(tag, set()).add(key)
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+            ):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            return True
+
+    def invalidate(self, tags):
+        now = time.time()
+        with self._lock:
+            for tag in tags:
+                self._invalidated_at[tag] = now
+                for key in self._tags.pop(tag, ()):
+                    self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tags.clear()
+            self._bytes = 0
+
+    def info(self):
+        with self._lock:
+            return {"entries": len(self._entries), "bytes": self._bytes, "evictions": self.evictions}
+
+    def _remove(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= len(entry[1])
+        for tag in entry[2]:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._tags[tag]
+
+
+class RedisBackend:
+    """
+    Redis 호환 서버 저장소 (여러 워커 프로세스가 캐시를 공유)
+
+    항목은 SET EX로, 태그는 키 집합(SADD)으로 저장하고
+    태그 집합의 만료는 속한 항목 중 가장 긴 TTL에 맞춥니다 (EXPIRE NX/GT, Redis 7+).
+    """
+
+    def __init__(self, url, prefix="resp:"):
+        import redis  # 선택 의존성
+
+        self._redis = redis.Redis.from_url(url)
+        self._prefix = prefix
+        self._invalidated_key = prefix + "invalidated"
+
+    def _key(self, key):
+        return self._prefix + "k:" + key
+
+    def _tag(self, tag):
+        return self._prefix + "t:" + tag
+
+    def get(self, key):
+        return self._redis.get(self._key(key))
+
+    def set(self, key, body, tags, ttl, since):
+        if tags:
+            invalidated = self._redis.hmget(self._invalidated_key, list(tags))
+            if any(value is not None and float(value) >= since for value in invalidated):
+                return False
+        pipe = self._redis.pipeline()
+        pipe.set(self._key(key), body, ex=ttl)
+        for tag in tags:
+            pipe.sadd(self._tag(tag), key)
+            pipe.expire(self._tag(tag), ttl, nx=True)
+            pipe.expire(self._tag(tag), ttl, gt=True)
+        pipe.execute()
+        return True
+
+    def invalidate(self, tags):
+        now = time.time()
+        for tag in tags:
+            keys = self._redis.smembers(self._tag(tag))
+            pipe = self._redis.pipeline()
+            pipe.hset(self._invalidated_key, tag, now)
+            if keys:
+                pipe.delete(*[self._key(key.decode()) for key in keys])
+            pipe.delete(self._tag(tag))
+            pipe.execute()
+
+    def clear(self):
+        keys = list(self._redis.scan_iter(match=self._prefix + "*"))
+        if keys:
+            self._redis.delete(*keys)
+
+    def info(self):
+        return {}
+
+
+class NullBackend:
+    """캐시를 끈 경우 (항상 미스)"""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, body, tags, ttl, since):
+        return True
+
+    def invalidate(self, tags):
+        pass
+
+    def clear(self):
+        pass
+
+    def info(self):
+        return {}
+
+
+def backend_from_url(url):
+    if not url or url.startswith("memory://"):
+        return MemoryBackend(
+            max_entries=settings.response_cache_max_entries,
+            max_bytes=settings.response_cache_max_bytes,
+        )
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisBackend(url)
+    if url == "off":
+        return NullBackend()
+    raise ValueError(f"지원하지 않는 RESPONSE_CACHE_URL입니다: {url}")
+
+
+# ==================== 응답 캐시 ====================
+
+def json_response(body, hit):
+    return Response(
+        content=body, media_type="application/json",
+        headers={"X-Cache": "HIT" if hit else "MISS"},
+    )
+
+
+class CacheLookup:
+    """한 요청의 캐시 조회 결과. 미스면 store()로 응답을 만들어 저장"""
+
+    def __init__(self, cache, key, body, started):
+        self._cache = cache
+        self.key = key
+        self.body = body
+        self._started = started
+
+    @property
+    def hit(self):
+        return self.body is not None
+
+    def response(self):
+        return json_response(self.body, hit=True)
+
+    def store(self, schema, data, tags, ttl):
+        """응답 모델로 직렬화한 JSON을 저장하고 그 바이트로 응답"""
+        body = schema.model_validate(data, from_attributes=True).model_dump_json().encode()
+        return self.store_body(body, tags, ttl)
+
+    def store_body(self, body, tags, ttl):
+        """이미 직렬화한 JSON 바이트(fastjson 목록 응답 등)를 저장하고 그대로 응답"""
+        self._cache.set(self.key, body, tags, ttl, self._started)
+        return json_response(body, hit=False)
+
+
+class ResponseCache:
+    def __init__(self, backend):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self.stale_skips = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(request):
+        params = urlencode(sorted(request.query_params.multi_items()))
+        return f"{request.url.path}?{params}"
+
+    def lookup(self, request, variant=""):
+        """variant(ETag 등)를 키에 포함하면 다른 버전의 응답과 섞이지 않음"""
+        key = self.key_for(request) + "#" + variant
+        started = time.time()
+        body = self.backend.get(key)
+        with self._lock:
+            if body is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return CacheLookup(self, key, body, started)
+
+    def set(self, key, body, tags, ttl, since):
+        if not self.backend.set(key, body, tuple(tags), ttl, since):
+            with self._lock:
+                self.stale_skips += 1
+
+    def invalidate(self, *tags):
+        with self._lock:
+            self.invalidations += 1
+        self.backend.invalidate(tags)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "stale_skips": self.stale_skips,
+            "invalidations": self.invalidations,
+            **self.backend.info(),
+        }
+
+
+response_cache = ResponseCache(backend_from_url(settings.response_cache_url))
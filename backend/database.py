@@ -1,14 +1,104 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./senior_activities.db"
+import metrics
+from config import settings
 
+SQLALCHEMY_DATABASE_URL = settings.database_url
+
+
+def _engine_options(url, pool_size, max_overflow):
+    options = {
+        "pool_size": pool_size,
+        "max_overflow": max_overflow,
+        "pool_timeout": settings.pool_timeout,
+        "pool_recycle": settings.pool_recycle,
+        "pool_pre_ping": settings.pool_pre_ping,
+    }
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+def _apply_sqlite_pragmas(engine, read_only=False):
+    """
+    SQLite 연결이 만들어질 때마다 PRAGMA 적용 (다른 DB에서는 아무것도 하지 않음)
+
+    쓰기 엔진의 트랜잭션은 BEGIN IMMEDIATE로 시작합니다. WAL에서 조회로 시작한
+    트랜잭션이 쓰기로 올라가려 할 때 다른 쓰기가 먼저 커밋했으면 busy_timeout을
+    기다리지 않고 바로 "database is locked"로 실패하기 때문입니다.
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    begin_immediate = settings.sqlite_begin_immediate and not read_only
+
+    if begin_immediate:
+        @event.listens_for(engine, "begin")
+        def do_begin(conn):
+            conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        if begin_immediate:
+            # 드라이버의 암묵적 BEGIN을 끄고 위의 begin 이벤트에서 직접 시작
+            dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+        cursor.execute(f"PRAGMA synchronous={settings.sqlite_synchronous}")
+        cursor.execute(f"PRAGMA busy_timeout={settings.sqlite_busy_timeout:d}")
+        cursor.execute(f"PRAGMA cache_size={settings.sqlite_cache_size:d}")
+        cursor.execute(f"PRAGMA mmap_size={settings.sqlite_mmap_size:d}")
+        if read_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+
+
+def _instrument(engine):
+    """SQL 문마다 실행 시간과 요청별 개수 기록 (metrics.py, GET /metrics)"""
+    if settings.metrics_enabled:
+        metrics.instrument(engine)
+
+
+# 동기 엔진: 마이그레이션, 초기 데이터, 벤치마크 스크립트용
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    **_engine_options(SQLALCHEMY_DATABASE_URL, settings.pool_size, settings.max_overflow)
 )
+_apply_sqlite_pragmas(engine)
+_instrument(engine)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
+# 비동기 엔진: API 요청 처리용 (DB 대기 중에도 이벤트 루프가 다른 요청을 처리)
+async_engine = create_async_engine(
+    settings.write_async_url,
+    **_engine_options(settings.write_async_url, settings.pool_size, settings.max_overflow)
+)
+_apply_sqlite_pragmas(async_engine.sync_engine)
+_instrument(async_engine.sync_engine)
+
+# GET 요청용 조회 전용 엔진: 쓰기와 풀을 나눠 쓰므로 쓰기가 몰려도 조회가 연결을 기다리지 않음
+if settings.read_pool_enabled:
+    read_async_engine = create_async_engine(
+        settings.read_async_url,
+        **_engine_options(settings.read_async_url, settings.read_pool_size, settings.read_max_overflow)
+    )
+    _apply_sqlite_pragmas(read_async_engine.sync_engine, read_only=True)
+    _instrument(read_async_engine.sync_engine)
+    if read_async_engine.dialect.name == "postgresql":
+        read_async_engine = read_async_engine.execution_options(postgresql_readonly=True)
+else:
+    read_async_engine = async_engine
 
+# 커밋 후 속성을 만료시키면 응답 직렬화 중 지연 로딩이 일어나므로 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    read_async_engine, autoflush=False, expire_on_commit=False
+)
+
+Base = declarative_base()
@@ -0,0 +1,123 @@
+"""
+구독 자격(활성 구독) 캐시
+
+예약할 때마다, 그리고 페이지마다 호출되는 사용자 구독 조회가 같은 구독 행을
+반복해서 읽지 않도록 사용자별 활성 구독을 프로세스 안에 보관합니다.
+
+유효한 구독: is_active이고 end_date가 없거나 아직 지나지 않은 구독.
+여러 개면 가장 늦게 끝나는 구독을 사용합니다 (end_date 없음이 가장 늦음).
+
+캐시 항목은 다음 중 먼저 오는 시점에 만료됩니다.
+    - 구독의 end_date
+    - 저장 후 ENTITLEMENT_CACHE_TTL초 (다른 워커나 스크립트에서 바뀐 구독의 최대 반영 지연)
+구독 생성/가져오기처럼 이 프로세스에서 구독을 바꾸는 경로는 커밋 후 바로 무효화합니다.
+구독이 없다는 결과는 저장하지 않으므로, 새로 구독한 사용자는 항상 바로 예약할 수 있습니다.
+"""
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy import or_, select
+
+from config import settings
+from models import Subscription
+from schemas import SubscriptionResponse
+
+
+def active_filter(now):
+    """now 시점에 유효한 구독 조건"""
+    return (
+        Subscription.is_active == True,
+        or_(Subscription.end_date.is_(None), Subscription.end_date > now),
+    )
+
+
+def active_subscription_query(user_id, now):
+    """사용자의 유효한 구독 중 가장 늦게 끝나는 것 (user_id, is_active 인덱스 사용)"""
+    return (
+        select(Subscription)
+        .where(Subscription.user_id == user_id, *active_filter(now))
+        .order_by(
+            Subscription.end_date.is_(None).desc(),
+            Subscription.end_date.desc(),
+            Subscription.id.desc(),
+        )
+        .limit(1)
+    )
+
+
+def active_subscription_id(user_id, now):
+    """다른 쿼리에 조인하기 위한 스칼라 서브쿼리 (바깥 쿼리의 subscriptions와 상관시키지 않음)"""
+    return (
+        active_subscription_query(user_id, now)
+        .with_only_columns(Subscription.id)
+        .correlate(None)
+        .scalar_subquery()
+    )
+
+
+class EntitlementCache:
+    """user_id -> 활성 구독 스냅샷(SubscriptionResponse) 스레드 안전 LRU"""
+
+    def __init__(self, ttl=60, max_entries=10000):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._entries = OrderedDict()  # user_id -> (cached_until, subscription)
+        self._lock = threading.Lock()
+
+    def get(self, user_id, now=None):
+        """유효한 구독 스냅샷, 없거나 만료되었으면 None"""
+        now = now or datetime.utcnow()
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                cached_until, subscription = entry
+                if time.monotonic() < cached_until and (
+                    subscription.end_date is None or subscription.end_date > now
+                ):
+                    self._entries.move_to_end(user_id)
+                    self.hits += 1
+                    return subscription
+                del self._entries[user_id]
+            self.misses += 1
+            return None
+
+    def set(self, subscription):
+        """조회한 유효 구독(ORM 객체)을 세션과 분리된 스냅샷으로 저장하고 반환"""
+        snapshot = SubscriptionResponse.model_validate(subscription, from_attributes=True)
+        if self.ttl <= 0:
+            return snapshot
+        with self._lock:
+            self._entries[snapshot.user_id] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(snapshot.user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, *user_ids):
+        with self._lock:
+            self.invalidations += 1
+            for user_id in user_ids:
+                self._entries.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self.invalidations += 1
+            self._entries.clear()
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "invalidations": self.invalidations,
+            "entries": len(self._entries),
+        }
+
+
+cache = EntitlementCache(settings.entitlement_cache_ttl, settings.entitlement_cache_max_entries)
@@ -0,0 +1,134 @@
+"""
+ETag / 조건부 GET
+
+쓰기 엔드포인트는 같은 트랜잭션 안에서 바뀐 리소스의 버전 카운터
+(resource_versions 테이블)를 올립니다. 조회 엔드포인트는 응답이 의존하는
+리소스들의 버전을 기본 키 조회 한 번으로 읽어 ETag를 만들고, 요청의
+If-None-Match와 같으면 본 쿼리와 직렬화 없이 304를 반환합니다.
+
+활동 목록은 응답 캐시에 저장된 본문의 해시를 ETag로 사용합니다 (for_body).
+모든 활동에 걸친 버전 키는 두지 않습니다. 쓰기마다 같은 행을 갱신하게 되어 (PostgreSQL에서는
+행 잠금 하나로) 모든 쓰기가 줄을 서고, 그 키를 쓰는 응답은 거의 304가 되지 않기 때문입니다.
+
+버전 키
+    activity:{id}               활동 한 건 (수정, 신청자/자원봉사자 수 변경)
+    activity:{id}:bookings      활동별 예약 목록
+    activity:{id}:volunteers    활동별 자원봉사자 목록
+    user:{id}:bookings          사용자별 예약 목록
+"""
+import hashlib
+from urllib.parse import urlencode
+
+from fastapi import Response
+from sqlalchemy import select
+
+from models import ResourceVersion
+
+def activity_key(activity_id):
+    return f"activity:{activity_id}"
+
+
+def activity_bookings_key(activity_id):
+    return f"activity:{activity_id}:bookings"
+
+
+def activity_volunteers_key(activity_id):
+    return f"activity:{activity_id}:volunteers"
+
+
+def user_bookings_key(user_id):
+    return f"user:{user_id}:bookings"
+
+
+# ==================== 버전 ====================
+
+def _insert(conn):
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(ResourceVersion.__table__)
+
+
+_bump_statements = {}  # DB 종류 → UPSERT 문 (키는 실행 파라미터로 넘겨 컴파일 캐시를 탐)
+
+
+def bump(conn, *keys):
+    """리소스 버전 증가 (없으면 1로 생성). 쓰기와 같은 트랜잭션에서 호출"""
+    keys = sorted(set(keys))
+    if not keys:
+        return
+    stmt = _bump_statements.get(conn.dialect.name)
+    if stmt is None:
+        stmt = _insert(conn).on_conflict_do_update(
+            index_elements=["key"], set_={"version": ResourceVersion.version + 1}
+        )
+        _bump_statements[conn.dialect.name] = stmt
+    conn.execute(stmt, [{"key": key, "version": 1} for key in keys])
+
+
+def current(conn, keys):
+    """{key: version} (한 번도 바뀌지 않은 리소스는 0)"""
+    rows = conn.execute(
+        select(ResourceVersion.key, ResourceVersion.version).where(ResourceVersion.key.in_(keys))
+    )
+    versions = dict.fromkeys(keys, 0)
+    versions.update(dict(rows.all()))
+    return versions
+
+
+# ==================== 조건부 요청 ====================
+
+class Validator:
+    """요청 하나의 ETag와 If-None-Match 일치 여부"""
+
+    def __init__(self, etag, not_modified):
+        self.etag = etag
+        self.not_modified = not_modified
+
+    def response(self):
+        """304 Not Modified 응답"""
+        return self.apply(Response(status_code=304))
+
+    def apply(self, response):
+        """응답에 ETag를 붙여 반환 (캐시된 Response나 주입받은 response 모두 가능)"""
+        response.headers["ETag"] = self.etag
+        # 브라우저가 저장된 응답을 쓰기 전에 항상 ETag로 재검증하도록 함
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+
+def _matches(if_none_match, etag):
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    # If-None-Match는 약한 비교 (W/ 접두사 무시)
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+
+def _validator(request, source):
+    etag = '"' + hashlib.sha1(source).hexdigest()[:20] + '"'
+    return Validator(etag, _matches(request.headers.get("if-none-match"), etag))
+
+
+def check(conn, request, *keys):
+    """
+    요청 URL(경로 + 정렬된 쿼리)과 리소스 버전으로 강한 ETag를 만들고
+    If-None-Match와 비교
+    """
+    versions = current(conn, keys)
+    params = urlencode(sorted(request.query_params.multi_items()))
+    source = f"{request.url.path}?{params}|" + ",".join(
+        f"{key}={versions[key]}" for key in sorted(versions)
+    )
+    return _validator(request, source.encode())
+
+
+def for_body(request, body):
+    """
+    응답 본문 해시로 만든 ETag
+
+    활동 목록은 어느 활동의 신청자 수가 바뀌어도 달라질 수 있어 버전 키 하나로는
+    너무 자주 바뀌므로, 태그로 정확히 무효화되는 캐시 본문의 해시를 사용합니다.
+    """
+    return _validator(request, body)
@@ -0,0 +1,157 @@
+"""
+운영 보고용 예약/자원봉사자 명단 내보내기 (CSV, NDJSON)
+
+목록 엔드포인트처럼 결과를 한꺼번에 불러와 리스트로 직렬화하지 않고,
+서버 측 커서(stream + yield_per)로 EXPORT_CHUNK_ROWS행씩 읽어 바로 인코딩해
+StreamingResponse로 내보냅니다. 행 수와 관계없이 메모리 사용량은 청크 하나 크기로
+일정합니다.
+
+응답이 끝날 때까지 세션을 열어 두어야 하므로 요청 의존성 세션 대신 스트림
+안에서 조회 전용 세션을 직접 엽니다.
+"""
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+
+from sqlalchemy import select
+
+from database import AsyncReadSessionLocal
+from models import Activity, ActivityBooking, User, Volunteer
+
+EXPORT_CHUNK_ROWS = 1000
+FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+# ==================== 쿼리 ====================
+
+def _filter_activities(query, activity_id, date_from, date_to):
+    """활동 id와 활동 일시(activity_date) 범위 필터"""
+    if activity_id is not None:
+        query = query.where(Activity.id == activity_id)
+    if date_from is not None:
+        query = query.where(Activity.activity_date >= date_from)
+    if date_to is not None:
+        query = query.where(Activity.activity_date < date_to)
+    return query
+
+
+def bookings_query(activity_id=None, date_from=None, date_to=None):
+    query = (
+        select(
+            ActivityBooking.id.label("booking_id"),
+            ActivityBooking.booking_date,
+            Activity.id.label("activity_id"),
+            Activity.title.label("activity_title"),
+            Activity.activity_date,
+            Activity.location,
+            User.id.label("user_id"),
+            User.name.label("user_name"),
+            User.email.label("user_email"),
+            User.phone.label("user_phone"),
+            ActivityBooking.notes,
+        )
+        .join(Activity, ActivityBooking.activity_id == Activity.id)
+        .join(User, ActivityBooking.user_id == User.id)
+    )
+    query = _filter_activities(query, activity_id, date_from, date_to)
+    return query.order_by(ActivityBooking.id)
+
+
+def volunteers_query(activity_id=None, date_from=None, date_to=None):
+    query = (
+        select(
+            Volunteer.id.label("volunteer_id"),
+            Volunteer.created_at,
+            Activity.id.label("activity_id"),
+            Activity.title.label("activity_title"),
+            Activity.activity_date,
+            Activity.location,
+            Volunteer.name,
+            Volunteer.email,
+            Volunteer.phone,
+            Volunteer.availability,
+            Volunteer.experience,
+        )
+        .join(Activity, Volunteer.activity_id == Activity.id)
+    )
+    query = _filter_activities(query, activity_id, date_from, date_to)
+    return query.order_by(Volunteer.id)
+
+
+# ==================== 인코딩 ====================
+
+def _value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+class CsvEncoder:
+    def __init__(self, columns):
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer)
+        # 엑셀에서 한글이 깨지지 않도록 BOM을 붙임 (일괄 가져오기에서는 BOM을 무시함)
+        self._buffer.write("﻿")
+        self._writer.writerow(columns)
+
+    def encode(self, rows):
+        self._writer.writerows([_value(value) for value in row] for row in rows)
+        data = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return data.encode()
+
+
+class NdjsonEncoder:
+    def __init__(self, columns):
+        self._columns = columns
+
+    def encode(self, rows):
+        return "".join(
+            json.dumps(
+                {name: _value(value) for name, value in zip(self._columns, row)},
+                ensure_ascii=False,
+            ) + "\n"
+            for row in rows
+        ).encode()
+
+
+ENCODERS = {"csv": CsvEncoder, "ndjson": NdjsonEncoder}
+
+
+async def stream(query, fmt, compress=False, chunk_rows=EXPORT_CHUNK_ROWS):
+    """쿼리 결과를 fmt 형식 바이트 청크로 (compress면 gzip 스트림)"""
+    columns = [column.name for column in query.selected_columns]
+    encoder = ENCODERS[fmt](columns)
+    compressor = zlib.compressobj(wbits=31) if compress else None  # wbits=31: gzip 헤더
+
+    def output(data):
+        return compressor.compress(data) if compressor else data
+
+    async with AsyncReadSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=chunk_rows))
+        # 행이 없어도 CSV 헤더는 내보냄
+        first = encoder.encode([])
+        if first:
+            yield output(first)
+        async for rows in result.partitions():
+            data = output(encoder.encode(rows))
+            if data:
+                yield data
+    if compressor:
+        yield compressor.flush()
+
+
+def filename(resource, fmt, activity_id=None, date_from=None, date_to=None):
+    """내려받을 파일 이름 (예: bookings-activity-3.csv, volunteers-20261001-20261101.ndjson)"""
+    parts = [resource]
+    if activity_id is not None:
+        parts.append(f"activity-{activity_id}")
+    if date_from is not None or date_to is not None:
+        parts.append(
+            "-".join(value.strftime("%Y%m%d") if value else "" for value in (date_from, date_to))
+        )
+    return "-".join(parts) + "." + fmt
@@ -0,0 +1,178 @@
+"""
+목록 응답 직렬화 (ORM 객체와 행별 스키마 검증 없이 행 튜플 → JSON)
+
+목록 엔드포인트는 ORM 객체를 만들어 응답 스키마로 행마다 검증(from_attributes)한 뒤
+직렬화하는 대신, 스키마 필드에 해당하는 컬럼만 SELECT한 행 튜플을 dict로 옮기고
+페이지 전체를 한 번에 인코딩합니다. 행 수에 비례하는 비용(식별 맵 등록, 속성 계측,
+필드별 검증)이 빠지므로 페이지가 클수록 차이가 커집니다
+(benchmarks/list_serialization.py).
+
+RowSchema는 응답 스키마의 필드 순서와 타입으로 SELECT할 컬럼과 값 변환을 정해
+기존 직렬화와 같은 JSON을 만듭니다.
+    - 필드 순서는 스키마 순서 (상속한 필드가 먼저, 관계 필드는 마지막)
+    - float 필드는 float로 (20000 → 20000.0), datetime은 ISO 8601 문자열
+    - EmailStr은 pydantic과 같은 정규화 (도메인 소문자 등)
+    - 관계 필드는 expand로 요청한 경우만 채우고 나머지는 null
+변환을 모르는 타입의 필드가 스키마에 생기면 import 시 TypeError가 나므로 _CONVERTERS에 추가합니다.
+
+인코딩은 orjson이 설치되어 있으면 orjson을, 없으면 표준 json을 사용합니다
+(지수 표기가 필요한 아주 크거나 작은 float는 표기가 다를 수 있지만 같은 값입니다).
+"""
+import copy
+import json
+import re
+import typing
+from datetime import datetime
+from functools import lru_cache
+
+from fastapi import Response
+from pydantic import EmailStr
+from pydantic.networks import validate_email
+from sqlalchemy import select
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"JSON으로 변환할 수 없는 값입니다: {type(value).__name__}")
+
+
+def dumps(value):
+    """JSON 바이트 (FastAPI 기본 응답과 같이 공백 없는 UTF-8)"""
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(
+        value, ensure_ascii=False, separators=(",", ":"), default=_default
+    ).encode()
+
+
+def response(value):
+    return Response(content=dumps(value), media_type="application/json")
+
+
+# ==================== 필드 변환 ====================
+
+def _float(value):
+    return None if value is None else float(value)
+
+
+# 이미 정규화된 형태의 ASCII 주소 (소문자 도메인, 국제화 도메인 아님)는 검증 결과가 같은 값이므로 생략
+_NORMALIZED_EMAIL = re.compile(
+    r"[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@(?!xn--)[a-z0-9-]+(\.(?!xn--)[a-z0-9-]+)+"
+)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_email(value):
+    if len(value) <= 254 and _NORMALIZED_EMAIL.fullmatch(value):
+        return value
+    try:
+        return validate_email(value)[1]
+    except Exception:
+        return value  # 검증을 거치지 않고 저장된 값은 그대로
+
+
+def _email(value):
+    return None if value is None else _normalize_email(value)
+
+
+_CONVERTERS = {float: _float, EmailStr: _email}
+_PASSTHROUGH = (int, str, bool, datetime)
+
+
+def _unwrap_optional(annotation):
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+# ==================== 행 → dict ====================
+
+class RowSchema:
+    """
+    응답 스키마 하나를 모델 컬럼 SELECT와 행 → dict 변환으로 옮긴 것
+
+    relations는 {관계 필드: (RowSchema, 외래 키 필드)}이며, expand로 요청한 관계는
+    페이지 전체의 외래 키로 IN 쿼리를 한 번씩 실행해 채웁니다 (selectinload와 같은 쿼리 수).
+    expressions는 모델 컬럼이 아닌 필드의 SQL 식입니다 ({"description_preview": substr(...)}).
+    """
+
+    def __init__(self, schema, model, relations=None, expressions=None):
+        self.schema = schema
+        self.model = model
+        self.relations = relations or {}
+        names = list(schema.model_fields)
+        if set(names[len(names) - len(self.relations):]) != set(self.relations):
+            raise TypeError(f"{schema.__name__}: 관계 필드는 스키마의 마지막 필드여야 합니다")
+        self.relation_names = names[len(names) - len(self.relations):]
+
+        self.fields = []  # (필드 이름, 변환 함수 또는 None)
+        for name, field in schema.model_fields.items():
+            if name in self.relations:
+                continue
+            annotation = _unwrap_optional(field.annotation)
+            if annotation in _CONVERTERS:
+                self.fields.append((name, _CONVERTERS[annotation]))
+            elif annotation in _PASSTHROUGH:
+                self.fields.append((name, None))
+            else:
+                raise TypeError(f"{schema.__name__}.{name}: 변환할 수 없는 필드 타입 {annotation}")
+        expressions = expressions or {}
+        self.columns = [
+            expressions[name].label(name) if name in expressions else getattr(model, name)
+            for name, _ in self.fields
+        ]
+
+    @property
+    def names(self):
+        return [name for name, _ in self.fields]
+
+    def subset(self, names):
+        """names에 있는 필드만 SELECT하는 RowSchema (스키마 순서 유지, 관계 제외)"""
+        rows = copy.copy(self)
+        selected = [
+            (field, column) for field, column in zip(self.fields, self.columns) if field[0] in names
+        ]
+        rows.fields = [field for field, _ in selected]
+        rows.columns = [column for _, column in selected]
+        rows.relations = {}
+        rows.relation_names = []
+        return rows
+
+    def item(self, row):
+        """SELECT *self.columns 결과 행(뒤에 붙은 컬럼은 무시) 하나를 응답 dict로"""
+        item = {
+            name: value if convert is None else convert(value)
+            for (name, convert), value in zip(self.fields, row)
+        }
+        for name in self.relation_names:
+            item[name] = None
+        return item
+
+    def from_object(self, obj):
+        """이미 불러온 ORM 객체 하나를 응답 dict로"""
+        return self.item([getattr(obj, name) for name, _ in self.fields])
+
+    def load(self, conn, ids):
+        """id 목록의 행을 {id: 응답 dict}로"""
+        rows = conn.execute(select(*self.columns).where(self.model.id.in_(ids)))
+        return {item["id"]: item for item in map(self.item, rows)}
+
+    def items(self, conn, rows, expand=()):
+        """한 페이지의 행을 응답 dict 목록으로 (expand한 관계는 IN 쿼리로 채움)"""
+        items = [self.item(row) for row in rows]
+        for name in expand:
+            related, key = self.relations[name]
+            ids = sorted({item[key] for item in items if item[key] is not None})
+            found = related.load(conn, ids) if ids else {}
+            for item in items:
+                item[name] = found.get(item[key])
+        return items
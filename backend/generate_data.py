@@ -0,0 +1,306 @@
+"""
+부하 테스트용 대량 데이터 생성 스크립트
+
+init_data.py의 샘플 몇 건으로는 운영 규모의 쿼리 계획과 지연을 재현할 수 없으므로,
+사용자 수를 기준으로 활동, 구독, 예약, 자원봉사자를 비율에 맞춰 만들어 한 번에 저장합니다.
+
+    1k      사용자 1,000명      활동 100개       (몇 초)
+    100k    사용자 100,000명    활동 10,000개
+    1m      사용자 1,000,000명  활동 100,000개   (예약 약 50만 건)
+
+- 지역: 시니어 인구가 많은 시/군/구 위주의 가중치로 주소를 고르고, regions 테이블에
+  지역을 미리 만든 뒤 region_id를 함께 저장합니다.
+- 예약: 활동마다 정원의 일부를 채우며 인기 활동일수록 많이 채웁니다.
+  활동의 booking_count/volunteer_count는 만든 행 수와 같게 저장합니다.
+- 자원봉사자: 활동의 지역과 가능 시간 문자열을 해석한 구간(volunteer_slots)을 함께 저장합니다.
+  --volunteers로 전체 수를 정하면 활동마다 0~2배 평균 사이에서 고릅니다 (매칭 부하 테스트용).
+- ORM 대신 Core INSERT를 CHUNK_SIZE 행씩 executemany로 실행하고, id를 직접 지정해
+  RETURNING 없이 예약/구독이 참조할 id를 정합니다. 기존 데이터 뒤에 이어서 추가합니다.
+- 저장 후 검색 색인과 통계 요약을 갱신하므로 바로 API로 조회할 수 있습니다.
+
+사용법:
+    cd backend
+    python generate_data.py --scale 100k
+    python generate_data.py --users 5000 --seed 7
+    python generate_data.py --scale 100k --volunteers 100000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import func, select, text
+
+import availability
+import lifecycle
+import regions
+import search
+import stats
+from models import Activity, ActivityBooking, Subscription, User, Volunteer, VolunteerSlot
+
+SCALES = {"1k": 1_000, "100k": 100_000, "1m": 1_000_000}
+CHUNK_SIZE = 5000
+
+ACTIVITIES_PER_USER = 0.1
+SUBSCRIBER_RATIO = 0.4
+ACTIVE_SUBSCRIPTION_RATIO = 0.85
+
+# (주소, 가중치) - 65세 이상 인구가 많은 시/군/구 위주
+ADDRESSES = [
+    ("서울시 노원구", 6), ("서울시 송파구", 6), ("서울시 강서구", 6), ("서울시 은평구", 5),
+    ("서울시 강남구", 5), ("서울시 관악구", 5), ("서울시 서초구", 4), ("서울시 마포구", 4),
+    ("서울시 종로구", 2), ("서울시 중랑구", 4), ("서울시 성북구", 4), ("서울시 도봉구", 3),
+    ("부산시 해운대구", 5), ("부산시 부산진구", 4), ("부산시 사하구", 3), ("부산시 동래구", 3),
+    ("대구시 달서구", 4), ("대구시 수성구", 3), ("인천시 남동구", 4), ("인천시 부평구", 4),
+    ("광주시 북구", 3), ("대전시 서구", 3), ("울산시 남구", 2), ("세종시", 1),
+    ("경기도 수원시", 6), ("경기도 고양시", 6), ("경기도 성남시 분당구", 4), ("경기도 용인시", 5),
+    ("경기도 부천시", 4), ("경기도 남양주시", 3), ("경기도 안산시", 3), ("경기도 의정부시", 2),
+    ("강원도 춘천시", 2), ("강원도 강릉시", 2), ("충북 청주시", 3), ("충남 천안시", 3),
+    ("전북 전주시", 3), ("전남 순천시", 2), ("경북 포항시", 3), ("경북 경주시", 2),
+    ("경남 창원시", 4), ("경남 김해시", 3), ("제주도 제주시", 2), ("제주도 서귀포시", 1),
+]
+PLACES = ["문화센터", "복지관", "주민센터", "평생학습관", "공방", "체육센터"]
+
+# (카테고리, 가중치, 제목 목록, 정원 범위, 가격 범위)
+CATEGORIES = [
+    ("도예/공예", 14, ["도자기 만들기", "가죽 공예", "천연 비누 만들기"], (6, 12), (30000, 60000)),
+    ("수영", 12, ["실버 수영 교실", "아쿠아로빅"], (10, 25), (20000, 40000)),
+    ("요가/필라테스", 16, ["시니어 요가", "의자 필라테스", "명상과 스트레칭"], (10, 30), (15000, 35000)),
+    ("음악/악기", 12, ["우쿨렐레 입문", "합창단", "하모니카 교실"], (8, 30), (20000, 40000)),
+    ("요리 클래스", 12, ["건강 반찬 만들기", "제철 요리", "전통 떡 만들기"], (6, 15), (30000, 55000)),
+    ("커피 시음", 8, ["핸드드립 커피", "원두 시음회"], (6, 12), (20000, 35000)),
+    ("원예", 10, ["텃밭 가꾸기", "꽃꽂이", "다육 식물 키우기"], (8, 20), (15000, 30000)),
+    ("독서 모임", 8, ["고전 읽기 모임", "에세이 쓰기"], (6, 15), (0, 10000)),
+    ("스마트폰 교실", 8, ["스마트폰 기초", "사진 찍기와 편집"], (10, 25), (0, 15000)),
+]
+INSTRUCTORS = ["김", "이", "박", "최", "정", "강", "조", "윤", "장", "임"]
+FAMILY_NAMES = INSTRUCTORS + ["한", "오", "서", "신", "권", "황"]
+GIVEN_NAMES = ["영수", "영희", "순자", "정숙", "철수", "명숙", "광수", "옥순", "영호", "미경"]
+PLANS = [("monthly", 7, 30), ("annual", 3, 365)]
+# (가능 시간 문자열, 가중치)
+AVAILABILITIES = [
+    ("평일 오전", 5), ("평일 오후", 5), ("주말", 3), ("언제나", 2), ("월수금 오전", 3),
+    ("화목 13:00-17:00", 3), ("토 10:00-16:00", 2), ("월~금 9시-17시", 2), ("평일 저녁", 1),
+]
+
+
+def _chunks(rows, size=CHUNK_SIZE):
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _next_id(conn, model):
+    return (conn.execute(select(func.max(model.id))).scalar() or 0) + 1
+
+
+def _insert_rows(conn, model, rows):
+    count = 0
+    for chunk in _chunks(rows):
+        conn.execute(model.__table__.insert(), chunk)
+        count += len(chunk)
+    return count
+
+
+def _reset_sequences(conn, models):
+    """id를 직접 지정해 넣었으므로 PostgreSQL 시퀀스를 최댓값 뒤로 옮김"""
+    if conn.dialect.name != "postgresql":
+        return
+    for model in models:
+        table = model.__tablename__
+        conn.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 1) FROM {table}))"
+        ))
+
+
+def _resolve_addresses(conn):
+    return {address: regions.resolve(conn, address) for address, _ in ADDRESSES}
+
+
+def generate(conn, users, activities=None, seed=0, now=None, volunteers=None):
+    """
+    사용자 users명 규모의 데이터를 conn의 트랜잭션에 추가하고 테이블별 행 수 반환
+
+    activities를 주지 않으면 사용자 10명당 활동 하나를, volunteers를 주지 않으면
+    활동마다 자원봉사자 0~3명을 만듭니다.
+    """
+    rng = random.Random(seed)
+    now = now or datetime.utcnow()
+    activities = activities if activities is not None else max(1, int(users * ACTIVITIES_PER_USER))
+    region_ids = _resolve_addresses(conn)
+    addresses = [address for address, _ in ADDRESSES]
+    address_weights = [weight for _, weight in ADDRESSES]
+    first_user = _next_id(conn, User)
+    first_activity = _next_id(conn, Activity)
+    first_volunteer = _next_id(conn, Volunteer)
+    per_activity = volunteers / activities if volunteers is not None else None
+    availability_texts = [text for text, _ in AVAILABILITIES]
+    availability_weights = [weight for _, weight in AVAILABILITIES]
+    slots_by_text = {
+        text: availability.normalize(availability.parse(text)) for text in availability_texts
+    }
+    volunteer_slots = []  # (volunteer_id, 가능 시간 문자열)
+    user_ids = range(first_user, first_user + users)
+
+    def user_rows():
+        for user_id in user_ids:
+            address = rng.choices(addresses, address_weights)[0]
+            yield {
+                "id": user_id,
+                "name": rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES),
+                "email": f"user{user_id}@example.com",
+                "phone": f"010-{rng.randrange(10000):04d}-{rng.randrange(10000):04d}",
+                "age": rng.randint(60, 90),
+                "address": f"{address} {rng.randint(1, 300)}",
+                "region_id": region_ids[address],
+                "created_at": now - timedelta(days=rng.randint(0, 730)),
+            }
+
+    # 활동마다 신청자/자원봉사자 수를 먼저 정하고 같은 수만큼 예약/자원봉사자 행을 만듦
+    plan = []
+    category_weights = [category[1] for category in CATEGORIES]
+
+    def activity_rows():
+        for activity_id in range(first_activity, first_activity + activities):
+            category, _, titles, capacity_range, price_range = rng.choices(CATEGORIES, category_weights)[0]
+            address = rng.choices(addresses, address_weights)[0]
+            max_participants = rng.randint(*capacity_range)
+            created_at = now - timedelta(days=rng.randint(1, 180), minutes=rng.randint(0, 1439))
+            activity_date = max(
+                now + timedelta(days=rng.randint(-60, 90), hours=rng.choice([10, 14, 16])),
+                created_at + timedelta(days=7),
+            )
+            # 인기도(0~1)의 제곱에 비례해 정원을 채움 - 대부분 한산하고 일부가 마감에 가까움
+            booking_count = min(int(max_participants * rng.random() ** 2 * 1.1), max_participants, users)
+            if per_activity is None:
+                volunteer_count = rng.choices([0, 1, 2, 3], [3, 4, 2, 1])[0]
+            else:
+                volunteer_count = rng.randint(0, round(2 * per_activity))
+            plan.append((
+                activity_id, booking_count, volunteer_count, created_at, activity_date, region_ids[address]
+            ))
+            yield {
+                "id": activity_id,
+                "title": f"{rng.choice(titles)} {activity_id}",
+                "description": f"{address} {rng.choice(PLACES)}에서 진행하는 시니어 {category} 프로그램입니다.",
+                "category": category,
+                "location": f"{address} {rng.choice(PLACES)}",
+                "region_id": region_ids[address],
+                "instructor": f"{rng.choice(INSTRUCTORS)}강사",
+                "max_participants": max_participants,
+                "duration_minutes": rng.choice([60, 90, 120]),
+                "price": float(rng.randrange(price_range[0], price_range[1] + 1, 5000)),
+                "created_at": created_at,
+                "activity_date": activity_date,
+                "is_past": lifecycle.is_past(activity_date, now),
+                "booking_count": booking_count,
+                "volunteer_count": volunteer_count,
+            }
+
+    def booking_rows():
+        for activity_id, booking_count, _, created_at, activity_date, _ in plan:
+            latest = min(now, activity_date)
+            span = max(1, int((latest - created_at).total_seconds()))
+            for user_id in rng.sample(user_ids, booking_count):
+                yield {
+                    "user_id": user_id,
+                    "activity_id": activity_id,
+                    "booking_date": created_at + timedelta(seconds=rng.randrange(span)),
+                }
+
+    def volunteer_rows():
+        volunteer_id = first_volunteer
+        for activity_id, _, volunteer_count, created_at, _, region_id in plan:
+            for i in range(volunteer_count):
+                name = rng.choice(FAMILY_NAMES) + rng.choice(GIVEN_NAMES)
+                text = rng.choices(availability_texts, availability_weights)[0]
+                volunteer_slots.append((volunteer_id, text))
+                yield {
+                    "id": volunteer_id,
+                    "activity_id": activity_id,
+                    "name": name,
+                    "email": f"volunteer{activity_id}-{i}@example.com",
+                    "availability": text,
+                    "region_id": region_id,
+                    "created_at": created_at + timedelta(days=rng.randint(0, 7)),
+                }
+                volunteer_id += 1
+
+    def slot_rows():
+        for volunteer_id, text in volunteer_slots:
+            yield from availability.slot_rows(volunteer_id, slots_by_text[text])
+
+    def subscription_rows():
+        plan_names = [name for name, _, _ in PLANS]
+        plan_weights = [weight for _, weight, _ in PLANS]
+        plan_days = {name: days for name, _, days in PLANS}
+        for user_id in user_ids:
+            if rng.random() >= SUBSCRIBER_RATIO:
+                continue
+            plan_type = rng.choices(plan_names, plan_weights)[0]
+            active = rng.random() < ACTIVE_SUBSCRIPTION_RATIO
+            days = plan_days[plan_type]
+            # 활성 구독은 아직 끝나지 않았고, 나머지는 이미 끝나 비활성화된 구독
+            start_date = now - timedelta(days=rng.randint(0, days - 1) if active else rng.randint(days + 1, days * 2))
+            yield {
+                "user_id": user_id,
+                "plan_type": plan_type,
+                "start_date": start_date,
+                "end_date": start_date + timedelta(days=days),
+                "is_active": active,
+                "created_at": start_date,
+            }
+
+    counts = {
+        "users": _insert_rows(conn, User, user_rows()),
+        "activities": _insert_rows(conn, Activity, activity_rows()),
+        "subscriptions": _insert_rows(conn, Subscription, subscription_rows()),
+        "bookings": _insert_rows(conn, ActivityBooking, booking_rows()),
+        "volunteers": _insert_rows(conn, Volunteer, volunteer_rows()),
+        "volunteer_slots": _insert_rows(conn, VolunteerSlot, slot_rows()),
+    }
+    _reset_sequences(conn, [User, Activity, Volunteer])
+
+    if search.is_available(conn):
+        query = select(Activity.id, *[getattr(Activity, name) for name in search.FTS_COLUMNS])
+        result = conn.execute(
+            query.where(Activity.id >= first_activity).execution_options(yield_per=CHUNK_SIZE)
+        )
+        for rows in result.partitions():
+            search.index_rows(conn, rows)
+    stats.rebuild(conn)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="부하 테스트용 대량 데이터 생성")
+    parser.add_argument("--scale", choices=sorted(SCALES), default="1k")
+    parser.add_argument("--users", type=int, help="사용자 수 (--scale 대신 직접 지정)")
+    parser.add_argument("--activities", type=int, help="활동 수 (기본: 사용자 10명당 1개)")
+    parser.add_argument("--volunteers", type=int, help="자원봉사자 수 (기본: 활동마다 0~3명)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    import migrations
+    from database import engine
+
+    migrations.upgrade()
+    users = args.users if args.users is not None else SCALES[args.scale]
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        counts = generate(conn, users, args.activities, args.seed, volunteers=args.volunteers)
+    elapsed = time.perf_counter() - started
+
+    print(f"✅ 데이터 생성 완료 ({elapsed:.1f}초)")
+    for name, count in counts.items():
+        print(f"   - {name}: {count:,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+구독 만료와 지난 활동 정리 (백그라운드 작업 본체)
+
+요청마다 end_date/activity_date를 현재 시각과 비교하는 대신, 주기적으로
+집합 단위 UPDATE 한 번씩으로 상태 컬럼을 갱신합니다.
+
+    expire_subscriptions    end_date가 지난 활성 구독의 is_active = false
+    mark_past_activities    activity_date가 지난 활동의 is_past = true
+
+두 UPDATE 모두 RETURNING으로 바뀐 행을 받아, 커밋 후 해당 사용자의 구독 자격
+캐시와 해당 활동의 응답 캐시만 무효화합니다. 실행 주기와 실행 권한은 scheduler.py가
+관리합니다.
+
+새로 저장되는 활동(ORM, 일괄 가져오기)은 저장 시점에 is_past를 계산하므로,
+일시를 미래로 옮긴 활동이 계속 지난 활동으로 남지 않습니다.
+"""
+from datetime import datetime
+
+from sqlalchemy import event, update
+
+import entitlements
+import etags
+import stats
+from cache import ACTIVITY_LIST_TAG, CATEGORIES_TAG, activity_tag, response_cache
+from models import Activity, Subscription
+
+
+def is_past(activity_date, now=None):
+    return activity_date is not None and activity_date < (now or datetime.utcnow())
+
+
+@event.listens_for(Activity, "before_insert")
+@event.listens_for(Activity, "before_update")
+def _set_is_past(mapper, connection, target):
+    target.is_past = is_past(target.activity_date)
+
+
+# ==================== 구독 만료 ====================
+
+def expire_subscriptions(conn, now):
+    """end_date가 지난 활성 구독을 비활성화하고 해당 사용자 id 목록 반환"""
+    expired = conn.execute(
+        update(Subscription)
+        .where(Subscription.is_active == True, Subscription.end_date <= now)
+        .values(is_active=False)
+        .returning(Subscription.user_id, Subscription.plan_type)
+    ).all()
+    stats.add_subscriptions(conn, [plan_type for _, plan_type in expired], -1)
+    return [user_id for user_id, _ in expired]
+
+
+def subscriptions_expired(user_ids):
+    """커밋 후: 다른 워커의 캐시 항목은 end_date로 스스로 만료됨"""
+    if user_ids:
+        entitlements.cache.invalidate(*set(user_ids))
+
+
+# ==================== 지난 활동 ====================
+
+def mark_past_activities(conn, now):
+    """activity_date가 지난 활동을 표시하고 id 목록 반환 (같은 트랜잭션에서 요약과 ETag 버전 갱신)"""
+    passed = conn.execute(
+        update(Activity)
+        .where(Activity.is_past == False, Activity.activity_date < now)
+        .values(is_past=True)
+        .returning(Activity.id, Activity.category, Activity.region_id)
+    ).all()
+    if passed:
+        stats.activities_passed(conn, [(category, region_id) for _, category, region_id in passed])
+        etags.bump(conn, *[etags.activity_key(activity_id) for activity_id, _, _ in passed])
+    return [activity_id for activity_id, _, _ in passed]
+
+
+def activities_passed(activity_ids):
+    """커밋 후: 목록에서 빠지므로 목록 전체, 카테고리별 활동 수, 해당 활동 상세를 무효화"""
+    if activity_ids:
+        response_cache.invalidate(
+            ACTIVITY_LIST_TAG, CATEGORIES_TAG,
+            *[activity_tag(activity_id) for activity_id in activity_ids]
+        )
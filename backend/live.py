@@ -0,0 +1,149 @@
+"""
+신청자 수 실시간 전송 (Server-Sent Events)
+
+예약/취소가 커밋되면 바뀐 활동의 신청자 수를 구독자에게 바로 보냅니다.
+클라이언트는 목록을 다시 받아오는 대신 EventSource로 한 번 연결해 두고
+변경분만 받습니다.
+
+    GET /api/live/booking-counts?activity_ids=1,2,3          활동별 구독
+    GET /api/live/booking-counts?category=수영&region=강남구   목록 필터 구독 (활동 목록과 같은 필터)
+
+구독자마다 큐 대신 "활동 id -> 최신 신청자 수" 사전을 두고, 전송 전에 쌓인
+변경을 하나의 메시지로 합칩니다. 신청이 몰려도 구독자당 메모리는 구독한 활동 수를
+넘지 않고, 느린 클라이언트 때문에 발행 쪽이 막히지 않습니다. 유휴 연결은 코루틴 하나와
+대기 중인 이벤트 하나만 차지합니다.
+
+구독 관리는 프로세스 안에서 이루어지므로, 여러 워커로 실행할 때는 같은 워커에서
+커밋된 변경만 전달됩니다.
+"""
+import asyncio
+import json
+
+HEARTBEAT_SECONDS = 15
+RETRY_MILLISECONDS = 5000
+
+
+class Subscriber:
+    """연결 하나의 구독 조건과 아직 보내지 않은 변경"""
+
+    def __init__(self, activity_ids=None, category=None, region_ids=None):
+        self.activity_ids = activity_ids  # None이면 필터 구독
+        self.category = category
+        self.region_ids = region_ids  # None이면 지역 조건 없음
+        self.pending = {}  # activity_id -> {"booking_count", "delta"}
+        self.ready = asyncio.Event()
+        self.closed = False
+
+    def matches(self, category, region_id):
+        if self.category is not None and category != self.category:
+            return False
+        return self.region_ids is None or region_id in self.region_ids
+
+    def push(self, activity_id, booking_count, delta):
+        change = self.pending.get(activity_id)
+        if change is None:
+            self.pending[activity_id] = {"booking_count": booking_count, "delta": delta}
+        else:
+            # 보내기 전에 여러 번 바뀌었으면 마지막 값과 변화량 합계만 보냄
+            change["booking_count"] = booking_count
+            change["delta"] += delta
+        self.ready.set()
+
+    def take(self):
+        changes, self.pending = self.pending, {}
+        self.ready.clear()
+        return changes
+
+
+class Broadcaster:
+    """
+    구독자 색인과 발행
+
+    활동별 구독은 활동 id로, 필터 구독은 카테고리(없으면 전체)로 색인해
+    변경 하나를 보낼 때 관련된 구독자만 확인합니다.
+    """
+
+    def __init__(self):
+        self._by_activity = {}  # activity_id -> {Subscriber}
+        self._by_category = {}  # category(None은 전체) -> {Subscriber}
+        self.subscriber_count = 0
+        self.published = 0
+
+    def subscribe(self, subscriber):
+        self.subscriber_count += 1
+        if subscriber.activity_ids is not None:
+            for activity_id in subscriber.activity_ids:
+                self._by_activity.setdefault(activity_id, set()).add(subscriber)
+        else:
+            self._by_category.setdefault(subscriber.category, set()).add(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        self.subscriber_count -= 1
+        subscriber.closed = True
+        if subscriber.activity_ids is not None:
+            for activity_id in subscriber.activity_ids:
+                subs = self._by_activity.get(activity_id)
+                if subs is not None:
+                    subs.discard(subscriber)
+                    if not subs:
+                        del self._by_activity[activity_id]
+        else:
+            subs = self._by_category.get(subscriber.category)
+            if subs is not None:
+                subs.discard(subscriber)
+                if not subs:
+                    del self._by_category[subscriber.category]
+
+    def publish(self, activity_id, booking_count, delta, category=None, region_id=None):
+        """커밋 후 호출 (이벤트 루프 안에서만, 대기하지 않음)"""
+        self.published += 1
+        for subscriber in self._by_activity.get(activity_id, ()):
+            subscriber.push(activity_id, booking_count, delta)
+        candidates = list(self._by_category.get(None, ()))
+        if category is not None:
+            candidates.extend(self._by_category.get(category, ()))
+        for subscriber in candidates:
+            if subscriber.matches(category, region_id):
+                subscriber.push(activity_id, booking_count, delta)
+
+
+def _message(event, data):
+    payload = json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n".encode()
+
+
+async def stream(broadcaster, subscriber, load_snapshot=None):
+    """
+    SSE 바이트 스트림
+
+    구독을 먼저 등록한 뒤 load_snapshot()으로 현재 신청자 수({activity_id: count})를
+    읽어 보내므로, 페이지를 불러온 뒤 연결하기 전까지의 변경도 놓치지 않습니다.
+    변경이 없으면 HEARTBEAT_SECONDS마다 주석 줄을 보내 프록시가 연결을 끊지 않게 합니다.
+    """
+    broadcaster.subscribe(subscriber)
+    try:
+        yield f"retry: {RETRY_MILLISECONDS}\n\n".encode()
+        snapshot = await load_snapshot() if load_snapshot else None
+        if snapshot:
+            yield _message("snapshot", [
+                {"activity_id": activity_id, "booking_count": count}
+                for activity_id, count in snapshot.items()
+            ])
+        while not subscriber.closed:
+            try:
+                await asyncio.wait_for(subscriber.ready.wait(), HEARTBEAT_SECONDS)
+            except asyncio.TimeoutError:
+                yield b": ping\n\n"
+                continue
+            changes = subscriber.take()
+            if changes:
+                yield _message("booking_counts", [
+                    {"activity_id": activity_id, **change}
+                    for activity_id, change in changes.items()
+                ])
+    finally:
+        broadcaster.unsubscribe(subscriber)
+
+
+broadcaster = Broadcaster()
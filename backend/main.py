@@ -1,27 +1,70 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from sqlalchemy import delete, exists, func, insert, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional
-from datetime import datetime
+from typing import List, Literal, Optional, Union
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+import heapq
 import uvicorn
 
-from database import SessionLocal, engine, Base
-from models import Activity, User, Subscription, ActivityBooking, Volunteer
+from cache import (
+    response_cache, activity_tag, ACTIVITY_LIST_TAG, CATEGORIES_TAG,
+    LIST_TTL, DETAIL_TTL, CATEGORIES_TTL,
+)
+from config import settings
+from database import AsyncReadSessionLocal, AsyncSessionLocal, async_engine, read_async_engine
+from models import Activity, User, Subscription, ActivityBooking, Volunteer, VolunteerSlot, Region
+from pagination import paginate, DEFAULT_LIMIT, MAX_LIMIT
+import availability
+import bulk_import
+import entitlements
+import etags
+import exports
+import fastjson
+import live
+import metrics
+import regions
+import search
+import stats
+from scheduler import scheduler
+from write_queue import write_queue
 from schemas import (
-    ActivityCreate, ActivityResponse, ActivityUpdate,
+    ActivityCreate, ActivityResponse, ActivitySummary, ActivityUpdate, ActivityPage,
+    ActivitySummaryPage, ActivityFieldsPage,
     UserCreate, UserResponse,
     SubscriptionCreate, SubscriptionResponse,
-    BookingCreate, BookingResponse,
-    VolunteerCreate, VolunteerResponse
+    BookingCreate, BookingResponse, BookingDetail, BookingPage,
+    VolunteerCreate, VolunteerResponse, VolunteerDetail, VolunteerPage,
+    VolunteerCandidates, UnstaffedActivityPage,
+    ActivityDetailBundle, RegionResponse, CategoryList, CalendarMonth, ImportResult,
+    CategoryStat, RegionStat, SubscriptionPlanStat
 )
 
-# 데이터베이스 테이블 생성
-Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 구독 만료/지난 활동 정리 작업 (워커마다 시작하지만 실행 권한을 가진 하나만 실행)
+    if settings.scheduler_enabled:
+        scheduler.start()
+    # 자원봉사자 매칭 인덱스를 미리 구성 (이후에는 조회마다 새 신청만 따라잡음)
+    async with read_async_engine.connect() as conn:
+        await conn.run_sync(availability.warm_up)
+    # 예약/자원봉사 신청 묶음 커밋 (WRITE_QUEUE_ENABLED)
+    if write_queue.enabled:
+        write_queue.start()
+    yield
+    await write_queue.stop()
+    await scheduler.stop()
+
 
 app = FastAPI(
     title="시니어 체험 플랫폼",
     description="시니어들을 위한 구독형 체험 예약 플랫폼",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -31,104 +74,406 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Query-Count", "X-Query-Time-Ms"],
 )
 
+# 라우트별 처리 시간/상태 코드와 요청별 SQL 문 수 (GET /metrics, 가장 바깥에서 측정)
+if settings.metrics_enabled:
+    app.add_middleware(metrics.MetricsMiddleware)
+
 # 데이터베이스 세션 의존성
-def get_db():
-    db = SessionLocal()
-    try:
+# 핸들러는 async def로 이벤트 루프에서 실행되며, 동기 Session/Connection을 받는
+# 헬퍼(페이지네이션, 지역, 검색, ETag)는 run_sync로 같은 세션에서 호출합니다.
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
+
+
+# 조회 전용 세션 의존성 (GET 엔드포인트, 별도 연결 풀)
+async def get_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+# 목록 응답 행 (ORM 객체 없이 컬럼 튜플 → dict, 관계는 expand로 요청한 것만)
+ACTIVITY_ROWS = fastjson.RowSchema(ActivityResponse, Activity)
+ACTIVITY_SUMMARY_ROWS = fastjson.RowSchema(ActivitySummary, Activity, expressions={
+    "description_preview": func.substr(Activity.description, 1, 100),
+})
+USER_ROWS = fastjson.RowSchema(UserResponse, User)
+BOOKING_ROWS = fastjson.RowSchema(BookingDetail, ActivityBooking, relations={
+    "activity": (ACTIVITY_ROWS, "activity_id"),
+    "user": (USER_ROWS, "user_id"),
+})
+VOLUNTEER_ROWS = fastjson.RowSchema(VolunteerDetail, Volunteer, relations={
+    "activity": (ACTIVITY_ROWS, "activity_id"),
+})
+VOLUNTEER_CANDIDATE_ROWS = fastjson.RowSchema(VolunteerResponse, Volunteer)
+UNSTAFFED_ROWS = ACTIVITY_ROWS.subset({
+    "id", "title", "category", "location", "region_id", "activity_date", "duration_minutes",
+})
+
+
+def expand_names(expand: Optional[str], rows: fastjson.RowSchema):
+    """
+    expand=activity,user 값을 관계 이름 목록으로 변환
+    
+    요청한 관계는 페이지 전체를 한 번의 IN 쿼리로 불러오고,
+    요청하지 않은 관계는 쿼리 없이 null로 응답합니다.
+    """
+    requested = {name.strip() for name in (expand or "").split(",") if name.strip()}
+    unknown = requested - rows.relations.keys()
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"expand 가능한 항목이 아닙니다: {', '.join(sorted(unknown))}"
+        )
+    return sorted(requested)
+
+
+def activity_bookings_page(db: Session, activity_id: int, limit: int,
+                           cursor: Optional[str] = None, expand: Optional[str] = None):
+    """활동의 예약 한 페이지 (예약 순)"""
+    requested = expand_names(expand, BOOKING_ROWS)
+    query = db.query(*BOOKING_ROWS.columns).filter(ActivityBooking.activity_id == activity_id)
+    rows, next_cursor = paginate(
+        query, "id", ActivityBooking.id, ActivityBooking.id, limit, cursor
+    )
+    return {"items": BOOKING_ROWS.items(db.connection(), rows, requested), "next_cursor": next_cursor}
+
+
+def activity_volunteers_page(db: Session, activity_id: int, limit: int,
+                             cursor: Optional[str] = None, expand: Optional[str] = None):
+    """활동의 자원봉사자 한 페이지 (신청 순)"""
+    requested = expand_names(expand, VOLUNTEER_ROWS)
+    query = db.query(*VOLUNTEER_ROWS.columns).filter(Volunteer.activity_id == activity_id)
+    rows, next_cursor = paginate(
+        query, "id", Volunteer.id, Volunteer.id, limit, cursor
+    )
+    return {"items": VOLUNTEER_ROWS.items(db.connection(), rows, requested), "next_cursor": next_cursor}
+
+
+def user_bookings_page(db: Session, user_id: int, limit: int,
+                       cursor: Optional[str] = None, expand: Optional[str] = None):
+    """사용자의 예약 한 페이지 (최근 예약 순)"""
+    requested = expand_names(expand, BOOKING_ROWS)
+    query = db.query(*BOOKING_ROWS.columns).filter(ActivityBooking.user_id == user_id)
+    rows, next_cursor = paginate(
+        query, "-id", ActivityBooking.id, ActivityBooking.id,
+        limit, cursor, descending=True
+    )
+    return {"items": BOOKING_ROWS.items(db.connection(), rows, requested), "next_cursor": next_cursor}
+
+
+def user_booking_activity_ids(db: Session, user_id: int, limit: int, cursor: Optional[str] = None):
+    """사용자 예약 한 페이지에 들어가는 활동 id (expand=activity 응답의 ETag용, 예약 인덱스만 읽음)"""
+    query = db.query(ActivityBooking.id, ActivityBooking.activity_id).filter(ActivityBooking.user_id == user_id)
+    rows, _ = paginate(
+        query, "-id", ActivityBooking.id, ActivityBooking.id,
+        limit, cursor, descending=True
+    )
+    return sorted({row.activity_id for row in rows})
 
 
 # ==================== 활동(Activity) 관련 엔드포인트 ====================
 
-@app.get("/api/activities", response_model=List[ActivityResponse])
-def get_activities(
+# 활동 목록 정렬 기준 ("-" 접두사는 내림차순, relevance는 검색어(q)가 있을 때만)
+ACTIVITY_SORTS = {
+    "activity_date": Activity.activity_date,
+    "created_at": Activity.created_at,
+    "price": Activity.price,
+}
+ACTIVITY_SORT_ALIASES = {
+    "recent": "-created_at",
+}
+ActivitySort = Literal[
+    "activity_date", "-activity_date",
+    "created_at", "-created_at",
+    "price", "-price",
+    "recent",
+    "relevance",
+]
+
+
+def activity_fields(fields: Optional[str]):
+    """
+    fields 값을 목록 응답 행 정의로 변환
+    
+    없으면 전체 필드, summary면 카드용 요약(ActivitySummary), 그 외에는
+    쉼표로 구분한 ActivityResponse 필드만 SELECT합니다 (id는 항상 포함).
+    """
+    if not fields:
+        return ACTIVITY_ROWS
+    if fields == "summary":
+        return ACTIVITY_SUMMARY_ROWS
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested - set(ACTIVITY_ROWS.names)
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"fields에 사용할 수 없는 항목입니다: {', '.join(sorted(unknown))}"
+        )
+    return ACTIVITY_ROWS.subset(requested | {"id"})
+
+
+# fields에 따라 항목 스키마가 다름 (없으면 ActivityResponse, summary면 ActivitySummary, 나열하면 고른 필드만)
+@app.get("/api/activities", response_model=Union[ActivityPage, ActivitySummaryPage, ActivityFieldsPage])
+async def get_activities(
+    request: Request,
     category: Optional[str] = None,
     location: Optional[str] = None,
-    db: Session = Depends(get_db)
+    region: Optional[str] = None,
+    near_user_id: Optional[int] = None,
+    q: Optional[str] = None,
+    sort: Optional[ActivitySort] = None,
+    include_past: bool = False,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    upcoming: bool = False,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
 ):
-    """모든 체험 활동 조회 (카테고리, 지역별 필터링 가능)"""
-    query = db.query(Activity)
+    """
+    체험 활동 목록 조회 (카테고리, 지역 필터링, 검색어 q 및 커서 페이지네이션)
+    
+    fields=summary는 목록 카드에 필요한 필드(ActivitySummary)만, fields=id,title,price처럼
+    필드를 나열하면 그 필드만 반환하며 SQL도 해당 컬럼만 읽습니다. sort=recent는 -created_at과 같습니다.
+    region은 하위 지역까지 포함하며, 지정하지 않고 near_user_id를 주면
+    해당 사용자 주소의 시/군/구 안에 있는 활동만 조회합니다.
+    지난 활동(백그라운드 작업이 is_past로 표시)은 include_past=true일 때만 포함합니다.
+    from/to는 활동 일시 범위(from 이상, to 미만, 날짜만 주면 0시)이고, upcoming=true는
+    지금 이후에 열리는 활동만 조회합니다. 두 조건 모두 일시가 없는 활동은 제외합니다.
+    응답은 쿼리 파라미터별로 캐시되며, 페이지에 포함된 활동이 바뀌면 무효화됩니다.
+    ETag는 본문 해시라 캐시 적중 시에는 쿼리 없이 304를 반환합니다.
+    """
+    rows = activity_fields(fields)
+    cached = response_cache.lookup(request)
+    if cached.hit:
+        response = cached.response()
+    else:
+        page = await db.run_sync(
+            query_activities, category, location, region, near_user_id, q, sort,
+            include_past, limit, cursor, rows, date_from, date_to, upcoming
+        )
+        tags = [ACTIVITY_LIST_TAG] + [activity_tag(activity["id"]) for activity in page["items"]]
+        response = cached.store_body(fastjson.dumps(page), tags, LIST_TTL)
+    
+    validator = etags.for_body(request, response.body)
+    if validator.not_modified:
+        return validator.response()
+    return validator.apply(response)
+
+
+def activity_region_paths(db: Session, region, near_user_id):
+    """
+    지역 필터 값을 regions.path 목록으로 변환 (지역 필터가 없으면 None)
+    
+    region이 없고 near_user_id가 있으면 그 사용자 주소의 시/군/구를 사용합니다.
+    """
+    if region:
+        return regions.lookup_paths(db.connection(), region)
+    if near_user_id is not None:
+        user_region_id = db.query(User.region_id).filter(User.id == near_user_id).scalar()
+        if user_region_id is not None:
+            return [regions.ancestor_path(db.connection(), user_region_id)]
+    return None
+
+
+def query_activities(db: Session, category, location, region, near_user_id, q, sort,
+                     include_past, limit, cursor, rows=ACTIVITY_ROWS,
+                     date_from=None, date_to=None, upcoming=False, unstaffed=False):
+    """활동 목록 한 페이지 조회 ({"items": rows 필드의 응답 dict 목록, "next_cursor"})"""
+    query = db.query(*rows.columns)
     
+    if not include_past:
+        query = query.filter(Activity.is_past == False)
+    if unstaffed:
+        query = query.filter(Activity.volunteer_count == 0)
+    # 활동 일시 범위 (activity_date 인덱스 범위 검색)
+    if upcoming:
+        query = query.filter(Activity.activity_date >= datetime.utcnow())
+    if date_from is not None:
+        query = query.filter(Activity.activity_date >= date_from)
+    if date_to is not None:
+        query = query.filter(Activity.activity_date < date_to)
     if category:
         query = query.filter(Activity.category == category)
     if location:
         query = query.filter(Activity.location.contains(location))
     
-    activities = query.all()
-    return activities
+    # 지역 필터 (regions.path 인덱스 → activities.region_id 인덱스)
+    region_paths = activity_region_paths(db, region, near_user_id)
+    if region_paths is not None:
+        if not region_paths:
+            return {"items": [], "next_cursor": None}
+        query = query.filter(Activity.region_id.in_(regions.subtree_ids(region_paths)))
+    
+    # 검색어: 제목/설명/강사/장소 전문 검색 (기본 정렬은 관련도순)
+    q = q.strip() if q else None
+    sort = sort or ("relevance" if q else "created_at")
+    sort = ACTIVITY_SORT_ALIASES.get(sort, sort)
+    if sort == "relevance" and not q:
+        raise HTTPException(status_code=400, detail="관련도순 정렬에는 검색어(q)가 필요합니다")
+    
+    matches = None
+    if q:
+        match = search.match_expression(q)
+        if match is None:
+            return {"items": [], "next_cursor": None}
+        if search.is_available(db.connection()):
+            matches = search.ranked_matches(match)
+            query = query.join(matches, matches.c.activity_id == Activity.id)
+        else:
+            query = query.filter(*search.like_filter(q))
+            if sort == "relevance":
+                sort = "created_at"
+    
+    if sort == "relevance":
+        page, next_cursor = paginate(
+            query.add_columns(matches.c.score), sort, matches.c.score, Activity.id,
+            limit, cursor, nullable=False,
+            row_key=lambda row: (row.score, row.id)
+        )
+    else:
+        column = ACTIVITY_SORTS[sort.lstrip("-")]
+        if column.key not in rows.names:
+            query = query.add_columns(column)  # 커서 값 (응답에는 포함하지 않음)
+        page, next_cursor = paginate(
+            query, sort, column, Activity.id,
+            limit, cursor, descending=sort.startswith("-")
+        )
+    return {"items": rows.items(db.connection(), page), "next_cursor": next_cursor}
 
 
 @app.get("/api/activities/{activity_id}", response_model=ActivityResponse)
-def get_activity(activity_id: int, db: Session = Depends(get_db)):
-    """특정 체험 활동 상세 조회"""
-    activity = db.query(Activity).filter(Activity.id == activity_id).first()
+async def get_activity(
+    activity_id: int,
+    request: Request,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """특정 체험 활동 상세 조회 (ETag, 캐시)"""
+    conn = await db.connection()
+    validator = await conn.run_sync(etags.check, request, etags.activity_key(activity_id))
+    if validator.not_modified:
+        return validator.response()
+    cached = response_cache.lookup(request, validator.etag)
+    if cached.hit:
+        return validator.apply(cached.response())
+    
+    activity = await db.get(Activity, activity_id)
     if not activity:
         raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
+    return validator.apply(
+        cached.store(ActivityResponse, activity, [activity_tag(activity_id)], DETAIL_TTL)
+    )
+
+
+@app.get("/api/activities/{activity_id}/detail", response_model=ActivityDetailBundle)
+async def get_activity_detail(
+    activity_id: int,
+    request: Request,
+    bookings_limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    volunteers_limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    활동 상세 페이지용 묶음 조회
     
-    # 신청자 수 계산
-    booking_count = db.query(ActivityBooking).filter(
-        ActivityBooking.activity_id == activity_id
-    ).count()
-    activity.booking_count = booking_count
+    활동(신청자/자원봉사자 수 포함)과 예약, 자원봉사자 목록의 첫 페이지를
+    하나의 세션에서 쿼리 3번으로 반환합니다. 다음 페이지는 next_cursor로
+    /bookings, /volunteers 목록 엔드포인트에서 이어서 조회합니다.
+    """
+    conn = await db.connection()
+    validator = await conn.run_sync(
+        etags.check, request,
+        etags.activity_key(activity_id),
+        etags.activity_bookings_key(activity_id),
+        etags.activity_volunteers_key(activity_id),
+    )
+    if validator.not_modified:
+        return validator.response()
     
-    return activity
+    activity = await db.get(Activity, activity_id)
+    if not activity:
+        raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
+    return validator.apply(fastjson.response({
+        "activity": ACTIVITY_ROWS.from_object(activity),
+        "bookings": await db.run_sync(activity_bookings_page, activity_id, bookings_limit),
+        "volunteers": await db.run_sync(activity_volunteers_page, activity_id, volunteers_limit),
+    }))
 
 
 @app.post("/api/activities", response_model=ActivityResponse)
-def create_activity(activity: ActivityCreate, db: Session = Depends(get_db)):
+async def create_activity(activity: ActivityCreate, db: AsyncSession = Depends(get_db)):
     """새로운 체험 활동 생성"""
+    conn = await db.connection()
     db_activity = Activity(**activity.dict())
+    db_activity.region_id = await conn.run_sync(regions.resolve, activity.location)
     db.add(db_activity)
-    db.commit()
-    db.refresh(db_activity)
+    await db.flush()
+    await conn.run_sync(stats.add_activities, [stats.snapshot(db_activity)])
+    await db.commit()
+    response_cache.invalidate(ACTIVITY_LIST_TAG, CATEGORIES_TAG)
+    await db.refresh(db_activity)
     return db_activity
 
 
 @app.put("/api/activities/{activity_id}", response_model=ActivityResponse)
-def update_activity(
+async def update_activity(
     activity_id: int,
     activity_update: ActivityUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """체험 활동 정보 수정"""
-    db_activity = db.query(Activity).filter(Activity.id == activity_id).first()
+    # 요약 변화량의 기준(before)이 될 신청자/자원봉사자 수를 행 잠금 아래에서 읽음
+    # (잠금 없이 읽으면 그 사이 커밋된 예약이 요약에 어긋나게 반영됨, SQLite는 BEGIN IMMEDIATE로 이미 직렬화)
+    db_activity = await db.get(Activity, activity_id, with_for_update=True)
     if not db_activity:
         raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
     
+    conn = await db.connection()
+    before = stats.snapshot(db_activity)
     update_data = activity_update.dict(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_activity, key, value)
+    if "location" in update_data:
+        db_activity.region_id = await conn.run_sync(regions.resolve, db_activity.location)
+    await db.flush()  # is_past는 저장 시 계산됨
+    await conn.run_sync(stats.move_activity, before, stats.snapshot(db_activity))
     
-    db.commit()
-    db.refresh(db_activity)
+    await conn.run_sync(etags.bump, etags.activity_key(activity_id))
+    await db.commit()
+    # 필터/정렬 값이 바뀌면 다른 목록 페이지로 옮겨갈 수 있으므로 목록 전체도 무효화
+    response_cache.invalidate(activity_tag(activity_id), ACTIVITY_LIST_TAG, CATEGORIES_TAG)
+    await db.refresh(db_activity)
     return db_activity
 
 
 # ==================== 사용자 관련 엔드포인트 ====================
 
 @app.post("/api/users", response_model=UserResponse)
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """새로운 사용자 등록"""
     # 이메일 중복 확인
-    existing_user = db.query(User).filter(User.email == user.email).first()
+    existing_user = await db.scalar(select(User.id).where(User.email == user.email))
     if existing_user:
         raise HTTPException(status_code=400, detail="이미 등록된 이메일입니다")
     
+    conn = await db.connection()
     db_user = User(**user.dict())
+    db_user.region_id = await conn.run_sync(regions.resolve, user.address)
     db.add(db_user)
-    db.commit()
-    db.refresh(db_user)
+    await db.commit()
+    await db.refresh(db_user)
     return db_user
 
 
 @app.get("/api/users/{user_id}", response_model=UserResponse)
-def get_user(user_id: int, db: Session = Depends(get_db)):
+async def get_user(user_id: int, db: AsyncSession = Depends(get_read_db)):
     """사용자 정보 조회"""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await db.get(User, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     return user
@@ -137,153 +482,757 @@ def get_user(user_id: int, db: Session = Depends(get_db)):
 # ==================== 구독 관련 엔드포인트 ====================
 
 @app.post("/api/subscriptions", response_model=SubscriptionResponse)
-def create_subscription(
+async def create_subscription(
     subscription: SubscriptionCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """구독 생성"""
     # 사용자 존재 확인
-    user = db.query(User).filter(User.id == subscription.user_id).first()
+    user = await db.get(User, subscription.user_id)
     if not user:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     
     db_subscription = Subscription(**subscription.dict())
     db.add(db_subscription)
-    db.commit()
-    db.refresh(db_subscription)
+    conn = await db.connection()
+    await conn.run_sync(stats.add_subscriptions, [subscription.plan_type])
+    await db.commit()
+    entitlements.cache.invalidate(subscription.user_id)
+    await db.refresh(db_subscription)
     return db_subscription
 
 
 @app.get("/api/users/{user_id}/subscription", response_model=Optional[SubscriptionResponse])
-def get_user_subscription(user_id: int, db: Session = Depends(get_db)):
-    """사용자의 활성 구독 조회"""
-    subscription = db.query(Subscription).filter(
-        Subscription.user_id == user_id,
-        Subscription.is_active == True
-    ).first()
-    return subscription
+async def get_user_subscription(user_id: int, db: AsyncSession = Depends(get_read_db)):
+    """사용자의 활성 구독 조회 (end_date가 지난 구독은 제외, 구독 자격 캐시 사용)"""
+    now = datetime.utcnow()
+    cached = entitlements.cache.get(user_id, now)
+    if cached is not None:
+        return cached
+    subscription = await db.scalar(entitlements.active_subscription_query(user_id, now))
+    if subscription is None:
+        return None
+    return entitlements.cache.set(subscription)
+
+
+# ==================== 일괄 가져오기 엔드포인트 ====================
+
+ImportFormat = Literal["ndjson", "csv"]
+ImportMode = Literal["insert", "upsert"]
+
+# 본문은 스트리밍으로 직접 읽으므로 문서에만 형식을 표시
+IMPORT_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/x-ndjson": {"schema": {"type": "string"}},
+            "text/csv": {"schema": {"type": "string"}},
+        },
+    }
+}
+
+
+async def write_import_chunk(db: AsyncSession, importer):
+    tags = await db.run_sync(importer.write_chunk)
+    if tags:
+        response_cache.invalidate(*tags)
+
+
+async def run_import(request: Request, kind: str, fmt: Optional[str], mode: str,
+                     chunk_size: int, db: AsyncSession):
+    """
+    요청 본문을 읽는 대로 검증하고 chunk_size 행마다 한 트랜잭션으로 저장
+    
+    format을 지정하지 않으면 Content-Type이 text/csv일 때 CSV, 그 외에는 NDJSON으로 읽습니다.
+    """
+    if fmt is None:
+        content_type = request.headers.get("content-type", "")
+        fmt = "csv" if content_type.startswith("text/csv") else "ndjson"
+    importer = bulk_import.IMPORTERS[kind](mode)
+    async for row_number, fields in bulk_import.read_records(request.stream(), fmt):
+        if importer.add(row_number, fields) >= chunk_size:
+            await write_import_chunk(db, importer)
+    await write_import_chunk(db, importer)
+    return importer.result()
+
+
+@app.post("/api/activities/bulk", response_model=ImportResult, openapi_extra=IMPORT_BODY)
+async def import_activities(
+    request: Request,
+    fmt: Optional[ImportFormat] = Query(None, alias="format"),
+    mode: ImportMode = "insert",
+    chunk_size: int = Query(bulk_import.CHUNK_SIZE, ge=1, le=bulk_import.MAX_CHUNK_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    """체험 활동 일괄 가져오기 (NDJSON/CSV, mode=upsert는 external_id 기준)"""
+    return await run_import(request, "activities", fmt, mode, chunk_size, db)
+
+
+@app.post("/api/users/bulk", response_model=ImportResult, openapi_extra=IMPORT_BODY)
+async def import_users(
+    request: Request,
+    fmt: Optional[ImportFormat] = Query(None, alias="format"),
+    mode: ImportMode = "insert",
+    chunk_size: int = Query(bulk_import.CHUNK_SIZE, ge=1, le=bulk_import.MAX_CHUNK_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    """사용자 일괄 가져오기 (이메일 중복 행은 오류로 보고)"""
+    return await run_import(request, "users", fmt, mode, chunk_size, db)
+
+
+@app.post("/api/subscriptions/bulk", response_model=ImportResult, openapi_extra=IMPORT_BODY)
+async def import_subscriptions(
+    request: Request,
+    fmt: Optional[ImportFormat] = Query(None, alias="format"),
+    mode: ImportMode = "insert",
+    chunk_size: int = Query(bulk_import.CHUNK_SIZE, ge=1, le=bulk_import.MAX_CHUNK_SIZE),
+    db: AsyncSession = Depends(get_db)
+):
+    """구독 일괄 가져오기 (사용자는 user_id 또는 user_external_id로 지정)"""
+    try:
+        return await run_import(request, "subscriptions", fmt, mode, chunk_size, db)
+    finally:
+        # upsert로 구독이 비활성화되었을 수 있으므로 저장된 청크가 있으면 자격 캐시를 비움
+        entitlements.cache.clear()
 
 
 # ==================== 체험 예약 관련 엔드포인트 ====================
 
-@app.post("/api/bookings", response_model=BookingResponse)
-def create_booking(booking: BookingCreate, db: Session = Depends(get_db)):
-    """체험 활동 예약"""
-    # 활동 존재 확인
-    activity = db.query(Activity).filter(Activity.id == booking.activity_id).first()
-    if not activity:
-        raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
+def bump_booking_versions(conn, activity_id: int, user_id: int):
+    """예약 생성/취소로 바뀌는 리소스(활동의 신청자 수, 양쪽 예약 목록)의 버전 증가"""
+    etags.bump(
+        conn,
+        etags.activity_key(activity_id),
+        etags.activity_bookings_key(activity_id), etags.user_bookings_key(user_id),
+    )
+
+
+def booking_check_query(activity_id: int, user_id: int, now: datetime, with_subscription: bool):
+    """
+    예약 전 검증에 필요한 값을 한 번에 읽는 쿼리 (활동이 없으면 행 없음)
     
-    # 사용자 존재 확인
-    user = db.query(User).filter(User.id == booking.user_id).first()
-    if not user:
+    활동의 정원/신청자 수, 사용자 존재 여부, 기존 예약 여부와 (자격 캐시에 없을 때만)
+    유효한 구독을 한 행으로 반환합니다.
+    """
+    query = select(
+        Activity.booking_count,
+        Activity.max_participants,
+        exists().where(User.id == user_id).label("user_exists"),
+        exists().where(
+            ActivityBooking.user_id == user_id,
+            ActivityBooking.activity_id == activity_id
+        ).label("booked"),
+    ).where(Activity.id == activity_id)
+    if with_subscription:
+        query = query.add_columns(Subscription).outerjoin(
+            Subscription, Subscription.id == entitlements.active_subscription_id(user_id, now)
+        )
+    return query
+
+
+# 쓰기 작업 함수 (write_queue.execute로 실행): (동기 Session, 요청) → (응답, 커밋 후 호출할 함수)
+# 커밋은 호출한 쪽에서 하며, 거절은 롤백 없이 HTTPException으로 알림
+# (요청 세션은 닫히면서, 쓰기 큐의 묶음은 요청별 SAVEPOINT로 되돌림)
+def book_activity(db: Session, booking: BookingCreate):
+    """예약 쓰기"""
+    now = datetime.utcnow()
+    entitled = entitlements.cache.get(booking.user_id, now) is not None
+    check = db.execute(
+        booking_check_query(booking.activity_id, booking.user_id, now, not entitled)
+    ).one_or_none()
+    
+    # 활동/사용자 존재 확인
+    if check is None:
+        raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
+    if not check.user_exists:
         raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
     
     # 구독 확인
-    subscription = db.query(Subscription).filter(
-        Subscription.user_id == booking.user_id,
-        Subscription.is_active == True
-    ).first()
-    if not subscription:
-        raise HTTPException(
-            status_code=400,
-            detail="활성 구독이 필요합니다"
-        )
+    if not entitled:
+        if check.Subscription is None:
+            raise HTTPException(
+                status_code=400,
+                detail="활성 구독이 필요합니다"
+            )
+        entitlements.cache.set(check.Subscription)
+    
+    # 이미 마감되었거나 예약한 활동이면 쓰기 없이 거절 (동시 요청은 아래 UPDATE와 유니크 제약이 보장)
+    if check.max_participants is not None and check.booking_count >= check.max_participants:
+        raise HTTPException(status_code=400, detail="정원이 마감되었습니다")
+    if check.booked:
+        raise HTTPException(status_code=400, detail="이미 예약된 활동입니다")
     
-    # 중복 예약 확인
-    existing_booking = db.query(ActivityBooking).filter(
-        ActivityBooking.activity_id == booking.activity_id,
-        ActivityBooking.user_id == booking.user_id
+    # 좌석 확보: 정원이 남아 있을 때만 카운터를 올리는 조건부 UPDATE
+    # (읽고 나서 쓰는 방식과 달리 동시 요청에서도 초과 예약이 생기지 않음)
+    # 요약에 반영할 카테고리/지역 등은 검증 조회가 아니라 잠근 행의 값(RETURNING)을 사용
+    reserved = db.execute(
+        update(Activity).where(
+            Activity.id == booking.activity_id,
+            or_(
+                Activity.max_participants.is_(None),
+                Activity.booking_count < Activity.max_participants
+            )
+        ).values(booking_count=Activity.booking_count + 1).returning(
+            Activity.booking_count, Activity.category, Activity.region_id,
+            Activity.max_participants, Activity.activity_date
+        ),
+        execution_options={"synchronize_session": False}
     ).first()
-    if existing_booking:
+    if reserved is None:
+        raise HTTPException(status_code=400, detail="정원이 마감되었습니다")
+    booking_count, category, region_id, max_participants, activity_date = reserved
+    
+    # 중복 예약은 (user_id, activity_id) 유니크 제약으로 확인 (좌석 확보도 함께 롤백)
+    db_booking = ActivityBooking(**booking.dict())
+    db.add(db_booking)
+    try:
+        db.flush()
+    except IntegrityError:
         raise HTTPException(
             status_code=400,
             detail="이미 예약된 활동입니다"
         )
     
-    db_booking = ActivityBooking(**booking.dict())
-    db.add(db_booking)
-    db.commit()
-    db.refresh(db_booking)
-    return db_booking
+    conn = db.connection()
+    stats.add_booking(conn, category, region_id, max_participants, activity_date, 1)
+    bump_booking_versions(conn, booking.activity_id, booking.user_id)
+    
+    def after_commit():
+        response_cache.invalidate(activity_tag(booking.activity_id))
+        live.broadcaster.publish(booking.activity_id, booking_count, 1, category, region_id)
+    return BookingResponse.model_validate(db_booking), after_commit
 
 
-@app.get("/api/activities/{activity_id}/bookings", response_model=List[BookingResponse])
-def get_activity_bookings(activity_id: int, db: Session = Depends(get_db)):
-    """특정 활동의 예약 목록 조회"""
-    bookings = db.query(ActivityBooking).filter(
-        ActivityBooking.activity_id == activity_id
-    ).all()
-    return bookings
+def cancel_booking_write(db: Session, booking_id: int):
+    """예약 취소 쓰기"""
+    # 삭제한 행이 있을 때만 신청자 수를 줄임 (같은 예약을 동시에 취소하면 늦은 쪽은 지운 행이 없어 404)
+    booking = db.execute(
+        delete(ActivityBooking).where(ActivityBooking.id == booking_id).returning(
+            ActivityBooking.activity_id, ActivityBooking.user_id
+        ),
+        execution_options={"synchronize_session": False}
+    ).first()
+    if booking is None:
+        raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다")
+    
+    released = db.execute(
+        update(Activity).where(Activity.id == booking.activity_id).values(
+            booking_count=Activity.booking_count - 1
+        ).returning(
+            Activity.booking_count, Activity.category, Activity.region_id,
+            Activity.max_participants, Activity.activity_date
+        ),
+        execution_options={"synchronize_session": False}
+    )
+    booking_count, category, region_id, max_participants, activity_date = released.one()
+    conn = db.connection()
+    stats.add_booking(conn, category, region_id, max_participants, activity_date, -1)
+    bump_booking_versions(conn, booking.activity_id, booking.user_id)
+    
+    def after_commit():
+        response_cache.invalidate(activity_tag(booking.activity_id))
+        live.broadcaster.publish(booking.activity_id, booking_count, -1, category, region_id)
+    return {"message": "예약이 취소되었습니다"}, after_commit
 
 
-@app.get("/api/users/{user_id}/bookings", response_model=List[BookingResponse])
-def get_user_bookings(user_id: int, db: Session = Depends(get_db)):
-    """사용자의 예약 목록 조회"""
-    bookings = db.query(ActivityBooking).filter(
-        ActivityBooking.user_id == user_id
-    ).all()
-    return bookings
+@app.post("/api/bookings", response_model=BookingResponse)
+async def create_booking(booking: BookingCreate, db: AsyncSession = Depends(get_db)):
+    """체험 활동 예약 (검증 조회 한 번 + 쓰기 트랜잭션 한 번, 쓰기 큐를 켜면 묶음 커밋)"""
+    return await write_queue.execute(db, book_activity, booking)
+
+
+@app.get("/api/activities/{activity_id}/bookings", response_model=BookingPage)
+async def get_activity_bookings(
+    activity_id: int,
+    request: Request,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """특정 활동의 예약 목록 조회 (예약 순, expand=user,activity)"""
+    keys = [etags.activity_bookings_key(activity_id)]
+    if expand:
+        keys.append(etags.activity_key(activity_id))
+    conn = await db.connection()
+    validator = await conn.run_sync(etags.check, request, *keys)
+    if validator.not_modified:
+        return validator.response()
+    page = await db.run_sync(activity_bookings_page, activity_id, limit, cursor, expand)
+    return validator.apply(fastjson.response(page))
+
+
+@app.get("/api/users/{user_id}/bookings", response_model=BookingPage)
+async def get_user_bookings(
+    user_id: int,
+    request: Request,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """사용자의 예약 목록 조회 (최근 예약 순, expand=activity,user)"""
+    # expand=activity 응답은 페이지에 포함된 활동이 바뀌어도 달라지므로 그 활동들의 버전도 반영
+    keys = [etags.user_bookings_key(user_id)]
+    if "activity" in expand_names(expand, BOOKING_ROWS):
+        activity_ids = await db.run_sync(user_booking_activity_ids, user_id, limit, cursor)
+        keys.extend(etags.activity_key(activity_id) for activity_id in activity_ids)
+    conn = await db.connection()
+    validator = await conn.run_sync(etags.check, request, *keys)
+    if validator.not_modified:
+        return validator.response()
+    page = await db.run_sync(user_bookings_page, user_id, limit, cursor, expand)
+    return validator.apply(fastjson.response(page))
 
 
 @app.delete("/api/bookings/{booking_id}")
-def cancel_booking(booking_id: int, db: Session = Depends(get_db)):
+async def cancel_booking(booking_id: int, db: AsyncSession = Depends(get_db)):
     """예약 취소"""
-    booking = db.query(ActivityBooking).filter(
-        ActivityBooking.id == booking_id
-    ).first()
-    if not booking:
-        raise HTTPException(status_code=404, detail="예약을 찾을 수 없습니다")
-    
-    db.delete(booking)
-    db.commit()
-    return {"message": "예약이 취소되었습니다"}
+    return await write_queue.execute(db, cancel_booking_write, booking_id)
 
 
 # ==================== 자원봉사자 관련 엔드포인트 ====================
 
-@app.post("/api/volunteers", response_model=VolunteerResponse)
-def create_volunteer(volunteer: VolunteerCreate, db: Session = Depends(get_db)):
-    """자원봉사자 신청"""
+def volunteer_write(db: Session, volunteer: VolunteerCreate):
+    """자원봉사 신청 쓰기"""
     # 활동 존재 확인
-    activity = db.query(Activity).filter(Activity.id == volunteer.activity_id).first()
+    activity = db.get(Activity, volunteer.activity_id)
     if not activity:
         raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
     
-    db_volunteer = Volunteer(**volunteer.dict())
+    values = volunteer.dict(exclude={"availability_slots"})
+    try:
+        if volunteer.availability_slots is not None:
+            slots = availability.normalize(availability.from_times(volunteer.availability_slots))
+            if not values["availability"]:
+                values["availability"] = availability.describe(slots)[:200]
+        else:
+            slots = availability.normalize(availability.parse(volunteer.availability))
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+    db_volunteer = Volunteer(**values, region_id=activity.region_id)
     db.add(db_volunteer)
-    db.commit()
-    db.refresh(db_volunteer)
-    return db_volunteer
+    db.flush()
+    if slots:
+        db.execute(insert(VolunteerSlot), availability.slot_rows(db_volunteer.id, slots))
+    
+    # 자원봉사자 수 카운터 갱신 (첫 자원봉사자면 요약의 staffed_activities도 증가)
+    # 요약에는 잠근 행의 카테고리/지역을 사용 (위에서 읽은 뒤 활동이 수정됐을 수 있음)
+    volunteer_count, category, region_id = db.execute(
+        update(Activity).where(Activity.id == volunteer.activity_id).values(
+            volunteer_count=Activity.volunteer_count + 1
+        ).returning(Activity.volunteer_count, Activity.category, Activity.region_id),
+        execution_options={"synchronize_session": False}
+    ).one()
+    conn = db.connection()
+    stats.add_volunteer(conn, category, region_id, volunteer_count)
+    etags.bump(
+        conn,
+        etags.activity_key(volunteer.activity_id),
+        etags.activity_volunteers_key(volunteer.activity_id),
+    )
+    
+    def after_commit():
+        response_cache.invalidate(activity_tag(volunteer.activity_id))
+    return VolunteerResponse.model_validate(db_volunteer), after_commit
+
+
+@app.post("/api/volunteers", response_model=VolunteerResponse)
+async def create_volunteer(volunteer: VolunteerCreate, db: AsyncSession = Depends(get_db)):
+    """
+    자원봉사자 신청
+    
+    availability_slots(요일별 반복 구간)를 주면 그대로, 없으면 availability 문자열을 해석해
+    가능 시간을 저장합니다. 자원봉사자의 지역은 신청한 활동의 지역입니다.
+    """
+    return await write_queue.execute(db, volunteer_write, volunteer)
+
+
+@app.get("/api/activities/{activity_id}/volunteers", response_model=VolunteerPage)
+async def get_activity_volunteers(
+    activity_id: int,
+    request: Request,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = None,
+    expand: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """특정 활동의 자원봉사자 목록 조회 (신청 순, expand=activity)"""
+    keys = [etags.activity_volunteers_key(activity_id)]
+    if expand:
+        keys.append(etags.activity_key(activity_id))
+    conn = await db.connection()
+    validator = await conn.run_sync(etags.check, request, *keys)
+    if validator.not_modified:
+        return validator.response()
+    page = await db.run_sync(activity_volunteers_page, activity_id, limit, cursor, expand)
+    return validator.apply(fastjson.response(page))
+
+
+def volunteer_candidates(conn, activity_id: int, limit: int):
+    """
+    활동 시간 전체가 가능하고 같은 시/군/구인 자원봉사자 (이미 이 활동에 신청한 사람 제외)
+    
+    후보는 availability.index(메모리)에서 찾고, 응답할 limit명의 행만 DB에서 읽습니다.
+    """
+    activity = conn.execute(
+        select(Activity.region_id, Activity.activity_date, Activity.duration_minutes)
+        .where(Activity.id == activity_id)
+    ).first()
+    if activity is None:
+        raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
+    availability.index.sync(conn)
+    candidates = availability.index.candidates(
+        conn, activity.region_id, activity.activity_date, activity.duration_minutes
+    )
+    signed_up = conn.execute(select(Volunteer.email).where(Volunteer.activity_id == activity_id))
+    candidates -= availability.index.volunteer_ids(signed_up.scalars())
+    ids = heapq.nlargest(limit, candidates)
+    found = VOLUNTEER_CANDIDATE_ROWS.load(conn, ids) if ids else {}
+    return {
+        "activity_id": activity_id,
+        "total": len(candidates),
+        "items": [found[volunteer_id] for volunteer_id in ids if volunteer_id in found],
+    }
+
+
+@app.get("/api/activities/{activity_id}/volunteer-candidates", response_model=VolunteerCandidates)
+async def get_volunteer_candidates(
+    activity_id: int,
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    활동에 배정할 수 있는 자원봉사자 후보 (최근 신청 순, total은 전체 후보 수)
+    
+    활동 일시부터 duration_minutes(없으면 60분) 동안 매주 가능 시간 안에 있고, 활동과
+    같은 시/군/구에서 신청한 자원봉사자입니다. 일시가 없는 활동은 후보가 없습니다.
+    """
+    conn = await db.connection()
+    page = await conn.run_sync(volunteer_candidates, activity_id, limit)
+    return fastjson.response(page)
+
+
+def unstaffed_activities_page(db: Session, category, region, date_from, date_to, limit, cursor):
+    """자원봉사자가 없는 예정 활동 한 페이지와 활동별 후보 수"""
+    page = query_activities(
+        db, category, None, region, None, None, "activity_date", False, limit, cursor,
+        UNSTAFFED_ROWS, date_from, date_to, upcoming=True, unstaffed=True,
+    )
+    conn = db.connection()
+    availability.index.sync(conn)
+    for item in page["items"]:
+        item["candidate_count"] = availability.index.count(
+            conn, item["region_id"], item["activity_date"], item["duration_minutes"]
+        )
+    return page
+
+
+@app.get("/api/reports/unstaffed-activities", response_model=UnstaffedActivityPage)
+async def get_unstaffed_activities(
+    category: Optional[str] = None,
+    region: Optional[str] = None,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT),
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    자원봉사자가 한 명도 없는 예정 활동 (활동 일시순, 커서 페이지네이션)
+    
+    활동마다 candidate_count(volunteer-candidates의 total)를 함께 반환하므로 후보가 없는
+    활동부터 모집할 수 있습니다. category/region/from/to는 활동 목록과 같은 필터입니다.
+    """
+    return await db.run_sync(
+        unstaffed_activities_page, category, region, date_from, date_to, limit, cursor
+    )
+
+
+@app.get("/api/regions", response_model=List[RegionResponse])
+async def get_regions(parent_id: Optional[int] = None, db: AsyncSession = Depends(get_read_db)):
+    """지역 목록 조회 (parent_id가 없으면 시/도, 있으면 그 하위 지역)"""
+    query = select(Region)
+    if parent_id is None:
+        query = query.where(Region.level == regions.LEVEL_SIDO)
+    else:
+        query = query.where(Region.parent_id == parent_id)
+    return (await db.scalars(query.order_by(Region.name))).all()
+
+
+# ==================== 실시간 전송 엔드포인트 ====================
+
+LIVE_MAX_ACTIVITY_IDS = 500
+
+
+def parse_activity_ids(value: str):
+    try:
+        activity_ids = {int(part) for part in value.split(",") if part.strip()}
+    except ValueError:
+        raise HTTPException(status_code=400, detail="activity_ids는 쉼표로 구분한 숫자여야 합니다")
+    if not activity_ids or len(activity_ids) > LIVE_MAX_ACTIVITY_IDS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"activity_ids는 1~{LIVE_MAX_ACTIVITY_IDS}개까지 지정할 수 있습니다"
+        )
+    return activity_ids
 
 
-@app.get("/api/activities/{activity_id}/volunteers", response_model=List[VolunteerResponse])
-def get_activity_volunteers(activity_id: int, db: Session = Depends(get_db)):
-    """특정 활동의 자원봉사자 목록 조회"""
-    volunteers = db.query(Volunteer).filter(
-        Volunteer.activity_id == activity_id
-    ).all()
-    return volunteers
+def filter_region_ids(db: Session, region, near_user_id):
+    """목록 필터 구독의 지역 조건을 region_id 집합으로 (조건이 없으면 None)"""
+    region_paths = activity_region_paths(db, region, near_user_id)
+    if region_paths is None:
+        return None
+    if not region_paths:
+        return set()
+    return set(db.execute(regions.subtree_ids(region_paths)).scalars())
 
 
-@app.get("/api/categories")
-def get_categories():
-    """활동 카테고리 목록 반환"""
+async def load_booking_counts(activity_ids):
+    # 스트림이 시작된 뒤 호출되므로 요청 의존성 세션 대신 짧은 세션을 직접 엶
+    async with AsyncReadSessionLocal() as db:
+        rows = await db.execute(
+            select(Activity.id, Activity.booking_count).where(Activity.id.in_(activity_ids))
+        )
+        return dict(rows.all())
+
+
+@app.get("/api/live/booking-counts")
+async def live_booking_counts(
+    activity_ids: Optional[str] = None,
+    category: Optional[str] = None,
+    region: Optional[str] = None,
+    near_user_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    신청자 수 변경 구독 (Server-Sent Events)
+    
+    activity_ids=1,2,3을 주면 해당 활동만 구독하고 연결 직후 현재 값을 snapshot
+    이벤트로 보냅니다. 없으면 활동 목록과 같은 필터(category, region, near_user_id)에
+    해당하는 활동의 변경을 모두 받습니다. 변경은 booking_counts 이벤트로
+    [{"activity_id", "booking_count", "delta"}, ...] 형태로 전송됩니다.
+    """
+    if activity_ids:
+        ids = parse_activity_ids(activity_ids)
+        subscriber = live.Subscriber(activity_ids=ids)
+        load_snapshot = lambda: load_booking_counts(ids)
+    else:
+        region_ids = await db.run_sync(filter_region_ids, region, near_user_id)
+        subscriber = live.Subscriber(category=category, region_ids=region_ids)
+        load_snapshot = None
+    await db.close()  # 스트림이 열려 있는 동안 연결을 붙잡지 않도록 반환
+    return StreamingResponse(
+        live.stream(live.broadcaster, subscriber, load_snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/live/stats")
+async def get_live_stats():
+    """실시간 구독자 수와 발행한 변경 수"""
     return {
-        "categories": [
-            "도예/공예",
-            "수영",
-            "커피 시음",
-            "요가/필라테스",
-            "요리 클래스",
-            "원예",
-            "음악/악기",
-            "독서 모임",
-            "기타"
-        ]
+        "subscribers": live.broadcaster.subscriber_count,
+        "published": live.broadcaster.published,
+    }
+
+
+# ==================== 내보내기 엔드포인트 ====================
+
+ExportFormat = Literal["csv", "ndjson"]
+
+
+async def export_response(resource: str, query, fmt: str, gzip: bool,
+                          activity_id: Optional[int], date_from: Optional[datetime],
+                          date_to: Optional[datetime], db: AsyncSession):
+    if activity_id is not None and not await db.get(Activity, activity_id):
+        raise HTTPException(status_code=404, detail="활동을 찾을 수 없습니다")
+    name = exports.filename(resource, fmt, activity_id, date_from, date_to)
+    headers = {
+        "Content-Disposition": f'attachment; filename="{name}"',
+        "Cache-Control": "no-store",
     }
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        exports.stream(query, fmt, compress=gzip),
+        media_type=exports.FORMATS[fmt],
+        headers=headers,
+    )
+
+
+@app.get("/api/exports/bookings")
+async def export_bookings(
+    activity_id: Optional[int] = None,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    fmt: ExportFormat = Query("csv", alias="format"),
+    gzip: bool = False,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    예약 명단 내보내기 (활동별, 활동 일시 범위별, 또는 전체)
+    
+    from <= activity_date < to 인 활동의 예약을 예약 순으로 스트리밍합니다 (활동 목록의 from/to와 같음).
+    gzip=true면 Content-Encoding: gzip으로 압축해 보냅니다.
+    """
+    query = exports.bookings_query(activity_id, date_from, date_to)
+    return await export_response(
+        "bookings", query, fmt, gzip, activity_id, date_from, date_to, db
+    )
+
+
+@app.get("/api/exports/volunteers")
+async def export_volunteers(
+    activity_id: Optional[int] = None,
+    date_from: Optional[datetime] = Query(None, alias="from"),
+    date_to: Optional[datetime] = Query(None, alias="to"),
+    fmt: ExportFormat = Query("csv", alias="format"),
+    gzip: bool = False,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """자원봉사자 명단 내보내기 (필터는 예약 명단과 같음)"""
+    query = exports.volunteers_query(activity_id, date_from, date_to)
+    return await export_response(
+        "volunteers", query, fmt, gzip, activity_id, date_from, date_to, db
+    )
+
+
+@app.get("/api/categories", response_model=CategoryList)
+async def get_categories(request: Request, db: AsyncSession = Depends(get_read_db)):
+    """활동이 있는 카테고리와 지나지 않은 활동 수 (요약 테이블, 캐시)"""
+    cached = response_cache.lookup(request)
+    if cached.hit:
+        return cached.response()
+    
+    conn = await db.connection()
+    categories = {"categories": await conn.run_sync(stats.categories)}
+    return cached.store(CategoryList, categories, [CATEGORIES_TAG], CATEGORIES_TTL)
+
+
+def month_range(month: Optional[str]):
+    """YYYY-MM을 (그달 1일, 다음 달 1일)로 변환 (없으면 이번 달)"""
+    if month is None:
+        first = datetime.utcnow().date().replace(day=1)
+    else:
+        try:
+            first = datetime.strptime(month, "%Y-%m").date()
+        except ValueError:
+            raise HTTPException(status_code=400, detail="month는 YYYY-MM 형식이어야 합니다")
+    return first, (first.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+@app.get("/api/calendar", response_model=CalendarMonth)
+async def get_calendar(
+    month: Optional[str] = None,
+    category: Optional[str] = None,
+    db: AsyncSession = Depends(get_read_db)
+):
+    """
+    월 달력: 일자별 활동 수, 신청자 수, 정원과 잔여석 (month=2026-11, 카테고리 필터 가능)
+    
+    활동/예약 쓰기가 함께 갱신하는 일자별 요약 테이블(activity_day_stats)의 한 달치
+    기본 키 범위만 읽습니다. 그날의 활동 목록은 /api/activities?from=...&to=...로 조회합니다.
+    """
+    first_day, end_day = month_range(month)
+    conn = await db.connection()
+    days = await conn.run_sync(stats.calendar, first_day, end_day, category)
+    return {"month": first_day.strftime("%Y-%m"), "days": days}
+
+
+# ==================== 통계 엔드포인트 ====================
+# 요약 테이블만 읽으므로 원본 테이블 크기와 관계없이 행 몇 개만 조회합니다.
+
+@app.get("/api/stats/categories", response_model=List[CategoryStat])
+async def get_category_stats(db: AsyncSession = Depends(get_read_db)):
+    """카테고리별 활동/신청자/정원 대비 신청률/자원봉사 현황"""
+    conn = await db.connection()
+    return await conn.run_sync(stats.category_stats)
+
+
+@app.get("/api/stats/regions", response_model=List[RegionStat])
+async def get_region_stats(db: AsyncSession = Depends(get_read_db)):
+    """지역(활동 장소의 행정구역)별 활동/신청자/정원 대비 신청률/자원봉사 현황"""
+    conn = await db.connection()
+    return await conn.run_sync(stats.region_stats)
+
+
+@app.get("/api/stats/subscriptions", response_model=List[SubscriptionPlanStat])
+async def get_subscription_stats(db: AsyncSession = Depends(get_read_db)):
+    """요금제별 활성 구독 수"""
+    conn = await db.connection()
+    return await conn.run_sync(stats.subscription_stats)
+
+
+@app.get("/api/scheduler/stats")
+async def get_scheduler_stats():
+    """백그라운드 작업 실행 권한과 작업별 실행 지표"""
+    return scheduler.stats()
+
+
+@app.post("/api/scheduler/jobs/{job_name}/run")
+async def run_scheduler_job(job_name: str):
+    """작업을 바로 한 번 실행 (실행 권한과 무관, 바뀐 행 수 반환)"""
+    job = scheduler.jobs.get(job_name)
+    if job is None:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    changed = await scheduler.run_job(job)
+    if changed is None:
+        raise HTTPException(status_code=500, detail=f"작업 실행 실패: {job.last_error}")
+    return {"job": job_name, "rows": len(changed)}
+
+
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """응답 캐시 적중/미스 통계 (구독 자격 캐시 포함)"""
+    return {**response_cache.stats(), "entitlements": entitlements.cache.stats()}
+
+
+# ==================== 지표 ====================
+
+@metrics.collector
+def runtime_metrics():
+    """캐시, 실시간 구독, 백그라운드 작업, 연결 풀, 자원봉사자 매칭 인덱스 상태"""
+    cache_stats = response_cache.stats()
+    entitlement_stats = entitlements.cache.stats()
+    pools = [({"pool": "write"}, async_engine.pool.checkedout())]
+    if settings.read_pool_enabled:
+        pools.append(({"pool": "read"}, read_async_engine.pool.checkedout()))
+    jobs = scheduler.jobs.items()
+    return [
+        ("response_cache_hits_total", "counter", "응답 캐시 적중", [({}, cache_stats["hits"])]),
+        ("response_cache_misses_total", "counter", "응답 캐시 미스", [({}, cache_stats["misses"])]),
+        ("entitlement_cache_hits_total", "counter", "구독 자격 캐시 적중",
+         [({}, entitlement_stats["hits"])]),
+        ("entitlement_cache_misses_total", "counter", "구독 자격 캐시 미스",
+         [({}, entitlement_stats["misses"])]),
+        ("live_subscribers", "gauge", "실시간 신청자 수 구독 연결",
+         [({}, live.broadcaster.subscriber_count)]),
+        ("scheduler_job_runs_total", "counter", "백그라운드 작업 실행 횟수",
+         [({"job": name}, job.runs) for name, job in jobs]),
+        ("scheduler_job_failures_total", "counter", "백그라운드 작업 실패 횟수",
+         [({"job": name}, job.failures) for name, job in jobs]),
+        ("db_pool_checked_out", "gauge", "사용 중인 DB 연결 수", pools),
+        ("volunteer_index_volunteers", "gauge", "자원봉사자 매칭 인덱스의 자원봉사자 수",
+         [({}, availability.index.stats()["volunteers"])]),
+        ("write_queue_pending", "gauge", "쓰기 큐에서 기다리는 요청 수", [({}, write_queue.pending)]),
+        ("write_queue_batches_total", "counter", "쓰기 큐가 커밋한 묶음 수", [({}, write_queue.batches)]),
+        ("write_queue_requests_total", "counter", "쓰기 큐가 처리한 요청 수",
+         [({"result": "applied"}, write_queue.applied), ({"result": "rejected"}, write_queue.rejected),
+          ({"result": "expired"}, write_queue.expired)]),
+    ]
+
+
+@app.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics():
+    """Prometheus 형식 지표 (라우트별 지연/상태 코드, SQL 문 수/시간, 캐시 등)"""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
 
 
 if __name__ == "__main__":
+    # 스키마는 import 시점이 아니라 실행 전 별도 단계로 적용
+    import migrations
+    migrations.upgrade()
     uvicorn.run(app, host="0.0.0.0", port=8000)
 
@@ -0,0 +1,238 @@
+"""
+요청/SQL 지표 수집과 Prometheus 형식 노출 (GET /metrics)
+
+    http_requests_total{method, route, status}      응답 수
+    http_request_duration_seconds{method, route}    요청 처리 시간 히스토그램
+    db_queries_per_request{method, route}           요청 하나가 실행한 SQL 문 수 히스토그램
+    db_query_duration_seconds{route}                SQL 문 실행 시간 히스토그램
+    db_slow_queries_total{route}                    SLOW_QUERY_MS 이상 걸린 SQL 문 수
+
+route는 경로 템플릿("/api/activities/{activity_id}")이라 id마다 시계열이 늘어나지 않습니다.
+라우트가 없는 요청은 "unmatched", 요청 밖(백그라운드 작업, 스크립트)의 SQL은 "-"로 기록합니다.
+
+SQL 문 수와 시간은 요청마다 contextvar에 모으며 응답 헤더 X-Query-Count, X-Query-Time-Ms로도
+돌려주므로, 같은 요청의 쿼리 수가 늘어나는 N+1 회귀를 응답만 보고 확인할 수 있습니다.
+느린 SQL은 호출한 라우트와 함께 "metrics" 로거에 WARNING으로 남깁니다 (파라미터는 남기지 않음).
+
+지표는 프로세스별로 집계되므로 여러 워커로 실행하면 워커마다 따로 수집해야 합니다.
+"""
+import contextvars
+import logging
+import threading
+import time
+from bisect import bisect_left
+
+from sqlalchemy import event
+
+from config import settings
+
+logger = logging.getLogger("metrics")
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+
+UNMATCHED_ROUTE = "unmatched"
+NO_ROUTE = "-"
+
+
+# ==================== 지표 ====================
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names, values, extra=()):
+    pairs = [*zip(names, values), *extra]
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    def __init__(self, name, help_text, label_names):
+        self.name = name
+        self.help = help_text
+        self.label_names = label_names
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, label_values, amount=1):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for label_values, value in items:
+            lines.append(f"{self.name}{_labels(self.label_names, label_values)} {_number(value)}")
+        return lines
+
+
+class Histogram:
+    """라벨 조합별 구간 개수, 합계, 개수 (Prometheus 히스토그램)"""
+
+    def __init__(self, name, help_text, label_names, buckets):
+        self.name = name
+        self.help = help_text
+        self.label_names = label_names
+        self.buckets = tuple(buckets)
+        self._series = {}  # 라벨 값 -> [구간별 개수(누적 아님, 마지막은 +Inf), 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, label_values, value):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, (list(counts), total, count)) for key, (counts, total, count) in self._series.items())
+        for label_values, (counts, total, count) in items:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, float("inf")), counts):
+                cumulative += bucket_count
+                labels = _labels(self.label_names, label_values, [("le", _number(bound))])
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_number(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+REQUESTS = Counter("http_requests_total", "응답 수", ("method", "route", "status"))
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "요청 처리 시간", ("method", "route"), LATENCY_BUCKETS
+)
+QUERIES_PER_REQUEST = Histogram(
+    "db_queries_per_request", "요청 하나가 실행한 SQL 문 수", ("method", "route"), QUERY_COUNT_BUCKETS
+)
+QUERY_DURATION = Histogram("db_query_duration_seconds", "SQL 문 실행 시간", ("route",), QUERY_BUCKETS)
+SLOW_QUERIES = Counter("db_slow_queries_total", "SLOW_QUERY_MS 이상 걸린 SQL 문 수", ("route",))
+
+_metrics = [REQUESTS, REQUEST_DURATION, QUERIES_PER_REQUEST, QUERY_DURATION, SLOW_QUERIES]
+_collectors = []
+
+
+def collector(fn):
+    """
+    GET /metrics 응답 시 호출할 함수 등록 (다른 모듈의 통계를 지표로 내보낼 때)
+
+    fn()은 (이름, 종류, 설명, [({라벨: 값}, 값), ...]) 목록을 반환합니다.
+    """
+    _collectors.append(fn)
+    return fn
+
+
+def render():
+    """Prometheus 텍스트 형식 (version 0.0.4)"""
+    lines = []
+    for metric in _metrics:
+        lines += metric.render()
+    for fn in _collectors:
+        for name, kind, help_text, samples in fn():
+            lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+            for labels, value in samples:
+                lines.append(f"{name}{_labels(labels.keys(), labels.values())} {_number(value)}")
+    return "\n".join(lines) + "\n"
+
+
+# ==================== 요청 ====================
+
+class RequestStats:
+    """요청 하나의 SQL 문 수와 시간 (라우트는 라우팅 후 scope에서 읽음)"""
+
+    __slots__ = ("scope", "queries", "query_time")
+
+    def __init__(self, scope):
+        self.scope = scope
+        self.queries = 0
+        self.query_time = 0.0
+
+    @property
+    def route(self):
+        route = self.scope.get("route")
+        return route.path if route is not None else UNMATCHED_ROUTE
+
+
+_current = contextvars.ContextVar("request_stats", default=None)
+
+
+class MetricsMiddleware:
+    """요청 처리 시간과 상태 코드, SQL 문 수를 기록하고 X-Query-Count 헤더를 붙이는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats(scope)
+        token = _current.set(stats)
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_headers(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                # 스트리밍 응답은 헤더를 보낸 시점까지의 SQL만 포함
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"x-query-count", str(stats.queries).encode()),
+                    (b"x-query-time-ms", f"{stats.query_time * 1000:.2f}".encode()),
+                ]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            _current.reset(token)
+            route = stats.route
+            method = scope["method"]
+            REQUESTS.inc((method, route, str(status)))
+            REQUEST_DURATION.observe((method, route), time.perf_counter() - started)
+            QUERIES_PER_REQUEST.observe((method, route), stats.queries)
+
+
+# ==================== SQL ====================
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    context._metrics_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - context._metrics_started
+    stats = _current.get()
+    route = NO_ROUTE
+    if stats is not None:
+        stats.queries += 1
+        stats.query_time += elapsed
+        route = stats.route
+    QUERY_DURATION.observe((route,), elapsed)
+    if elapsed * 1000 >= settings.slow_query_ms:
+        SLOW_QUERIES.inc((route,))
+        logger.warning(
+            "느린 쿼리 %.1fms [%s] %s", elapsed * 1000, route, " ".join(statement.split())[:1000]
+        )
+
+
+def instrument(engine):
+    """동기 엔진(비동기 엔진은 .sync_engine)의 SQL 문마다 시간과 요청별 개수 기록"""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
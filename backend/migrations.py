@@ -0,0 +1,311 @@
+"""
+데이터베이스 스키마 마이그레이션
+
+앱 import 시점에 create_all을 호출하는 대신, 버전이 매겨진 마이그레이션을
+별도 단계로 실행합니다. 적용된 버전은 schema_migrations 테이블에 기록되며
+이미 적용된 마이그레이션은 다시 실행되지 않습니다.
+
+사용법:
+    cd backend
+    python migrations.py            # 최신 버전까지 적용
+    python migrations.py status     # 적용 현황 확인
+"""
+import sys
+from datetime import datetime
+
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateTable
+
+from database import Base, engine
+import models  # noqa: F401  (모든 모델을 Base.metadata에 등록)
+import availability
+import regions
+import search
+import stats
+
+MIGRATIONS = []
+
+
+def migration(version, name):
+    """마이그레이션 함수 등록 데코레이터"""
+    def register(func):
+        MIGRATIONS.append((version, name, func))
+        return func
+    return register
+
+
+# ==================== 헬퍼 ====================
+
+def _has_column(conn, table_name, column_name):
+    columns = inspect(conn).get_columns(table_name)
+    return any(column["name"] == column_name for column in columns)
+
+
+def _add_column(conn, table_name, column_name, ddl):
+    """컬럼이 없을 때만 추가 (create_all로 만든 새 DB에는 이미 존재)"""
+    if not _has_column(conn, table_name, column_name):
+        conn.execute(text(f"ALTER TABLE {table_name} ADD COLUMN {column_name} {ddl}"))
+
+
+def _create_indexes(conn, model, *names):
+    """
+    모델에 선언된 인덱스 중 이름으로 지정한 것을 없을 때만 생성
+
+    모델에는 이후 마이그레이션에서 추가되는 컬럼의 인덱스도 선언되어 있으므로
+    각 마이그레이션은 자신이 추가하는 인덱스만 이름으로 지정합니다.
+    """
+    indexes = {index.name: index for index in model.__table__.indexes}
+    for name in names:
+        indexes[name].create(conn, checkfirst=True)
+
+
+# ==================== 마이그레이션 ====================
+
+@migration(1, "initial_schema")
+def initial_schema(conn):
+    # 기존 DB에는 없는 테이블만 생성됨
+    Base.metadata.create_all(bind=conn)
+
+
+@migration(2, "activity_counters")
+def activity_counters(conn):
+    _add_column(conn, "activities", "booking_count", "INTEGER NOT NULL DEFAULT 0")
+    _add_column(conn, "activities", "volunteer_count", "INTEGER NOT NULL DEFAULT 0")
+    conn.execute(text("""
+        UPDATE activities SET
+            booking_count = (
+                SELECT COUNT(*) FROM activity_bookings
+                WHERE activity_bookings.activity_id = activities.id
+            ),
+            volunteer_count = (
+                SELECT COUNT(*) FROM volunteers
+                WHERE volunteers.activity_id = activities.id
+            )
+    """))
+
+
+@migration(3, "unique_booking_per_user")
+def unique_booking_per_user(conn):
+    # 유니크 인덱스를 만들기 전에 기존 중복 예약 정리 (가장 먼저 한 예약만 유지)
+    conn.execute(text("""
+        DELETE FROM activity_bookings
+        WHERE id NOT IN (
+            SELECT MIN(id) FROM activity_bookings
+            GROUP BY user_id, activity_id
+        )
+    """))
+    conn.execute(text("""
+        UPDATE activities SET booking_count = (
+            SELECT COUNT(*) FROM activity_bookings
+            WHERE activity_bookings.activity_id = activities.id
+        )
+    """))
+    _create_indexes(conn, models.ActivityBooking, "uq_booking_user_activity")
+
+
+@migration(4, "hot_path_indexes")
+def hot_path_indexes(conn):
+    _create_indexes(
+        conn, models.Activity,
+        "ix_activities_category_activity_date", "ix_activities_activity_date",
+    )
+    _create_indexes(conn, models.ActivityBooking, "ix_activity_bookings_activity_id")
+    _create_indexes(conn, models.Subscription, "ix_subscriptions_user_id_is_active")
+    _create_indexes(conn, models.Volunteer, "ix_volunteers_activity_id")
+
+
+@migration(5, "keyset_pagination_indexes")
+def keyset_pagination_indexes(conn):
+    # 정렬 키 + rowid 순서로 인덱스를 따라 읽기 위한 인덱스
+    _create_indexes(
+        conn, models.Activity,
+        "ix_activities_created_at", "ix_activities_price", "ix_activities_category_created_at",
+    )
+    _create_indexes(conn, models.ActivityBooking, "ix_activity_bookings_user_id")
+
+
+@migration(6, "activity_search_index")
+def activity_search_index(conn):
+    # FTS5 색인은 SQLite 전용 (다른 DB는 LIKE 검색으로 대체)
+    if conn.dialect.name != "sqlite":
+        return
+    search.create_index(conn)
+    search.rebuild(conn)
+
+
+@migration(7, "regions")
+def region_hierarchy(conn):
+    models.Region.__table__.create(conn, checkfirst=True)
+    _add_column(conn, "activities", "region_id", "INTEGER REFERENCES regions(id)")
+    _add_column(conn, "users", "region_id", "INTEGER REFERENCES regions(id)")
+    _create_indexes(conn, models.Activity, "ix_activities_region_id")
+    _create_indexes(conn, models.User, "ix_users_region_id")
+
+    # 기존 장소/주소 문자열에서 지역 추출
+    for table_name, address_column in (("activities", "location"), ("users", "address")):
+        rows = conn.execute(text(
+            f"SELECT id, {address_column} FROM {table_name} WHERE region_id IS NULL"
+        )).fetchall()
+        resolved = {}
+        updates = []
+        for row_id, address in rows:
+            key = regions.to_path(regions.parse(address))
+            if key not in resolved:
+                resolved[key] = regions.resolve(conn, address)
+            if resolved[key] is not None:
+                updates.append({"id": row_id, "region_id": resolved[key]})
+        if updates:
+            conn.execute(
+                text(f"UPDATE {table_name} SET region_id = :region_id WHERE id = :id"),
+                updates,
+            )
+
+
+@migration(8, "resource_versions")
+def resource_versions(conn):
+    # ETag용 버전 카운터 (행이 없으면 버전 0으로 간주)
+    models.ResourceVersion.__table__.create(conn, checkfirst=True)
+
+
+@migration(9, "external_ids")
+def external_ids(conn):
+    # 일괄 가져오기 upsert 키 (NULL은 여러 행이 가질 수 있음)
+    for model in (models.Activity, models.User, models.Subscription):
+        _add_column(conn, model.__tablename__, "external_id", "VARCHAR(100)")
+        _create_indexes(conn, model, f"ix_{model.__tablename__}_external_id")
+
+
+@migration(10, "activity_lifecycle")
+def activity_lifecycle(conn):
+    # 지난 활동 표시와 백그라운드 작업 실행 권한 테이블
+    _add_column(conn, "activities", "is_past", "BOOLEAN NOT NULL DEFAULT FALSE")
+    conn.execute(
+        text("UPDATE activities SET is_past = TRUE WHERE activity_date < :now AND is_past = FALSE"),
+        {"now": datetime.utcnow()},
+    )
+    _create_indexes(
+        conn, models.Activity,
+        "ix_activities_is_past_activity_date", "ix_activities_is_past_created_at",
+        "ix_activities_is_past_price", "ix_activities_category_is_past_created_at",
+        "ix_activities_category_is_past_activity_date",
+    )
+    _create_indexes(conn, models.Subscription, "ix_subscriptions_is_active_end_date")
+    models.SchedulerLease.__table__.create(conn, checkfirst=True)
+
+
+@migration(11, "summary_tables")
+def summary_tables(conn):
+    # 대시보드 요약 테이블 (이후에는 쓰기마다 증감)
+    models.ActivityStat.__table__.create(conn, checkfirst=True)
+    models.SubscriptionStat.__table__.create(conn, checkfirst=True)
+    stats.rebuild_activity_stats(conn)
+    stats.rebuild_subscription_stats(conn)
+
+
+@migration(12, "activity_description_last")
+def activity_description_last(conn):
+    # SQLite는 행을 컬럼 선언 순서대로 저장하므로, 긴 description 뒤의 컬럼(장소, 정원, 가격,
+    # 카운터 등)을 읽으려면 description의 overflow 페이지를 모두 따라가야 함.
+    # 모델 순서(description 마지막)로 테이블을 다시 만들어 설명을 읽지 않는 쿼리는
+    # 행이 있는 페이지만 읽게 함 (PostgreSQL은 긴 값을 TOAST로 따로 저장)
+    if conn.dialect.name != "sqlite":
+        return
+    table = models.Activity.__table__
+    current = [row[1] for row in conn.execute(text("PRAGMA table_info(activities)"))]
+    if current[-1] == "description":
+        return
+    ddl = str(CreateTable(table).compile(conn))
+    conn.execute(text(ddl.replace("CREATE TABLE activities ", "CREATE TABLE activities_rebuild ", 1)))
+    columns = ", ".join(column.name for column in table.columns)
+    conn.execute(text(f"INSERT INTO activities_rebuild ({columns}) SELECT {columns} FROM activities"))
+    conn.execute(text("DROP TABLE activities"))
+    conn.execute(text("ALTER TABLE activities_rebuild RENAME TO activities"))
+    for index in table.indexes:
+        index.create(conn, checkfirst=True)
+
+
+@migration(13, "activity_day_stats")
+def activity_day_stats(conn):
+    # 월 달력용 일자별 요약 (이후에는 활동/예약 쓰기마다 증감)
+    models.ActivityDayStat.__table__.create(conn, checkfirst=True)
+    stats.rebuild_day_stats(conn)
+
+
+@migration(14, "volunteer_slots")
+def volunteer_slots(conn):
+    # 자원봉사자 매칭용 지역과 구조화한 가능 시간 (기존 신청은 활동 지역과 자유 형식 문자열에서)
+    _add_column(conn, "volunteers", "region_id", "INTEGER REFERENCES regions(id)")
+    _create_indexes(conn, models.Volunteer, "ix_volunteers_region_id")
+    models.VolunteerSlot.__table__.create(conn, checkfirst=True)
+    conn.execute(text("""
+        UPDATE volunteers SET region_id = (
+            SELECT region_id FROM activities WHERE activities.id = volunteers.activity_id
+        ) WHERE region_id IS NULL
+    """))
+
+    rows = conn.execute(text("""
+        SELECT id, availability FROM volunteers
+        WHERE availability IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM volunteer_slots WHERE volunteer_id = volunteers.id)
+    """)).fetchall()
+    parsed = {}
+    slot_rows = []
+    for volunteer_id, text_value in rows:
+        if text_value not in parsed:
+            parsed[text_value] = availability.normalize(availability.parse(text_value))
+        slot_rows.extend(availability.slot_rows(volunteer_id, parsed[text_value]))
+    if slot_rows:
+        conn.execute(models.VolunteerSlot.__table__.insert(), slot_rows)
+
+
+# ==================== 실행 ====================
+
+def _ensure_version_table(conn):
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS schema_migrations (
+            version INTEGER PRIMARY KEY,
+            name VARCHAR(100) NOT NULL,
+            applied_at TIMESTAMP NOT NULL
+        )
+    """))
+
+
+def applied_versions(bind=engine):
+    with bind.begin() as conn:
+        _ensure_version_table(conn)
+        rows = conn.execute(text("SELECT version FROM schema_migrations"))
+        return {row[0] for row in rows}
+
+
+def upgrade(bind=engine, verbose=False):
+    """적용되지 않은 마이그레이션을 버전 순서대로 각각의 트랜잭션에서 실행"""
+    applied = applied_versions(bind)
+    for version, name, func in sorted(MIGRATIONS, key=lambda m: m[0]):
+        if version in applied:
+            continue
+        with bind.begin() as conn:
+            func(conn)
+            conn.execute(
+                text(
+                    "INSERT INTO schema_migrations (version, name, applied_at) "
+                    "VALUES (:version, :name, :applied_at)"
+                ),
+                {"version": version, "name": name, "applied_at": datetime.utcnow()},
+            )
+        if verbose:
+            print(f"  적용: {version:04d}_{name}")
+
+
+def status(bind=engine):
+    applied = applied_versions(bind)
+    for version, name, _ in sorted(MIGRATIONS, key=lambda m: m[0]):
+        mark = "✅" if version in applied else "⏳"
+        print(f"{mark} {version:04d}_{name}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "status":
+        status()
+    else:
+        upgrade(verbose=True)
+        print("✅ 마이그레이션 완료")
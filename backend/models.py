@@ -1,9 +1,22 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, Float, Boolean, Date, DateTime, ForeignKey, Text, Index, false
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
 
 
+class Region(Base):
+    """행정구역 (시/도 → 시/군/구 → 읍/면/동)"""
+    __tablename__ = "regions"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(50), nullable=False, index=True)  # 강남구
+    level = Column(Integer, nullable=False)  # 1: 시/도, 2: 시/군/구, 3: 읍/면/동
+    parent_id = Column(Integer, ForeignKey("regions.id"), index=True)
+    path = Column(String(200), nullable=False, unique=True, index=True)  # 서울특별시/강남구
+    
+    parent = relationship("Region", remote_side=[id])
+
+
 class User(Base):
     __tablename__ = "users"
     
@@ -13,37 +26,64 @@ class User(Base):
     phone = Column(String(20))
     age = Column(Integer)
     address = Column(String(200))
+    region_id = Column(Integer, ForeignKey("regions.id"), index=True)  # address에서 추출
+    external_id = Column(String(100), unique=True, index=True)  # 일괄 가져오기 upsert 키
     created_at = Column(DateTime, default=datetime.utcnow)
     
+    region = relationship("Region")
     subscriptions = relationship("Subscription", back_populates="user")
     bookings = relationship("ActivityBooking", back_populates="user")
 
 
 class Activity(Base):
     __tablename__ = "activities"
+    __table_args__ = (
+        Index("ix_activities_category_activity_date", "category", "activity_date"),
+        Index("ix_activities_category_created_at", "category", "created_at"),
+        # 지나지 않은 활동(is_past = false)만 정렬 순서대로 읽는 기본 목록용
+        # (지난 활동을 건너뛰며 읽거나 따로 정렬하지 않도록 정렬 키 앞에 is_past)
+        Index("ix_activities_is_past_activity_date", "is_past", "activity_date"),
+        Index("ix_activities_is_past_created_at", "is_past", "created_at"),
+        Index("ix_activities_is_past_price", "is_past", "price"),
+        Index("ix_activities_category_is_past_created_at", "category", "is_past", "created_at"),
+        Index("ix_activities_category_is_past_activity_date", "category", "is_past", "activity_date"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(200), nullable=False)
-    description = Column(Text)
     category = Column(String(50), nullable=False)  # 도예/공예, 수영, 커피 시음 등
     location = Column(String(200), nullable=False)
+    region_id = Column(Integer, ForeignKey("regions.id"), index=True)  # location에서 추출
     instructor = Column(String(100))
     max_participants = Column(Integer, default=20)
     duration_minutes = Column(Integer)  # 활동 시간 (분)
-    price = Column(Float)  # 정가 (구독으로 할인)
+    price = Column(Float, index=True)  # 정가 (구독으로 할인)
     image_url = Column(String(500))
-    created_at = Column(DateTime, default=datetime.utcnow)
-    activity_date = Column(DateTime)  # 활동 일시
+    external_id = Column(String(100), unique=True, index=True)  # 일괄 가져오기 upsert 키
+    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    activity_date = Column(DateTime, index=True)  # 활동 일시
+    # activity_date가 지났는지 (저장 시 계산, 이후에는 백그라운드 작업이 일괄 갱신)
+    is_past = Column(Boolean, nullable=False, default=False, server_default=false())
+    
+    # 집계 카운터 (예약/취소/자원봉사 신청 시 함께 갱신)
+    booking_count = Column(Integer, nullable=False, default=0, server_default="0")
+    volunteer_count = Column(Integer, nullable=False, default=0, server_default="0")
     
+    # 길이가 긴 컬럼은 마지막에 둠 (SQLite는 선언 순서대로 저장하므로 앞 컬럼만 읽는
+    # 쿼리가 설명의 overflow 페이지를 따라가지 않음)
+    description = Column(Text)
+    
+    region = relationship("Region")
     bookings = relationship("ActivityBooking", back_populates="activity")
     volunteers = relationship("Volunteer", back_populates="activity")
-    
-    # 계산 필드 (API 응답용)
-    booking_count = 0
 
 
 class Subscription(Base):
     __tablename__ = "subscriptions"
+    __table_args__ = (
+        Index("ix_subscriptions_user_id_is_active", "user_id", "is_active"),
+        Index("ix_subscriptions_is_active_end_date", "is_active", "end_date"),  # 만료 작업
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -51,6 +91,7 @@ class Subscription(Base):
     start_date = Column(DateTime, default=datetime.utcnow)
     end_date = Column(DateTime)
     is_active = Column(Boolean, default=True)
+    external_id = Column(String(100), unique=True, index=True)  # 일괄 가져오기 upsert 키
     created_at = Column(DateTime, default=datetime.utcnow)
     
     user = relationship("User", back_populates="subscriptions")
@@ -58,10 +99,15 @@ class Subscription(Base):
 
 class ActivityBooking(Base):
     __tablename__ = "activity_bookings"
+    __table_args__ = (
+        # 동일 사용자의 중복 예약 방지 (동시 요청에서도 DB가 보장)
+        # user_id가 앞에 있어 사용자별 예약 조회 인덱스로도 사용됨
+        Index("uq_booking_user_activity", "user_id", "activity_id", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    activity_id = Column(Integer, ForeignKey("activities.id"), nullable=False)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    activity_id = Column(Integer, ForeignKey("activities.id"), nullable=False, index=True)
     booking_date = Column(DateTime, default=datetime.utcnow)
     notes = Column(Text)  # 특별 요청사항
     
@@ -73,13 +119,86 @@ class Volunteer(Base):
     __tablename__ = "volunteers"
     
     id = Column(Integer, primary_key=True, index=True)
-    activity_id = Column(Integer, ForeignKey("activities.id"), nullable=False)
+    activity_id = Column(Integer, ForeignKey("activities.id"), nullable=False, index=True)
     name = Column(String(100), nullable=False)
     email = Column(String(100), nullable=False)
     phone = Column(String(20))
-    availability = Column(String(200))  # 가능한 시간
+    availability = Column(String(200))  # 가능한 시간 (자유 형식, 구조화한 구간은 slots)
     experience = Column(Text)  # 관련 경험
+    region_id = Column(Integer, ForeignKey("regions.id"), index=True)  # 신청한 활동의 지역
     created_at = Column(DateTime, default=datetime.utcnow)
     
     activity = relationship("Activity", back_populates="volunteers")
 
+
+class VolunteerSlot(Base):
+    """자원봉사자의 매주 반복되는 가능 시간 구간 (availability.py)"""
+    __tablename__ = "volunteer_slots"
+    
+    id = Column(Integer, primary_key=True)
+    volunteer_id = Column(Integer, ForeignKey("volunteers.id"), nullable=False, index=True)
+    weekday = Column(Integer, nullable=False)  # 0=월 ... 6=일
+    start_minute = Column(Integer, nullable=False)  # 0시부터의 분
+    end_minute = Column(Integer, nullable=False)  # 1440 = 24:00
+
+
+
+class ResourceVersion(Base):
+    """리소스별 버전 카운터 (쓰기마다 증가, ETag 계산에 사용)"""
+    __tablename__ = "resource_versions"
+    
+    key = Column(String(100), primary_key=True)  # activity:1, activity:1:bookings, activities ...
+    version = Column(Integer, nullable=False, default=1)
+
+
+class SchedulerLease(Base):
+    """백그라운드 작업 실행 권한 (여러 워커 중 만료 전까지 owner 하나만 실행)"""
+    __tablename__ = "scheduler_leases"
+    
+    name = Column(String(50), primary_key=True)
+    owner = Column(String(100), nullable=False)  # 호스트:pid:임의값
+    expires_at = Column(DateTime, nullable=False)
+
+
+class ActivityStat(Base):
+    """
+    카테고리/지역별 활동 요약 (stats.py)
+    
+    쓰기 엔드포인트가 같은 트랜잭션에서 변화량을 더하고, 백그라운드 작업이 주기적으로
+    activities 테이블에서 다시 계산해 맞춥니다.
+    """
+    __tablename__ = "activity_stats"
+    
+    dimension = Column(String(20), primary_key=True)  # category, region
+    key = Column(String(100), primary_key=True)  # 카테고리 이름 또는 region_id ("" = 지역 미상)
+    activities = Column(Integer, nullable=False, default=0, server_default="0")
+    upcoming_activities = Column(Integer, nullable=False, default=0, server_default="0")
+    capacity = Column(Integer, nullable=False, default=0, server_default="0")  # 정원 합계
+    bookings = Column(Integer, nullable=False, default=0, server_default="0")
+    capacity_bookings = Column(Integer, nullable=False, default=0, server_default="0")  # 정원 있는 활동의 신청자
+    volunteers = Column(Integer, nullable=False, default=0, server_default="0")
+    staffed_activities = Column(Integer, nullable=False, default=0, server_default="0")  # 자원봉사자 1명 이상
+
+
+class ActivityDayStat(Base):
+    """
+    일자/카테고리별 활동 수와 정원 (stats.py, 월 달력 조회용)
+    
+    activity_date가 있는 활동만 집계하며, 한 달 달력은 기본 키 범위 조회 한 번으로 읽습니다.
+    """
+    __tablename__ = "activity_day_stats"
+    
+    day = Column(Date, primary_key=True)  # activity_date의 날짜
+    category = Column(String(50), primary_key=True)
+    activities = Column(Integer, nullable=False, default=0, server_default="0")
+    capacity = Column(Integer, nullable=False, default=0, server_default="0")  # 정원 합계
+    bookings = Column(Integer, nullable=False, default=0, server_default="0")
+    capacity_bookings = Column(Integer, nullable=False, default=0, server_default="0")  # 정원 있는 활동의 신청자
+
+
+class SubscriptionStat(Base):
+    """요금제별 활성 구독 수 (stats.py)"""
+    __tablename__ = "subscription_stats"
+    
+    plan_type = Column(String(50), primary_key=True)
+    active_subscriptions = Column(Integer, nullable=False, default=0, server_default="0")
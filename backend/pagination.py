@@ -0,0 +1,93 @@
+"""
+키셋(커서) 기반 페이지네이션
+
+OFFSET 대신 마지막으로 본 (정렬 키, id) 이후의 행만 인덱스 범위로 읽기 때문에
+몇 번째 페이지든 첫 페이지와 같은 비용으로 조회됩니다.
+
+정렬 키가 NULL인 행은 방향과 관계없이 항상 마지막에 옵니다.
+NULL이 섞인 범위 조건(`... OR col IS NULL`)은 인덱스 범위 검색을 깨뜨리므로
+NULL이 아닌 구간과 NULL 구간을 각각 별도의 범위 쿼리로 읽습니다.
+"""
+import base64
+import json
+from datetime import datetime
+
+from fastapi import HTTPException
+from sqlalchemy import DateTime, tuple_
+
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+def encode_cursor(sort_key, value, row_id):
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    payload = json.dumps({"s": sort_key, "v": value, "id": row_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor, sort_key, column):
+    """커서 문자열을 (정렬 값, id)로 복원. 다른 정렬로 만든 커서는 거부"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if payload["s"] != sort_key:
+            raise ValueError("sort mismatch")
+        value = payload["v"]
+        if value is not None and isinstance(column.type, DateTime):
+            value = datetime.fromisoformat(value)
+        return value, int(payload["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다")
+
+
+def paginate(query, sort_key, column, id_column, limit, cursor=None, descending=False,
+             nullable=None, row_key=None):
+    """
+    (정렬 키, id) 순서로 limit개를 조회하고 (items, next_cursor)를 반환
+
+    column과 id_column이 같으면(id 정렬) 단일 키 페이지네이션이 됩니다.
+    정렬 키가 엔티티 속성이 아닌 경우(검색 점수 등) row_key로 행에서
+    (정렬 값, id)를 꺼내는 방법을 지정합니다.
+    """
+    single_key = column is id_column
+    if nullable is None:
+        nullable = not single_key and getattr(column.expression, "nullable", True)
+    if row_key is None:
+        row_key = lambda row: (getattr(row, column.key), getattr(row, id_column.key))
+
+    value, last_id = (None, None)
+    if cursor:
+        value, last_id = decode_cursor(cursor, sort_key, column)
+
+    def ordered(q, *columns):
+        return q.order_by(*[c.desc() if descending else c.asc() for c in columns])
+
+    rows = []
+    # 1) 정렬 값이 있는 구간
+    if not cursor or value is not None:
+        q = query
+        if nullable:
+            q = q.filter(column.isnot(None))
+        if cursor:
+            if single_key:
+                q = q.filter(id_column < last_id if descending else id_column > last_id)
+            else:
+                key = tuple_(column, id_column)
+                bound = tuple_(value, last_id)
+                q = q.filter(key < bound if descending else key > bound)
+        keys = (id_column,) if single_key else (column, id_column)
+        rows = ordered(q, *keys).limit(limit + 1).all()
+
+    # 2) 정렬 값이 NULL인 구간 (앞 구간을 다 읽은 경우에만)
+    if nullable and len(rows) <= limit:
+        q = query.filter(column.is_(None))
+        if cursor and value is None:
+            q = q.filter(id_column < last_id if descending else id_column > last_id)
+        rows += ordered(q, id_column).limit(limit + 1 - len(rows)).all()
+
+    items = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(sort_key, *row_key(items[-1]))
+    return items, next_cursor
@@ -0,0 +1,130 @@
+"""
+행정구역 계층 (시/도 → 시/군/구 → 읍/면/동)
+
+활동 장소(Activity.location)와 사용자 주소(User.address)의 자유 형식 문자열에서
+행정구역을 추출해 regions 테이블에 저장하고, 각 행에 region_id를 연결합니다.
+
+지역 필터는 regions.path("서울특별시/강남구")의 인덱스 범위 검색으로 하위 지역까지
+포함한 region_id 목록을 구한 뒤, activities.region_id 인덱스로 조회합니다.
+"""
+import re
+
+from sqlalchemy import or_, select
+
+from models import Region
+
+LEVEL_SIDO = 1
+LEVEL_SIGUNGU = 2
+LEVEL_DONG = 3
+
+# (정식 명칭, 약칭) - "서울", "서울시" 같은 표기를 정식 명칭으로 통일
+_SIDO = [
+    ("서울특별시", "서울"), ("부산광역시", "부산"), ("대구광역시", "대구"),
+    ("인천광역시", "인천"), ("광주광역시", "광주"), ("대전광역시", "대전"),
+    ("울산광역시", "울산"), ("세종특별자치시", "세종"), ("경기도", "경기"),
+    ("강원특별자치도", "강원"), ("충청북도", "충북"), ("충청남도", "충남"),
+    ("전북특별자치도", "전북"), ("전라남도", "전남"), ("경상북도", "경북"),
+    ("경상남도", "경남"), ("제주특별자치도", "제주"),
+]
+_SIDO_ALIASES = {"강원도": "강원특별자치도", "전라북도": "전북특별자치도", "제주도": "제주특별자치도"}
+for _name, _short in _SIDO:
+    for _alias in (_name, _short, _short + "시", _short + "도"):
+        _SIDO_ALIASES.setdefault(_alias, _name)
+
+_SIGUNGU = re.compile(r"\S+[시군구]$")
+_DONG = re.compile(r"\S+(동|읍|면|\d가)$")
+
+PATH_SEPARATOR = "/"
+
+
+def parse(address):
+    """주소 문자열에서 [시/도, 시/군/구, 읍/면/동] 이름 목록 추출 (알 수 없으면 빈 목록)"""
+    tokens = (address or "").split()
+    if not tokens or tokens[0] not in _SIDO_ALIASES:
+        return []
+    names = [_SIDO_ALIASES[tokens[0]]]
+
+    # "성남시 분당구"처럼 시 아래 구가 있는 경우 하나의 시/군/구로 묶음
+    i = 1
+    sigungu = []
+    while i < len(tokens) and _SIGUNGU.match(tokens[i]):
+        sigungu.append(tokens[i])
+        i += 1
+    if not sigungu:
+        return names
+    names.append(" ".join(sigungu))
+
+    if i < len(tokens) and _DONG.match(tokens[i]):
+        names.append(tokens[i])
+    return names
+
+
+def to_path(names):
+    return PATH_SEPARATOR.join(names)
+
+
+def _insert_ignore(conn):
+    """동시에 같은 지역을 만들어도 충돌하지 않는 INSERT"""
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(Region.__table__).on_conflict_do_nothing(index_elements=["path"])
+
+
+def resolve(conn, address):
+    """주소에 해당하는 가장 하위 지역 id (없는 지역은 상위부터 생성). 추출 실패 시 None"""
+    names = parse(address)
+    if not names:
+        return None
+
+    region_id = conn.execute(
+        select(Region.id).where(Region.path == to_path(names))
+    ).scalar()
+    if region_id is not None:
+        return region_id
+
+    parent_id = None
+    for level, name in enumerate(names, start=LEVEL_SIDO):
+        path = to_path(names[:level])
+        conn.execute(
+            _insert_ignore(conn).values(name=name, level=level, parent_id=parent_id, path=path)
+        )
+        parent_id = conn.execute(select(Region.id).where(Region.path == path)).scalar()
+    return parent_id
+
+
+def lookup_paths(conn, region):
+    """
+    지역 필터 값을 regions.path 목록으로 변환
+
+    "서울특별시/강남구" 같은 경로, "서울 강남구" 같은 주소 표기,
+    "강남구" 같은 지역 이름을 모두 받습니다.
+    """
+    region = region.strip()
+    if PATH_SEPARATOR in region:
+        return [region]
+    names = parse(region)
+    if names:
+        return [to_path(names)]
+    return list(conn.execute(select(Region.path).where(Region.name == region)).scalars())
+
+
+def subtree_ids(paths):
+    """주어진 경로들과 그 하위 지역의 id 서브쿼리 (path 인덱스 범위 검색)"""
+    conditions = []
+    for path in paths:
+        # "/" 다음 문자인 "0"을 상한으로 두어 "path/..."를 범위 조건으로 검색
+        prefix = path + PATH_SEPARATOR
+        upper = path + chr(ord(PATH_SEPARATOR) + 1)
+        conditions.append(Region.path == path)
+        conditions.append((Region.path >= prefix) & (Region.path < upper))
+    return select(Region.id).where(or_(*conditions))
+
+
+def ancestor_path(conn, region_id, level=LEVEL_SIGUNGU):
+    """지역의 특정 단계 상위 경로 (예: 동 → 소속 시/군/구 경로)"""
+    path = conn.execute(select(Region.path).where(Region.id == region_id)).scalar()
+    if path is None:
+        return None
+    return to_path(path.split(PATH_SEPARATOR)[:level])
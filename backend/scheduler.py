@@ -0,0 +1,201 @@
+"""
+프로세스 내 백그라운드 작업 스케줄러
+
+앱이 시작되면 이벤트 루프에 작업 루프 하나를 띄우고, SCHEDULER_TICK_SECONDS마다
+실행 권한(scheduler_leases 테이블의 행 하나)을 얻거나 연장한 뒤 주기가 된 작업을
+실행합니다. 여러 워커(uvicorn --workers, 여러 서버)가 같은 DB를 쓰더라도 권한을 가진
+워커 하나만 작업을 실행하며, 그 워커가 멈추면 SCHEDULER_LEASE_SECONDS 뒤 다른 워커가
+넘겨받습니다.
+
+권한 획득은 INSERT ... ON CONFLICT DO UPDATE ... WHERE (내 권한이거나 만료됨) 한 문장이라
+두 워커가 동시에 시도해도 하나만 성공합니다.
+
+작업마다 실행 횟수, 바뀐 행 수, 소요 시간, 마지막 오류를 기록하며
+GET /api/scheduler/stats에서 확인합니다.
+"""
+import asyncio
+import os
+import socket
+import time
+import uuid
+from contextlib import suppress
+from datetime import datetime, timedelta
+
+from sqlalchemy import or_, update
+
+import lifecycle
+import stats
+from config import settings
+from database import AsyncSessionLocal
+from models import SchedulerLease
+
+LEASE_NAME = "lifecycle"
+
+
+def _insert(conn):
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(SchedulerLease.__table__)
+
+
+class Job:
+    """
+    주기 작업
+
+    sweep(conn, now)은 쓰기 트랜잭션 안에서 실행되어 바뀐 행의 id 목록을 반환하고,
+    after_commit(ids)은 커밋 후 캐시 무효화 등에 사용합니다.
+    """
+
+    def __init__(self, name, interval, sweep, after_commit=None):
+        self.name = name
+        self.interval = interval
+        self.sweep = sweep
+        self.after_commit = after_commit
+        self.next_run = 0.0  # time.monotonic() 기준, 0이면 권한을 얻자마자 실행
+        self.runs = 0
+        self.failures = 0
+        self.rows = 0
+        self.last_rows = None
+        self.last_duration_ms = None
+        self.last_run_at = None
+        self.last_error = None
+
+    def stats(self):
+        return {
+            "interval_seconds": self.interval,
+            "runs": self.runs,
+            "failures": self.failures,
+            "rows": self.rows,
+            "last_rows": self.last_rows,
+            "last_duration_ms": self.last_duration_ms,
+            "last_run_at": self.last_run_at,
+            "last_error": self.last_error,
+        }
+
+
+class Scheduler:
+    def __init__(self, jobs, tick=15, lease_seconds=60, session_factory=AsyncSessionLocal):
+        self.jobs = {job.name: job for job in jobs}
+        self.tick = tick
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.is_leader = False
+        self.leader_since = None
+        self.lease_errors = 0
+        self._session_factory = session_factory
+        self._task = None
+
+    # ---------- 실행 권한 ----------
+
+    async def acquire(self):
+        """실행 권한을 얻거나 연장하고 권한 보유 여부를 반환"""
+        now = datetime.utcnow()
+        table = SchedulerLease.__table__
+        async with self._session_factory() as db:
+            conn = await db.connection()
+            stmt = _insert(conn).values(
+                name=LEASE_NAME, owner=self.owner,
+                expires_at=now + timedelta(seconds=self.lease_seconds),
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[table.c.name],
+                set_={"owner": stmt.excluded.owner, "expires_at": stmt.excluded.expires_at},
+                where=or_(table.c.owner == self.owner, table.c.expires_at < now),
+            ).returning(table.c.owner)
+            acquired = (await db.execute(stmt)).scalar() is not None
+            await db.commit()
+        if acquired and not self.is_leader:
+            self.leader_since = now
+        self.is_leader = acquired
+        return acquired
+
+    async def release(self):
+        """종료 시 권한을 바로 만료시켜 다른 워커가 기다리지 않고 넘겨받게 함"""
+        async with self._session_factory() as db:
+            await db.execute(
+                update(SchedulerLease)
+                .where(SchedulerLease.name == LEASE_NAME, SchedulerLease.owner == self.owner)
+                .values(expires_at=datetime.utcnow())
+            )
+            await db.commit()
+        self.is_leader = False
+
+    # ---------- 작업 실행 ----------
+
+    async def run_job(self, job):
+        """작업 하나를 실행하고 지표를 기록 (실패해도 다음 주기에 다시 시도)"""
+        now = datetime.utcnow()
+        job.next_run = time.monotonic() + job.interval
+        started = time.perf_counter()
+        try:
+            async with self._session_factory() as db:
+                conn = await db.connection()
+                changed = await conn.run_sync(job.sweep, now)
+                await db.commit()
+        except Exception as exc:
+            job.failures += 1
+            job.last_error = f"{type(exc).__name__}: {exc}"
+            return None
+        if job.after_commit:
+            job.after_commit(changed)
+        job.runs += 1
+        job.rows += len(changed)
+        job.last_rows = len(changed)
+        job.last_duration_ms = round((time.perf_counter() - started) * 1000, 2)
+        job.last_run_at = now
+        job.last_error = None
+        return changed
+
+    async def run(self):
+        while True:
+            try:
+                if await self.acquire():
+                    for job in self.jobs.values():
+                        if time.monotonic() >= job.next_run:
+                            await self.run_job(job)
+            except Exception:
+                # DB에 잠시 연결할 수 없으면 권한이 없는 것으로 보고 다음 주기에 재시도
+                self.lease_errors += 1
+                self.is_leader = False
+            await asyncio.sleep(self.tick)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self.is_leader:
+            await self.release()
+
+    def stats(self):
+        return {
+            "owner": self.owner,
+            "running": self._task is not None,
+            "is_leader": self.is_leader,
+            "leader_since": self.leader_since,
+            "lease_seconds": self.lease_seconds,
+            "tick_seconds": self.tick,
+            "lease_errors": self.lease_errors,
+            "jobs": {name: job.stats() for name, job in self.jobs.items()},
+        }
+
+
+scheduler = Scheduler(
+    [
+        Job("expire_subscriptions", settings.subscription_sweep_seconds,
+            lifecycle.expire_subscriptions, lifecycle.subscriptions_expired),
+        Job("mark_past_activities", settings.activity_sweep_seconds,
+            lifecycle.mark_past_activities, lifecycle.activities_passed),
+        # 바로잡은 요약 행 수가 0이 아니면 증감이 빠진 쓰기 경로가 있다는 뜻
+        Job("rebuild_stats", settings.stats_rebuild_seconds, stats.rebuild, stats.rebuilt),
+    ],
+    tick=settings.scheduler_tick_seconds,
+    lease_seconds=settings.scheduler_lease_seconds,
+)
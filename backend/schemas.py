@@ -1,6 +1,19 @@
-from pydantic import BaseModel, EmailStr
-from datetime import datetime
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field
+from datetime import date, datetime, time
+from typing import List, Optional
+
+
+# ==================== Region 스키마 ====================
+
+class RegionResponse(BaseModel):
+    id: int
+    name: str
+    level: int
+    parent_id: Optional[int] = None
+    path: str
+    
+    class Config:
+        from_attributes = True
 
 
 # ==================== Activity 스키마 ====================
@@ -37,13 +50,68 @@ class ActivityUpdate(BaseModel):
 
 class ActivityResponse(ActivityBase):
     id: int
+    region_id: Optional[int] = None
     created_at: datetime
     booking_count: Optional[int] = 0
+    volunteer_count: Optional[int] = 0
+    is_past: bool = False
     
     class Config:
         from_attributes = True
 
 
+class ActivitySummary(BaseModel):
+    """목록 카드용 요약 (fields=summary, 설명은 앞부분만)"""
+    id: int
+    title: str
+    category: str
+    location: str
+    instructor: Optional[str] = None
+    description_preview: Optional[str] = None  # description 앞 100자
+    image_url: Optional[str] = None
+    max_participants: Optional[int] = None
+    duration_minutes: Optional[int] = None
+    booking_count: int = 0
+
+    class Config:
+        from_attributes = True
+
+
+class ActivityFields(BaseModel):
+    """fields=id,title,...로 고른 ActivityResponse 필드만 (id는 항상 포함, 고르지 않은 필드는 응답에 없음)"""
+    id: int
+    title: Optional[str] = None
+    description: Optional[str] = None
+    category: Optional[str] = None
+    location: Optional[str] = None
+    instructor: Optional[str] = None
+    max_participants: Optional[int] = None
+    duration_minutes: Optional[int] = None
+    price: Optional[float] = None
+    image_url: Optional[str] = None
+    activity_date: Optional[datetime] = None
+    region_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    booking_count: Optional[int] = None
+    volunteer_count: Optional[int] = None
+    is_past: Optional[bool] = None
+
+
+class ActivityPage(BaseModel):
+    items: List[ActivityResponse]
+    next_cursor: Optional[str] = None
+
+
+class ActivitySummaryPage(BaseModel):
+    items: List[ActivitySummary]
+    next_cursor: Optional[str] = None
+
+
+class ActivityFieldsPage(BaseModel):
+    items: List[ActivityFields]
+    next_cursor: Optional[str] = None
+
+
 # ==================== User 스키마 ====================
 
 class UserBase(BaseModel):
@@ -60,6 +128,7 @@ class UserCreate(UserBase):
 
 class UserResponse(UserBase):
     id: int
+    region_id: Optional[int] = None
     created_at: datetime
     
     class Config:
@@ -109,6 +178,17 @@ class BookingResponse(BookingBase):
         from_attributes = True
 
 
+class BookingDetail(BookingResponse):
+    """expand=activity,user로 관련 객체를 함께 담는 예약 응답"""
+    activity: Optional[ActivityResponse] = None
+    user: Optional[UserResponse] = None
+
+
+class BookingPage(BaseModel):
+    items: List[BookingDetail]
+    next_cursor: Optional[str] = None
+
+
 # ==================== Volunteer 스키마 ====================
 
 class VolunteerBase(BaseModel):
@@ -119,15 +199,145 @@ class VolunteerBase(BaseModel):
     experience: Optional[str] = None
 
 
+class AvailabilitySlot(BaseModel):
+    """매주 반복되는 가능 시간 (end가 start 이하면 다음 날까지, 00:00은 24:00)"""
+    weekday: int = Field(ge=0, le=6)  # 0=월 ... 6=일
+    start: time
+    end: time
+
+
 class VolunteerCreate(VolunteerBase):
     activity_id: int
+    # 없으면 availability 문자열("평일 오전", "월수금 14:00-17:00")에서 해석
+    availability_slots: Optional[List[AvailabilitySlot]] = None
 
 
 class VolunteerResponse(VolunteerBase):
     id: int
     activity_id: int
+    region_id: Optional[int] = None
     created_at: datetime
     
     class Config:
         from_attributes = True
 
+
+class VolunteerDetail(VolunteerResponse):
+    """expand=activity로 활동을 함께 담는 자원봉사자 응답"""
+    activity: Optional[ActivityResponse] = None
+
+
+class VolunteerPage(BaseModel):
+    items: List[VolunteerDetail]
+    next_cursor: Optional[str] = None
+
+
+class VolunteerCandidates(BaseModel):
+    """활동 시간 전체가 가능하고 같은 시/군/구인 자원봉사자 (최근 신청 순)"""
+    activity_id: int
+    total: int  # 조건에 맞는 전체 후보 수
+    items: List[VolunteerResponse]
+
+
+class UnstaffedActivity(BaseModel):
+    id: int
+    title: str
+    category: str
+    location: str
+    region_id: Optional[int] = None
+    activity_date: Optional[datetime] = None
+    duration_minutes: Optional[int] = None
+    candidate_count: int  # volunteer-candidates의 total
+
+
+class UnstaffedActivityPage(BaseModel):
+    items: List[UnstaffedActivity]
+    next_cursor: Optional[str] = None
+
+
+class ActivityDetailBundle(BaseModel):
+    """활동 상세 페이지용 묶음 응답 (활동 + 예약/자원봉사자 첫 페이지)"""
+    activity: ActivityResponse
+    bookings: BookingPage
+    volunteers: VolunteerPage
+
+
+class CategoryCount(BaseModel):
+    name: str
+    activity_count: int  # 지나지 않은 활동 수
+
+
+class CategoryList(BaseModel):
+    categories: List[CategoryCount]
+
+
+class CalendarDay(BaseModel):
+    date: date
+    activities: int
+    bookings: int
+    capacity: int  # 정원 있는 활동의 정원 합계
+    remaining_seats: int  # 정원 있는 활동의 남은 자리
+
+
+class CalendarMonth(BaseModel):
+    month: str  # YYYY-MM
+    days: List[CalendarDay]  # 활동이 있는 날만
+
+
+# ==================== 통계 스키마 ====================
+
+class ActivityStatBase(BaseModel):
+    activities: int
+    upcoming_activities: int
+    capacity: int
+    bookings: int
+    capacity_bookings: int
+    fill_rate: Optional[float] = None  # capacity_bookings / capacity
+    volunteers: int
+    staffed_activities: int
+    volunteer_coverage: Optional[float] = None  # staffed_activities / activities
+
+
+class CategoryStat(ActivityStatBase):
+    category: str
+
+
+class RegionStat(ActivityStatBase):
+    region_id: Optional[int] = None  # 장소에서 지역을 찾지 못한 활동은 None
+    name: Optional[str] = None
+    path: Optional[str] = None
+
+
+class SubscriptionPlanStat(BaseModel):
+    plan_type: str
+    active_subscriptions: int
+
+
+# ==================== 일괄 가져오기 스키마 ====================
+
+class ActivityImportRow(ActivityCreate):
+    external_id: Optional[str] = None
+
+
+class UserImportRow(UserCreate):
+    external_id: Optional[str] = None
+
+
+class SubscriptionImportRow(SubscriptionBase):
+    """user_id 대신 같은 파일이나 이전 가져오기의 user_external_id로도 사용자 지정 가능"""
+    user_id: Optional[int] = None
+    user_external_id: Optional[str] = None
+    external_id: Optional[str] = None
+
+
+class ImportRowError(BaseModel):
+    row: int  # 데이터 행 번호 (CSV 헤더 제외, 1부터)
+    external_id: Optional[str] = None
+    message: str
+
+
+class ImportResult(BaseModel):
+    created: int
+    updated: int
+    failed: int
+    errors: List[ImportRowError]
@@ -0,0 +1,159 @@
+"""
+활동 전문 검색 (SQLite FTS5)
+
+한글은 띄어쓰기 단위 검색으로는 "도예공방", "강남구" 같은 합성어의 일부를
+찾을 수 없으므로, 색인과 검색어 모두 한글 단어를 2글자 단위(bigram)로 쪼개
+FTS5 테이블(activities_fts)에 저장합니다. 영문/숫자 단어는 소문자 단어 그대로
+색인하고 접두어로 검색합니다.
+
+색인은 Activity 매퍼 이벤트(insert/update/delete)로 활동 테이블과 함께 갱신되며,
+SQLite가 아닌 DB에서는 FTS 테이블이 없으므로 LIKE 검색으로 대체됩니다.
+"""
+import re
+
+from sqlalchemy import column, event, func, inspect, literal_column, or_, select, table, text
+
+from models import Activity
+
+FTS_TABLE = "activities_fts"
+# 색인 대상 컬럼과 bm25 가중치 (제목 일치를 가장 높게 평가)
+FTS_COLUMNS = ("title", "description", "instructor", "location")
+FTS_WEIGHTS = (10.0, 1.0, 3.0, 2.0)
+
+_WORD = re.compile(r"\w+")
+_CJK = re.compile(r"[ᄀ-ᇿ㄰-㆏가-힣一-鿿]")
+
+_fts_ready = False
+
+
+# ==================== 토큰화 ====================
+
+def _word_tokens(word):
+    if _CJK.search(word):
+        if len(word) == 1:
+            return [word]
+        return [word[i:i + 2] for i in range(len(word) - 1)]
+    return [word.lower()]
+
+
+def tokenize(value):
+    """색인용 토큰 문자열 (공백으로 구분된 bigram/단어)"""
+    if not value:
+        return ""
+    return " ".join(
+        token for word in _WORD.findall(value) for token in _word_tokens(word)
+    )
+
+
+def match_expression(query):
+    """검색어를 FTS5 MATCH 식으로 변환 (모든 토큰을 AND). 토큰이 없으면 None"""
+    terms = []
+    for word in _WORD.findall(query):
+        tokens = _word_tokens(word)
+        if len(tokens) == 1 and (len(word) == 1 or not _CJK.search(word)):
+            # 한 글자 한글이나 영문/숫자는 접두어 검색
+            terms.append(f'"{tokens[0]}"*')
+        else:
+            terms.extend(f'"{token}"' for token in tokens)
+    return " ".join(terms) or None
+
+
+# ==================== 색인 관리 ====================
+
+def is_available(conn):
+    """현재 연결에서 FTS 색인을 사용할 수 있는지 (마이그레이션으로 생성된 경우만)"""
+    global _fts_ready
+    if _fts_ready:
+        return True
+    if conn.dialect.name != "sqlite":
+        return False
+    _fts_ready = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": FTS_TABLE},
+    ).first() is not None
+    return _fts_ready
+
+
+def create_index(conn):
+    columns = ", ".join(FTS_COLUMNS)
+    conn.execute(text(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} "
+        f"USING fts5({columns}, tokenize='unicode61')"
+    ))
+
+
+def _index_params(row):
+    params = {name: tokenize(getattr(row, name)) for name in FTS_COLUMNS}
+    params["rowid"] = row.id
+    return params
+
+
+def index_rows(conn, rows):
+    """활동 행(id와 색인 대상 컬럼을 가진 객체)들을 색인에 추가/교체"""
+    params = [_index_params(row) for row in rows]
+    if not params:
+        return
+    columns = ", ".join(FTS_COLUMNS)
+    values = ", ".join(f":{name}" for name in FTS_COLUMNS)
+    conn.execute(
+        text(f"INSERT OR REPLACE INTO {FTS_TABLE} (rowid, {columns}) VALUES (:rowid, {values})"),
+        params,
+    )
+
+
+def remove_rows(conn, activity_ids):
+    if activity_ids:
+        conn.execute(
+            text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :rowid"),
+            [{"rowid": activity_id} for activity_id in activity_ids],
+        )
+
+
+def rebuild(conn, chunk_size=1000):
+    """활동 테이블 전체로 색인을 다시 생성"""
+    conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+    query = select(Activity.id, *[getattr(Activity, name) for name in FTS_COLUMNS])
+    result = conn.execute(query.execution_options(yield_per=chunk_size))
+    for rows in result.partitions():
+        index_rows(conn, rows)
+
+
+@event.listens_for(Activity, "after_insert")
+def _activity_inserted(mapper, conn, target):
+    if is_available(conn):
+        index_rows(conn, [target])
+
+
+@event.listens_for(Activity, "after_update")
+def _activity_updated(mapper, conn, target):
+    state = inspect(target)
+    changed = any(state.attrs[name].history.has_changes() for name in FTS_COLUMNS)
+    if changed and is_available(conn):
+        index_rows(conn, [target])
+
+
+@event.listens_for(Activity, "after_delete")
+def _activity_deleted(mapper, conn, target):
+    if is_available(conn):
+        remove_rows(conn, [target.id])
+
+
+# ==================== 검색 ====================
+
+def ranked_matches(match):
+    """MATCH 결과의 (activity_id, score) 서브쿼리. score는 bm25라 작을수록 관련도가 높음"""
+    fts = table(FTS_TABLE, column("rowid"))
+    fts_ref = literal_column(FTS_TABLE)
+    return select(
+        fts.c.rowid.label("activity_id"),
+        func.bm25(fts_ref, *FTS_WEIGHTS).label("score"),
+    ).where(fts_ref.op("MATCH")(match)).subquery("search_matches")
+
+
+def like_filter(query):
+    """FTS를 사용할 수 없을 때의 대체 조건 (모든 단어가 어느 컬럼에든 포함)"""
+    conditions = [
+        or_(*[getattr(Activity, name).contains(word) for name in FTS_COLUMNS])
+        for word in query.split()
+    ]
+    return conditions
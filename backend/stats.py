@@ -0,0 +1,385 @@
+"""
+운영 대시보드용 요약 테이블 (카테고리/지역별 활동, 요금제별 구독)
+
+대시보드 요청마다 activity_bookings/volunteers/subscriptions를 GROUP BY하는 대신,
+쓰기 엔드포인트가 같은 트랜잭션에서 요약 행에 변화량을 더합니다
+(INSERT ... ON CONFLICT DO UPDATE SET 값 = 값 + 변화량). 조회는 요약 행 몇 개만 읽습니다.
+
+activity_stats (dimension, key)
+    activities            활동 수
+    upcoming_activities   지나지 않은 활동 수 (카테고리 목록의 활동 수)
+    capacity              정원 합계 (정원 없는 활동 제외)
+    bookings              신청자 수
+    capacity_bookings     정원 있는 활동의 신청자 수 (fill_rate = capacity_bookings / capacity)
+    volunteers            자원봉사자 수
+    staffed_activities    자원봉사자가 1명 이상인 활동 수 (volunteer_coverage = staffed / activities)
+subscription_stats (plan_type)
+    active_subscriptions  is_active 구독 수 (end_date가 지나면 만료 작업이 줄임)
+activity_day_stats (day, category)   월 달력 (activity_date가 있는 활동만)
+    activities, capacity, bookings, capacity_bookings   위와 같은 의미의 일자별 값
+
+변화량이 닿지 않는 경로(DB 직접 수정 등)로 생긴 차이는 rebuild가 원본 테이블에서 다시
+계산해 바로잡으며, 백그라운드 작업이 STATS_REBUILD_SECONDS마다 실행합니다.
+"""
+from collections import defaultdict
+
+from sqlalchemy import Date, case, cast, delete, func, select, text, tuple_, type_coerce
+
+from cache import CATEGORIES_TAG, response_cache
+from models import (
+    Activity, ActivityDayStat, ActivityStat, Region, Subscription, SubscriptionStat,
+)
+
+CATEGORY = "category"
+REGION = "region"
+
+ACTIVITY_METRICS = (
+    "activities", "upcoming_activities", "capacity", "bookings",
+    "capacity_bookings", "volunteers", "staffed_activities",
+)
+SUBSCRIPTION_METRICS = ("active_subscriptions",)
+DAY_METRICS = ("activities", "capacity", "bookings", "capacity_bookings")
+
+# 요약에 영향을 주는 활동 필드 (수정 전후 비교용)
+ACTIVITY_FIELDS = (
+    "category", "region_id", "max_participants", "is_past", "booking_count", "volunteer_count",
+    "activity_date",
+)
+
+
+def region_key(region_id):
+    return "" if region_id is None else str(region_id)
+
+
+def snapshot(activity):
+    return {name: getattr(activity, name) for name in ACTIVITY_FIELDS}
+
+
+def _insert(conn, table):
+    if conn.dialect.name == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    else:
+        from sqlalchemy.dialects.sqlite import insert
+    return insert(table)
+
+
+def _day_key(activity_date, category):
+    return None if activity_date is None else (activity_date.date(), category)
+
+
+def _contribution(activity, sign, deltas, day_deltas):
+    """활동 한 건(snapshot)이 카테고리/지역, 일자 요약에 더하는 값을 deltas, day_deltas에 누적"""
+    capped = activity["max_participants"] is not None
+    booking_count = activity["booking_count"] or 0
+    volunteer_count = activity["volunteer_count"] or 0
+    values = {
+        "activities": 1,
+        "upcoming_activities": 0 if activity["is_past"] else 1,
+        "capacity": activity["max_participants"] if capped else 0,
+        "bookings": booking_count,
+        "capacity_bookings": booking_count if capped else 0,
+        "volunteers": volunteer_count,
+        "staffed_activities": 1 if volunteer_count else 0,
+    }
+    for key in ((CATEGORY, activity["category"]), (REGION, region_key(activity["region_id"]))):
+        for name, value in values.items():
+            deltas[key][name] += sign * value
+    day = _day_key(activity["activity_date"], activity["category"])
+    if day is not None:
+        for name in DAY_METRICS:
+            day_deltas[day][name] += sign * values[name]
+
+
+# ==================== 증감 ====================
+
+# (DB 종류, 테이블) → 증감 UPSERT 문. 행은 실행 파라미터로 넘겨 컴파일 캐시를 탐
+# (.values(행 목록)으로 넣으면 쓰기마다 문장을 새로 만들고 컴파일함)
+_upserts = {}
+
+
+def _upsert(conn, model, key_names, metrics):
+    cache_key = (conn.dialect.name, model.__tablename__)
+    stmt = _upserts.get(cache_key)
+    if stmt is None:
+        table = model.__table__
+        stmt = _insert(conn, table)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=list(key_names),
+            set_={name: table.c[name] + stmt.excluded[name] for name in metrics},
+        )
+        _upserts[cache_key] = stmt
+    return stmt
+
+
+def _add(conn, model, key_names, metrics, deltas):
+    """{키 튜플: {지표: 변화량}}을 요약 행에 더함 (행이 없으면 생성)"""
+    rows = [
+        {**dict(zip(key_names, key)), **{name: values.get(name, 0) for name in metrics}}
+        for key, values in sorted(deltas.items())
+        if any(values.values())
+    ]
+    if not rows:
+        return
+    conn.execute(_upsert(conn, model, key_names, metrics), rows)
+
+
+def add_activity_deltas(conn, deltas, day_deltas=None):
+    _add(conn, ActivityStat, ("dimension", "key"), ACTIVITY_METRICS, deltas)
+    if day_deltas:
+        _add(conn, ActivityDayStat, ("day", "category"), DAY_METRICS, day_deltas)
+
+
+def _new_deltas():
+    return defaultdict(lambda: defaultdict(int)), defaultdict(lambda: defaultdict(int))
+
+
+def add_activities(conn, activities):
+    """새 활동(snapshot 목록)을 요약에 추가"""
+    deltas, day_deltas = _new_deltas()
+    for activity in activities:
+        _contribution(activity, 1, deltas, day_deltas)
+    add_activity_deltas(conn, deltas, day_deltas)
+
+
+def move_activity(conn, before, after):
+    """활동 수정 전후 snapshot의 차이만큼 요약 갱신 (카테고리/지역/일자가 바뀌면 행 사이로 옮김)"""
+    if before == after:
+        return
+    deltas, day_deltas = _new_deltas()
+    _contribution(before, -1, deltas, day_deltas)
+    _contribution(after, 1, deltas, day_deltas)
+    add_activity_deltas(conn, deltas, day_deltas)
+
+
+def add_booking(conn, category, region_id, max_participants, activity_date, delta):
+    """예약(+1)/취소(-1)"""
+    values = {"bookings": delta}
+    if max_participants is not None:
+        values["capacity_bookings"] = delta
+    day = _day_key(activity_date, category)
+    add_activity_deltas(
+        conn,
+        {(CATEGORY, category): values, (REGION, region_key(region_id)): values},
+        {day: values} if day is not None else None,
+    )
+
+
+def add_volunteer(conn, category, region_id, volunteer_count):
+    """자원봉사 신청 (volunteer_count는 신청 후 값, 1이면 새로 자원봉사자가 생긴 활동)"""
+    values = {"volunteers": 1, "staffed_activities": 1 if volunteer_count == 1 else 0}
+    add_activity_deltas(conn, {(CATEGORY, category): values, (REGION, region_key(region_id)): values})
+
+
+def activities_passed(conn, rows):
+    """지난 활동으로 표시된 (category, region_id) 목록만큼 upcoming_activities 감소"""
+    deltas = defaultdict(lambda: defaultdict(int))
+    for category, region_id in rows:
+        deltas[(CATEGORY, category)]["upcoming_activities"] -= 1
+        deltas[(REGION, region_key(region_id))]["upcoming_activities"] -= 1
+    add_activity_deltas(conn, deltas)
+
+
+def add_subscriptions(conn, plan_types, delta=1):
+    """plan_type 목록(같은 값 반복 가능)만큼 활성 구독 수 증감"""
+    deltas = defaultdict(lambda: defaultdict(int))
+    for plan_type in plan_types:
+        deltas[(plan_type,)]["active_subscriptions"] += delta
+    _add(conn, SubscriptionStat, ("plan_type",), SUBSCRIPTION_METRICS, deltas)
+
+
+# ==================== 재계산 ====================
+
+def _lock(conn, model):
+    """재계산 중에는 증감을 막음 (SQLite는 쓰기 트랜잭션이 이미 직렬화됨)"""
+    if conn.dialect.name == "postgresql":
+        conn.execute(text(f"LOCK TABLE {model.__tablename__} IN EXCLUSIVE MODE"))
+
+
+def _sync(conn, model, key_names, metrics, expected):
+    """요약 테이블을 expected와 같게 맞추고 값이 달랐던 키 목록 반환"""
+    table = model.__table__
+    key_columns = [table.c[name] for name in key_names]
+    current = {
+        tuple(row[:len(key_names)]): dict(zip(metrics, row[len(key_names):]))
+        for row in conn.execute(select(*key_columns, *[table.c[name] for name in metrics]))
+    }
+    changed = [key for key, values in expected.items() if current.pop(key, None) != values]
+    if changed:
+        stmt = _insert(conn, table).values([
+            {**dict(zip(key_names, key)), **expected[key]} for key in changed
+        ])
+        conn.execute(stmt.on_conflict_do_update(
+            index_elements=list(key_names),
+            set_={name: stmt.excluded[name] for name in metrics},
+        ))
+    if current:
+        # 원본에 더 이상 없는 키 (모든 활동이 다른 카테고리로 옮겨가 0만 남은 행은 정상)
+        conn.execute(delete(table).where(tuple_(*key_columns).in_(list(current))))
+        changed += [key for key, values in current.items() if any(values.values())]
+    return [":".join(str(part) for part in key) for key in changed]
+
+
+def rebuild_activity_stats(conn):
+    _lock(conn, ActivityStat)
+    columns = [
+        func.count(),
+        func.sum(case((Activity.is_past == False, 1), else_=0)),
+        func.sum(func.coalesce(Activity.max_participants, 0)),
+        func.sum(Activity.booking_count),
+        func.sum(case((Activity.max_participants.isnot(None), Activity.booking_count), else_=0)),
+        func.sum(Activity.volunteer_count),
+        func.sum(case((Activity.volunteer_count > 0, 1), else_=0)),
+    ]
+    expected = {}
+    for dimension, group in ((CATEGORY, Activity.category), (REGION, Activity.region_id)):
+        for group_value, *values in conn.execute(select(group, *columns).group_by(group)):
+            key = group_value if dimension == CATEGORY else region_key(group_value)
+            expected[(dimension, key)] = dict(zip(ACTIVITY_METRICS, (int(v or 0) for v in values)))
+    return _sync(conn, ActivityStat, ("dimension", "key"), ACTIVITY_METRICS, expected)
+
+
+def _day(conn, column):
+    """DATETIME 컬럼의 날짜 (SQLite는 CAST AS DATE가 숫자가 되므로 date() 사용)"""
+    if conn.dialect.name == "sqlite":
+        return type_coerce(func.date(column), Date)
+    return cast(column, Date)
+
+
+def rebuild_day_stats(conn):
+    _lock(conn, ActivityDayStat)
+    day = _day(conn, Activity.activity_date)
+    rows = conn.execute(
+        select(
+            day, Activity.category,
+            func.count(),
+            func.sum(func.coalesce(Activity.max_participants, 0)),
+            func.sum(Activity.booking_count),
+            func.sum(case((Activity.max_participants.isnot(None), Activity.booking_count), else_=0)),
+        )
+        .where(Activity.activity_date.isnot(None))
+        .group_by(day, Activity.category)
+    )
+    expected = {
+        (day_value, category): dict(zip(DAY_METRICS, (int(v or 0) for v in values)))
+        for day_value, category, *values in rows
+    }
+    return _sync(conn, ActivityDayStat, ("day", "category"), DAY_METRICS, expected)
+
+
+def rebuild_subscription_stats(conn):
+    _lock(conn, SubscriptionStat)
+    rows = conn.execute(
+        select(Subscription.plan_type, func.count())
+        .where(Subscription.is_active == True)
+        .group_by(Subscription.plan_type)
+    )
+    expected = {(plan_type,): {"active_subscriptions": count} for plan_type, count in rows}
+    return _sync(conn, SubscriptionStat, ("plan_type",), SUBSCRIPTION_METRICS, expected)
+
+
+def rebuild(conn, now=None):
+    """원본 테이블에서 모든 요약을 다시 계산하고 바로잡은 요약 행 목록 반환 (백그라운드 작업)"""
+    return rebuild_activity_stats(conn) + rebuild_day_stats(conn) + rebuild_subscription_stats(conn)
+
+
+def rebuilt(keys):
+    """커밋 후: 바로잡은 요약이 있으면 카테고리 목록 캐시 무효화"""
+    if keys:
+        response_cache.invalidate(CATEGORIES_TAG)
+
+
+# ==================== 조회 ====================
+
+def _activity_row(row):
+    values = {name: getattr(row, name) for name in ACTIVITY_METRICS}
+    values["fill_rate"] = (
+        round(row.capacity_bookings / row.capacity, 4) if row.capacity else None
+    )
+    values["volunteer_coverage"] = (
+        round(row.staffed_activities / row.activities, 4) if row.activities else None
+    )
+    return values
+
+
+def category_stats(conn):
+    rows = conn.execute(
+        select(ActivityStat)
+        .where(ActivityStat.dimension == CATEGORY, ActivityStat.activities > 0)
+        .order_by(ActivityStat.key)
+    )
+    return [{"category": row.key, **_activity_row(row)} for row in rows]
+
+
+def region_stats(conn):
+    rows = conn.execute(
+        select(ActivityStat)
+        .where(ActivityStat.dimension == REGION, ActivityStat.activities > 0)
+        .order_by(ActivityStat.key)
+    ).all()
+    region_ids = [int(row.key) for row in rows if row.key]
+    regions = {}
+    if region_ids:
+        regions = {
+            region.id: region
+            for region in conn.execute(
+                select(Region.id, Region.name, Region.path).where(Region.id.in_(region_ids))
+            )
+        }
+    result = []
+    for row in rows:
+        region = regions.get(int(row.key)) if row.key else None
+        result.append({
+            "region_id": region.id if region else None,
+            "name": region.name if region else None,
+            "path": region.path if region else None,
+            **_activity_row(row),
+        })
+    result.sort(key=lambda item: item["path"] or "")
+    return result
+
+
+def subscription_stats(conn):
+    rows = conn.execute(select(SubscriptionStat).order_by(SubscriptionStat.plan_type))
+    return [
+        {"plan_type": row.plan_type, "active_subscriptions": row.active_subscriptions}
+        for row in rows
+    ]
+
+
+def calendar(conn, first_day, end_day, category=None):
+    """[first_day, end_day) 기간의 일자별 활동 수, 신청자 수, 정원, 잔여석 (활동이 있는 날만)"""
+    query = (
+        select(
+            ActivityDayStat.day,
+            func.sum(ActivityDayStat.activities).label("activities"),
+            func.sum(ActivityDayStat.bookings).label("bookings"),
+            func.sum(ActivityDayStat.capacity).label("capacity"),
+            func.sum(ActivityDayStat.capacity_bookings).label("capacity_bookings"),
+        )
+        .where(ActivityDayStat.day >= first_day, ActivityDayStat.day < end_day)
+        .group_by(ActivityDayStat.day)
+        .having(func.sum(ActivityDayStat.activities) > 0)
+        .order_by(ActivityDayStat.day)
+    )
+    if category:
+        query = query.where(ActivityDayStat.category == category)
+    return [
+        {
+            "date": row.day,
+            "activities": row.activities,
+            "bookings": row.bookings,
+            "capacity": row.capacity,
+            "remaining_seats": max(row.capacity - row.capacity_bookings, 0),
+        }
+        for row in conn.execute(query)
+    ]
+
+
+def categories(conn):
+    """지나지 않은 활동이 있는 카테고리와 활동 수 (많은 순)"""
+    rows = conn.execute(
+        select(ActivityStat.key, ActivityStat.upcoming_activities)
+        .where(ActivityStat.dimension == CATEGORY, ActivityStat.upcoming_activities > 0)
+        .order_by(ActivityStat.upcoming_activities.desc(), ActivityStat.key)
+    )
+    return [{"name": name, "activity_count": count} for name, count in rows]
@@ -0,0 +1,262 @@
+"""
+쓰기 요청 접수 큐 (단일 쓰기 작업 + 묶음 커밋)
+
+SQLite는 DB 전체에 쓰기 잠금이 하나뿐이라, 예약이 몰리면 요청마다 BEGIN IMMEDIATE로
+잠금을 기다리다 busy_timeout을 넘겨 "database is locked"로 실패합니다.
+WRITE_QUEUE_ENABLED=true면 예약/예약 취소/자원봉사 신청을 이벤트 루프 안의 큐에 넣고,
+쓰기 작업 하나가 쌓인 요청을 한 트랜잭션으로 묶어 적용한 뒤 한 번에 커밋합니다.
+
+    1. 큐에 쌓인 요청을 최대 WRITE_QUEUE_MAX_BATCH개 꺼냄 (앞 묶음을 커밋하는 동안 들어온 요청,
+       WRITE_QUEUE_LINGER_MS를 주면 첫 요청 뒤 그만큼 더 기다림)
+    2. 세션 하나의 run_sync 안에서 요청마다 SAVEPOINT를 잡고 실행
+       → HTTPException(정원 마감, 중복 등)으로 끝난 요청은 자기 변경만 되돌리고 오류를 그대로 돌려줌
+    3. 한 번 커밋한 뒤 커밋 후 작업(캐시 무효화, 실시간 알림)을 실행하고 요청별 결과를 돌려줌
+    4. 그 밖의 오류나 커밋 실패면 묶음 전체를 롤백하고 요청을 하나씩 자기 트랜잭션으로 다시 실행
+
+쓰기 잠금을 잡는 트랜잭션이 하나뿐이라 잠금 대기(busy_timeout 재시도)가 없고, 커밋과 연결
+대여도 묶음마다 한 번입니다. 묶음은 별도 스레드가 아니라 이벤트 루프에서 run_sync로 실행합니다
+(스레드에서 동기 드라이버로 돌리면 GIL을 두고 이벤트 루프와 다퉈 요청 접수가 오히려 느려짐).
+
+과부하 보호
+    - 대기 요청이 WRITE_QUEUE_MAX_PENDING개면 새 요청은 바로 503 (Retry-After)
+    - 큐에서 WRITE_QUEUE_MAX_WAIT_SECONDS 넘게 기다린 요청은 실행하지 않고 503
+      (실행을 시작한 요청은 취소하지 않으므로 503이면 반영되지 않았다는 뜻)
+    - 클라이언트가 끊겨 기다리는 쪽이 취소된 요청은 실행하지 않음
+
+작업 함수는 op(동기 Session, *args) → (결과, 커밋 후 호출할 함수 또는 None) 형태이며, 큐를 끈
+경우에는 같은 함수를 요청 세션에서 run_sync로 바로 실행해 커밋합니다 (execute 참고).
+큐는 프로세스마다 하나라 여러 워커로 실행하면 워커 수만큼의 쓰기 작업이 잠금을 나눠 씁니다.
+"""
+import asyncio
+import logging
+import time
+
+from fastapi import HTTPException
+
+from config import settings
+from database import AsyncSessionLocal
+
+logger = logging.getLogger("write_queue")
+
+OVERLOADED_DETAIL = "요청이 많아 잠시 후 다시 시도해 주세요"
+
+
+def overloaded():
+    return HTTPException(status_code=503, detail=OVERLOADED_DETAIL, headers={"Retry-After": "1"})
+
+
+class _Request:
+    __slots__ = ("op", "args", "future", "enqueued_at")
+
+    def __init__(self, op, args, future):
+        self.op = op
+        self.args = args
+        self.future = future
+        self.enqueued_at = time.monotonic()
+
+
+class WriteQueue:
+    def __init__(self, enabled=False, max_pending=1000, max_batch=64, linger_ms=0,
+                 max_wait_seconds=5, session_factory=AsyncSessionLocal):
+        self.enabled = enabled
+        self.max_pending = max_pending
+        self.max_batch = max_batch
+        self.linger = linger_ms / 1000
+        self.max_wait = max_wait_seconds
+        self._session_factory = session_factory
+        self._queue = None
+        self._task = None
+        self._closing = False
+        self.submitted = 0
+        self.rejected = 0  # 큐가 가득 차서 거절
+        self.expired = 0  # 너무 오래 기다려 실행하지 않음
+        self.batches = 0
+        self.applied = 0  # 커밋된 요청 (오류로 끝난 요청 포함)
+        self.retried_batches = 0  # 커밋 실패로 하나씩 다시 실행한 묶음
+        self.last_batch_size = 0
+
+    async def execute(self, db, op, *args):
+        """
+        쓰기 작업 실행
+
+        큐를 켰으면 큐에 넣고 묶음 커밋을 기다리고, 껐으면 요청 세션 db(AsyncSession)에서
+        바로 실행해 커밋합니다.
+        """
+        if self.enabled:
+            return await self.submit(op, *args)
+        result, after_commit = await db.run_sync(op, *args)
+        await db.commit()
+        if after_commit:
+            after_commit()
+        return result
+
+    @property
+    def pending(self):
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def submit(self, op, *args):
+        """요청을 큐에 넣고 묶음 커밋 후 결과를 반환 (op가 낸 HTTPException 등은 그대로 전달)"""
+        if self._task is None:
+            raise RuntimeError("쓰기 큐가 시작되지 않았습니다")
+        if self._closing or self._queue.qsize() >= self.max_pending:
+            self.rejected += 1
+            raise overloaded()
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_Request(op, args, future))
+        self.submitted += 1
+        return await future
+
+    # ---------- 쓰기 작업 ----------
+
+    async def _collect(self):
+        """요청 하나를 기다린 뒤, 그동안 쌓인 요청까지 최대 max_batch개를 꺼냄 (None이면 종료)"""
+        first = await self._queue.get()
+        if first is None:
+            return None
+        batch = [first]
+        deadline = time.monotonic() + self.linger
+        while len(batch) < self.max_batch:
+            if not self._queue.empty():
+                request = self._queue.get_nowait()
+            else:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    request = await asyncio.wait_for(self._queue.get(), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if request is None:
+                self._queue.put_nowait(None)  # 이번 묶음을 처리한 뒤 종료
+                break
+            batch.append(request)
+        return batch
+
+    def _runnable(self, batch):
+        """취소됐거나 너무 오래 기다린 요청을 빼고 실행할 요청만 반환"""
+        now = time.monotonic()
+        runnable = []
+        for request in batch:
+            if request.future.done():
+                continue
+            if now - request.enqueued_at > self.max_wait:
+                self.expired += 1
+                request.future.set_exception(overloaded())
+                continue
+            runnable.append(request)
+        return runnable
+
+    @staticmethod
+    def _apply(db, batch):
+        """묶음의 요청을 SAVEPOINT마다 실행 (run_sync) → [(요청, 결과, 오류, 커밋 후 함수)]"""
+        outcomes = []
+        for request in batch:
+            try:
+                with db.begin_nested():
+                    result, after_commit = request.op(db, *request.args)
+            except HTTPException as exc:
+                outcomes.append((request, None, exc, None))
+            else:
+                outcomes.append((request, result, None, after_commit))
+        return outcomes
+
+    async def _apply_batch(self, batch):
+        async with self._session_factory() as db:
+            outcomes = await db.run_sync(self._apply, batch)
+            await db.commit()
+        return outcomes
+
+    async def _apply_each(self, batch):
+        """요청마다 따로 커밋 (묶음 커밋이 실패했을 때)"""
+        outcomes = []
+        for request in batch:
+            try:
+                async with self._session_factory() as db:
+                    result, after_commit = await db.run_sync(request.op, *request.args)
+                    await db.commit()
+            except Exception as exc:
+                outcomes.append((request, None, exc, None))
+            else:
+                outcomes.append((request, result, None, after_commit))
+        return outcomes
+
+    async def process(self, batch):
+        batch = self._runnable(batch)
+        if not batch:
+            return
+        try:
+            outcomes = await self._apply_batch(batch)
+        except Exception:
+            self.retried_batches += 1
+            outcomes = await self._apply_each(batch)
+        self.batches += 1
+        self.applied += len(outcomes)
+        self.last_batch_size = len(outcomes)
+        for request, result, error, after_commit in outcomes:
+            if after_commit:
+                try:
+                    after_commit()
+                except Exception:
+                    # 이미 커밋된 요청이므로 결과는 그대로 돌려줌
+                    logger.exception("커밋 후 작업 실패")
+            if request.future.done():
+                continue
+            if error is not None:
+                request.future.set_exception(error)
+            else:
+                request.future.set_result(result)
+
+    async def _run(self):
+        while True:
+            batch = await self._collect()
+            if batch is None:
+                return
+            try:
+                await self.process(batch)
+            except Exception as exc:
+                logger.exception("쓰기 묶음 처리 실패")
+                for request in batch:
+                    if not request.future.done():
+                        request.future.set_exception(exc)
+
+    def start(self):
+        if self._task is None:
+            self._queue = asyncio.Queue()
+            self._closing = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """새 요청을 막고, 이미 들어온 요청을 모두 처리한 뒤 쓰기 작업 종료"""
+        if self._task is None:
+            return
+        self._closing = True
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    def stats(self):
+        return {
+            "enabled": self.enabled,
+            "running": self._task is not None,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "max_batch": self.max_batch,
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "expired": self.expired,
+            "batches": self.batches,
+            "applied": self.applied,
+            "retried_batches": self.retried_batches,
+            "avg_batch_size": round(self.applied / self.batches, 2) if self.batches else None,
+            "last_batch_size": self.last_batch_size,
+        }
+
+
+write_queue = WriteQueue(
+    enabled=settings.write_queue_enabled,
+    max_pending=settings.write_queue_max_pending,
+    max_batch=settings.write_queue_max_batch,
+    linger_ms=settings.write_queue_linger_ms,
+    max_wait_seconds=settings.write_queue_max_wait_seconds,
+)
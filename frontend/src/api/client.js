@@ -9,21 +9,74 @@ const client = axios.create({
   },
 })
 
+// ETag 조건부 요청: 받은 GET 응답을 ETag와 함께 보관해 두었다가
+// 같은 URL을 다시 요청할 때 If-None-Match를 보내고, 304면 보관한 데이터를 사용
+const ETAG_CACHE_SIZE = 200
+const etagCache = new Map()
+
+client.interceptors.request.use((config) => {
+  if ((config.method || 'get') !== 'get') return config
+  const key = client.getUri(config)
+  const cached = etagCache.get(key)
+  if (cached) {
+    config.headers['If-None-Match'] = cached.etag
+    config.validateStatus = (status) => (status >= 200 && status < 300) || status === 304
+  }
+  config.etagKey = key
+  return config
+})
+
+client.interceptors.response.use((response) => {
+  const key = response.config.etagKey
+  if (!key) return response
+  if (response.status === 304) {
+    const cached = etagCache.get(key)
+    // 최근 사용 순서 유지
+    etagCache.delete(key)
+    etagCache.set(key, cached)
+    return { ...response, status: 200, data: cached.data }
+  }
+  const etag = response.headers.etag
+  if (etag) {
+    etagCache.delete(key)
+    etagCache.set(key, { etag, data: response.data })
+    if (etagCache.size > ETAG_CACHE_SIZE) {
+      etagCache.delete(etagCache.keys().next().value)
+    }
+  }
+  return response
+})
+
 export const api = {
   // Activities
   getActivities: (params) => client.get('/activities', { params }),
   getActivity: (id) => client.get(`/activities/${id}`),
+  getActivityDetail: (id, params) => client.get(`/activities/${id}/detail`, { params }),
   createActivity: (data) => client.post('/activities', data),
   
   // Bookings
   createBooking: (data) => client.post('/bookings', data),
-  getUserBookings: (userId) => client.get(`/users/${userId}/bookings`),
-  getActivityBookings: (activityId) => client.get(`/activities/${activityId}/bookings`),
+  getUserBookings: (userId, params) => client.get(`/users/${userId}/bookings`, { params }),
+  getActivityBookings: (activityId, params) =>
+    client.get(`/activities/${activityId}/bookings`, { params }),
   cancelBooking: (bookingId) => client.delete(`/bookings/${bookingId}`),
   
   // Volunteers
   createVolunteer: (data) => client.post('/volunteers', data),
-  getActivityVolunteers: (activityId) => client.get(`/activities/${activityId}/volunteers`),
+  getActivityVolunteers: (activityId, params) =>
+    client.get(`/activities/${activityId}/volunteers`, { params }),
+  
+  // Live: 신청자 수 변경 구독 (Server-Sent Events). 연결을 닫는 함수를 반환
+  subscribeBookingCounts: (params, onChange) => {
+    const source = new EventSource(client.getUri({ url: '/live/booking-counts', params }))
+    const handle = (event) => onChange(JSON.parse(event.data))
+    source.addEventListener('snapshot', handle)
+    source.addEventListener('booking_counts', handle)
+    return () => source.close()
+  },
+  
+  // Exports (링크로 내려받는 CSV/NDJSON 명단 URL)
+  exportUrl: (resource, params) => client.getUri({ url: `/exports/${resource}`, params }),
   
   // Users
   createUser: (data) => client.post('/users', data),
@@ -33,9 +86,20 @@ export const api = {
   createSubscription: (data) => client.post('/subscriptions', data),
   getUserSubscription: (userId) => client.get(`/users/${userId}/subscription`),
   
+  // Regions
+  getRegions: (parentId) =>
+    client.get('/regions', { params: parentId ? { parent_id: parentId } : {} }),
+
   // Categories
   getCategories: () => client.get('/categories'),
 }
 
 export default client
 
+// 실시간으로 받은 신청자 수를 활동 목록에 반영
+export const applyBookingCounts = (activities, changes) => {
+  const counts = new Map(changes.map((change) => [change.activity_id, change.booking_count]))
+  return activities.map((activity) =>
+    counts.has(activity.id) ? { ...activity, booking_count: counts.get(activity.id) } : activity
+  )
+}
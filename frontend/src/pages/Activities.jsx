@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react'
 import { Link } from 'react-router-dom'
-import { api } from '../api/client'
+import { api, applyBookingCounts } from '../api/client'
 import './Activities.css'
 
 function Activities() {
@@ -8,12 +8,40 @@ function Activities() {
   const [categories, setCategories] = useState([])
   const [selectedCategory, setSelectedCategory] = useState('')
   const [locationFilter, setLocationFilter] = useState('')
+  const [sidoList, setSidoList] = useState([])
+  const [sigunguList, setSigunguList] = useState([])
+  const [selectedSido, setSelectedSido] = useState('')
+  const [selectedSigungu, setSelectedSigungu] = useState('')
+  const [nearMe, setNearMe] = useState(true)
+  const [sort, setSort] = useState('created_at')
+  const [nextCursor, setNextCursor] = useState(null)
   const [loading, setLoading] = useState(true)
+  const [loadingMore, setLoadingMore] = useState(false)
+
+  const userId = 1 // 임시 사용자 ID
 
   useEffect(() => {
-    fetchActivities()
     fetchCategories()
-  }, [selectedCategory, locationFilter])
+    fetchSidoList()
+  }, [])
+
+  useEffect(() => {
+    fetchActivities()
+  }, [selectedCategory, locationFilter, selectedSido, selectedSigungu, nearMe, sort])
+
+  // 목록과 같은 필터로 신청자 수 변경을 구독 (다시 불러오지 않고 숫자만 갱신)
+  useEffect(() => {
+    const { category, region, near_user_id } = buildParams()
+    return api.subscribeBookingCounts({ category, region, near_user_id }, (changes) =>
+      setActivities((prev) => applyBookingCounts(prev, changes))
+    )
+  }, [selectedCategory, selectedSido, selectedSigungu, nearMe])
+
+  useEffect(() => {
+    setSelectedSigungu('')
+    setSigunguList([])
+    if (selectedSido) fetchSigunguList(selectedSido)
+  }, [selectedSido])
 
   const fetchCategories = async () => {
     try {
@@ -24,31 +52,44 @@ function Activities() {
     }
   }
 
+  const fetchSidoList = async () => {
+    try {
+      const res = await api.getRegions()
+      setSidoList(res.data)
+    } catch (error) {
+      console.error('지역 로딩 실패:', error)
+    }
+  }
+
+  const fetchSigunguList = async (sidoPath) => {
+    const sido = sidoList.find((region) => region.path === sidoPath)
+    if (!sido) return
+    try {
+      const res = await api.getRegions(sido.id)
+      setSigunguList(res.data)
+    } catch (error) {
+      console.error('지역 로딩 실패:', error)
+    }
+  }
+
+  const buildParams = () => {
+    const params = { sort, fields: 'summary' } // 카드에 필요한 필드만
+    if (selectedCategory) params.category = selectedCategory
+    if (locationFilter) params.location = locationFilter
+    // 지역을 고르지 않았으면 내 주소의 시/군/구를 기본 필터로 사용
+    const region = selectedSigungu || selectedSido
+    if (region) params.region = region
+    else if (nearMe) params.near_user_id = userId
+    return params
+  }
+
   const fetchActivities = async () => {
     setLoading(true)
     try {
-      const params = {}
-      if (selectedCategory) params.category = selectedCategory
-      if (locationFilter) params.location = locationFilter
-
-      const res = await api.getActivities(params)
-      
-      // 각 활동의 예약 수를 가져오기
-      const activitiesWithCounts = await Promise.all(
-        res.data.map(async (activity) => {
-          try {
-            const bookingsRes = await api.getActivityBookings(activity.id)
-            return {
-              ...activity,
-              booking_count: bookingsRes.data.length
-            }
-          } catch {
-            return { ...activity, booking_count: 0 }
-          }
-        })
-      )
-      
-      setActivities(activitiesWithCounts)
+      // booking_count는 목록 응답에 포함되어 있음
+      const res = await api.getActivities(buildParams())
+      setActivities(res.data.items)
+      setNextCursor(res.data.next_cursor)
       setLoading(false)
     } catch (error) {
       console.error('활동 로딩 실패:', error)
@@ -56,6 +97,19 @@ function Activities() {
     }
   }
 
+  const fetchMoreActivities = async () => {
+    if (!nextCursor) return
+    setLoadingMore(true)
+    try {
+      const res = await api.getActivities({ ...buildParams(), cursor: nextCursor })
+      setActivities((prev) => [...prev, ...res.data.items])
+      setNextCursor(res.data.next_cursor)
+    } catch (error) {
+      console.error('활동 로딩 실패:', error)
+    }
+    setLoadingMore(false)
+  }
+
   return (
     <div className="activities-page">
       <h1>체험 활동</h1>
@@ -70,24 +124,86 @@ function Activities() {
           >
             <option value="">전체</option>
             {categories.map((category) => (
-              <option key={category} value={category}>
-                {category}
+              <option key={category.name} value={category.name}>
+                {category.name} ({category.activity_count})
               </option>
             ))}
           </select>
         </div>
 
         <div className="filter-group">
-          <label>지역</label>
+          <label>시/도</label>
+          <select
+            value={selectedSido}
+            onChange={(e) => setSelectedSido(e.target.value)}
+            className="filter-select"
+          >
+            <option value="">전체</option>
+            {sidoList.map((region) => (
+              <option key={region.id} value={region.path}>
+                {region.name}
+              </option>
+            ))}
+          </select>
+        </div>
+
+        {selectedSido && (
+          <div className="filter-group">
+            <label>시/군/구</label>
+            <select
+              value={selectedSigungu}
+              onChange={(e) => setSelectedSigungu(e.target.value)}
+              className="filter-select"
+            >
+              <option value="">전체</option>
+              {sigunguList.map((region) => (
+                <option key={region.id} value={region.path}>
+                  {region.name}
+                </option>
+              ))}
+            </select>
+          </div>
+        )}
+
+        {!selectedSido && (
+          <div className="filter-group filter-checkbox">
+            <label>
+              <input
+                type="checkbox"
+                checked={nearMe}
+                onChange={(e) => setNearMe(e.target.checked)}
+              />
+              내 주변만 보기
+            </label>
+          </div>
+        )}
+
+        <div className="filter-group">
+          <label>장소</label>
           <input
             type="text"
-            placeholder="지역명 입력"
+            placeholder="장소명 입력"
             value={locationFilter}
             onChange={(e) => setLocationFilter(e.target.value)}
             className="filter-input"
           />
         </div>
 
+        <div className="filter-group">
+          <label>정렬</label>
+          <select
+            value={sort}
+            onChange={(e) => setSort(e.target.value)}
+            className="filter-select"
+          >
+            <option value="created_at">등록순</option>
+            <option value="-created_at">최신 등록순</option>
+            <option value="activity_date">활동 일시순</option>
+            <option value="price">낮은 가격순</option>
+            <option value="-price">높은 가격순</option>
+          </select>
+        </div>
+
         <button onClick={fetchActivities} className="filter-button">
           검색
         </button>
@@ -120,7 +236,7 @@ function Activities() {
                 <span className="activity-category">{activity.category}</span>
                 <h3>{activity.title}</h3>
                 <p className="activity-description">
-                  {activity.description?.substring(0, 100)}...
+                  {activity.description_preview}...
                 </p>
                 <p className="activity-location">📍 {activity.location}</p>
                 {activity.instructor && (
@@ -140,6 +256,18 @@ function Activities() {
           ))}
         </div>
       )}
+
+      {!loading && nextCursor && (
+        <div className="load-more">
+          <button
+            onClick={fetchMoreActivities}
+            disabled={loadingMore}
+            className="filter-button"
+          >
+            {loadingMore ? '불러오는 중...' : '더 보기'}
+          </button>
+        </div>
+      )}
     </div>
   )
 }
@@ -9,6 +9,8 @@ function ActivityDetail() {
   const [activity, setActivity] = useState(null)
   const [bookings, setBookings] = useState([])
   const [volunteers, setVolunteers] = useState([])
+  const [bookingsCursor, setBookingsCursor] = useState(null)
+  const [volunteersCursor, setVolunteersCursor] = useState(null)
   const [loading, setLoading] = useState(true)
   const [showBookingForm, setShowBookingForm] = useState(false)
   const [showVolunteerForm, setShowVolunteerForm] = useState(false)
@@ -32,18 +34,26 @@ function ActivityDetail() {
     fetchActivityDetails()
   }, [id])
 
+  // 신청자 수는 다시 불러오지 않고 실시간으로 갱신
+  useEffect(() => {
+    return api.subscribeBookingCounts({ activity_ids: id }, (changes) => {
+      const change = changes.find((item) => item.activity_id === parseInt(id))
+      if (change) {
+        setActivity((prev) => prev && { ...prev, booking_count: change.booking_count })
+      }
+    })
+  }, [id])
+
   const fetchActivityDetails = async () => {
     setLoading(true)
     try {
-      const [activityRes, bookingsRes, volunteersRes] = await Promise.all([
-        api.getActivity(id),
-        api.getActivityBookings(id),
-        api.getActivityVolunteers(id)
-      ])
-      
-      setActivity(activityRes.data)
-      setBookings(bookingsRes.data)
-      setVolunteers(volunteersRes.data)
+      // 활동, 예약, 자원봉사자 첫 페이지를 한 번의 요청으로 조회
+      const res = await api.getActivityDetail(id)
+      setActivity(res.data.activity)
+      setBookings(res.data.bookings.items)
+      setBookingsCursor(res.data.bookings.next_cursor)
+      setVolunteers(res.data.volunteers.items)
+      setVolunteersCursor(res.data.volunteers.next_cursor)
       setLoading(false)
     } catch (error) {
       console.error('상세 정보 로딩 실패:', error)
@@ -51,6 +61,26 @@ function ActivityDetail() {
     }
   }
 
+  const loadMoreBookings = async () => {
+    try {
+      const res = await api.getActivityBookings(id, { cursor: bookingsCursor })
+      setBookings([...bookings, ...res.data.items])
+      setBookingsCursor(res.data.next_cursor)
+    } catch (error) {
+      console.error('예약 목록 로딩 실패:', error)
+    }
+  }
+
+  const loadMoreVolunteers = async () => {
+    try {
+      const res = await api.getActivityVolunteers(id, { cursor: volunteersCursor })
+      setVolunteers([...volunteers, ...res.data.items])
+      setVolunteersCursor(res.data.next_cursor)
+    } catch (error) {
+      console.error('자원봉사자 목록 로딩 실패:', error)
+    }
+  }
+
   const handleBookingSubmit = async (e) => {
     e.preventDefault()
     try {
@@ -124,7 +154,7 @@ function ActivityDetail() {
           <div className="activity-stats">
             <div className="stat">
               <span className="stat-label">신청자</span>
-              <span className="stat-value">{bookings.length}명</span>
+              <span className="stat-value">{activity.booking_count}명</span>
             </div>
             {activity.max_participants && (
               <div className="stat">
@@ -171,7 +201,12 @@ function ActivityDetail() {
         )}
 
         <div className="activity-bookings-section">
-          <h2>신청자 목록 ({bookings.length}명)</h2>
+          <div className="section-header">
+            <h2>신청자 목록 ({activity.booking_count}명)</h2>
+            <a href={api.exportUrl('bookings', { activity_id: id })} className="export-link">
+              CSV 내려받기
+            </a>
+          </div>
           {bookings.length === 0 ? (
             <p>아직 신청자가 없습니다.</p>
           ) : (
@@ -184,10 +219,20 @@ function ActivityDetail() {
               ))}
             </div>
           )}
+          {bookingsCursor && (
+            <button onClick={loadMoreBookings} className="load-more-button">
+              더 보기
+            </button>
+          )}
         </div>
 
         <div className="activity-volunteers-section">
-          <h2>자원봉사자 ({volunteers.length}명)</h2>
+          <div className="section-header">
+            <h2>자원봉사자 ({activity.volunteer_count}명)</h2>
+            <a href={api.exportUrl('volunteers', { activity_id: id })} className="export-link">
+              CSV 내려받기
+            </a>
+          </div>
           {volunteers.length === 0 ? (
             <p>아직 자원봉사자가 없습니다.</p>
           ) : (
@@ -206,6 +251,11 @@ function ActivityDetail() {
               ))}
             </div>
           )}
+          {volunteersCursor && (
+            <button onClick={loadMoreVolunteers} className="load-more-button">
+              더 보기
+            </button>
+          )}
         </div>
       </div>
 
@@ -1,6 +1,6 @@
 import React, { useEffect, useState } from 'react'
 import { Link } from 'react-router-dom'
-import { api } from '../api/client'
+import { api, applyBookingCounts } from '../api/client'
 import './Home.css'
 
 function Home() {
@@ -12,13 +12,22 @@ function Home() {
     fetchData()
   }, [])
 
+  // 보이는 활동의 신청자 수를 실시간으로 갱신
+  const activityIds = activities.map((activity) => activity.id).join(',')
+  useEffect(() => {
+    if (!activityIds) return
+    return api.subscribeBookingCounts({ activity_ids: activityIds }, (changes) =>
+      setActivities((prev) => applyBookingCounts(prev, changes))
+    )
+  }, [activityIds])
+
   const fetchData = async () => {
     try {
       const [activitiesRes, categoriesRes] = await Promise.all([
-        api.getActivities(),
+        api.getActivities({ limit: 6, sort: 'recent', fields: 'summary' }), // 최근 6개, 카드 필드만
         api.getCategories()
       ])
-      setActivities(activitiesRes.data.slice(0, 6)) // 최근 6개만
+      setActivities(activitiesRes.data.items)
       setCategories(categoriesRes.data.categories)
       setLoading(false)
     } catch (error) {
@@ -39,8 +48,9 @@ function Home() {
         <h2>활동 카테고리</h2>
         <div className="category-grid">
           {categories.map((category) => (
-            <div key={category} className="category-card">
-              {category}
+            <div key={category.name} className="category-card">
+              {category.name}
+              <span className="category-count">{category.activity_count}개</span>
             </div>
           ))}
         </div>
@@ -5,7 +5,7 @@ import './MyBookings.css'
 
 function MyBookings() {
   const [bookings, setBookings] = useState([])
-  const [activities, setActivities] = useState({})
+  const [nextCursor, setNextCursor] = useState(null)
   const [loading, setLoading] = useState(true)
   const userId = 1 // 임시 사용자 ID
 
@@ -13,25 +13,16 @@ function MyBookings() {
     fetchBookings()
   }, [])
 
+  // 예약 목록 한 페이지를 활동 정보와 함께 한 번의 요청으로 가져옴
+  const fetchBookingPage = (cursor) =>
+    api.getUserBookings(userId, cursor ? { expand: 'activity', cursor } : { expand: 'activity' })
+
   const fetchBookings = async () => {
     setLoading(true)
     try {
-      const res = await api.getUserBookings(userId)
-      setBookings(res.data)
-      
-      // 각 예약의 활동 정보 가져오기
-      const activityPromises = res.data.map((booking) =>
-        api.getActivity(booking.activity_id).catch(() => null)
-      )
-      const activityRes = await Promise.all(activityPromises)
-      
-      const activitiesMap = {}
-      activityRes.forEach((activityRes, index) => {
-        if (activityRes) {
-          activitiesMap[res.data[index].activity_id] = activityRes.data
-        }
-      })
-      setActivities(activitiesMap)
+      const res = await fetchBookingPage(null)
+      setBookings(res.data.items)
+      setNextCursor(res.data.next_cursor)
       setLoading(false)
     } catch (error) {
       console.error('예약 목록 로딩 실패:', error)
@@ -39,6 +30,16 @@ function MyBookings() {
     }
   }
 
+  const fetchMoreBookings = async () => {
+    try {
+      const res = await fetchBookingPage(nextCursor)
+      setBookings((prev) => [...prev, ...res.data.items])
+      setNextCursor(res.data.next_cursor)
+    } catch (error) {
+      console.error('예약 목록 로딩 실패:', error)
+    }
+  }
+
   const handleCancelBooking = async (bookingId) => {
     if (!window.confirm('정말 예약을 취소하시겠습니까?')) {
       return
@@ -71,7 +72,7 @@ function MyBookings() {
       ) : (
         <div className="bookings-list">
           {bookings.map((booking) => {
-            const activity = activities[booking.activity_id]
+            const activity = booking.activity
             return (
               <div key={booking.id} className="booking-card">
                 {activity ? (
@@ -114,6 +115,11 @@ function MyBookings() {
               </div>
             )
           })}
+          {nextCursor && (
+            <button onClick={fetchMoreBookings} className="load-more-button">
+              더 보기
+            </button>
+          )}
         </div>
       )}
     </div>